@@ -0,0 +1,382 @@
+/*
+ * Clientside Callbacks
+ *
+ * Browser-side callbacks of the Load Path Visual Tool (registered in load-visual.py
+ * with ClientsideFunction('loadpath', ...)). They run without a server round trip,
+ * so interactions that fire often do not send the graph to the server.
+ *
+ * Author: Pramod Kumar Yadav
+ * Email: pkyadav01234@gmail.com
+ * Date: October, 2026
+ */
+
+window.dash_clientside = window.dash_clientside || {};
+
+window.dash_clientside.loadpath = {
+    /**
+     * Tracks node positions and reports the nodes that were moved.
+     *
+     * The Cytoscape component updates its elements once a drag ends (bursts of
+     * drags are debounced into one update), and whenever the server patches them.
+     * The positions seen last are kept in node-positions; only nodes whose
+     * coordinates differ from them are reported. New and deleted nodes are not
+     * moves, and after a rebuild (graph-reset) the positions come from the graph
+     * data, so the baseline is replaced without reporting anything.
+     *
+     * @param {Array} elements Current Cytoscape elements
+     * @param {number} reset Graph reset counter
+     * @param {Object} stored {reset, positions} seen last (positions by node ID)
+     * @returns {Array} [new node-positions value, {node ID: {x, y}} of moved nodes]
+     */
+    storeNodePositions: function (elements, reset, stored) {
+        var noUpdate = window.dash_clientside.no_update;
+        var previous = (stored && stored.reset === reset) ? stored.positions : null;
+        var positions = {};
+        var changes = {};
+        var moved = false;
+        var changed = previous === null;
+
+        (elements || []).forEach(function (element) {
+            var position = element.position;
+            if (!position || !element.data || element.data.source !== undefined) {
+                return;  // edges have no position
+            }
+            var id = element.data.id;
+            positions[id] = {x: position.x, y: position.y};
+            var last = previous !== null ? previous[id] : undefined;
+            if (last === undefined) {
+                changed = true;
+            } else if (last.x !== position.x || last.y !== position.y) {
+                changes[id] = positions[id];
+                changed = moved = true;
+            }
+        });
+        if (!changed && Object.keys(positions).length !== Object.keys(previous).length) {
+            changed = true;  // nodes were deleted
+        }
+        return [
+            changed ? {reset: reset, positions: positions} : noUpdate,
+            moved ? changes : noUpdate
+        ];
+    },
+
+    /**
+     * Rebuilds the node dropdown options (see node_option in load-visual.py).
+     *
+     * @param {number} reset Graph reset counter
+     * @param {Object} graph Current graph data
+     * @returns {Array} One option per node
+     */
+    nodeOptions: function (reset, graph) {
+        return graph.nodes.map(function (node) {
+            return {label: node.data.name, value: node.data.id};
+        });
+    },
+
+    /**
+     * Rebuilds the connection table (see connection_row in load-visual.py).
+     *
+     * @param {number} reset Graph reset counter
+     * @param {Object} graph Current graph data
+     * @returns {Array} One table row per edge
+     */
+    connectionRows: function (reset, graph) {
+        return graph.edges.map(function (edge) {
+            var data = edge.data;
+            return {id: data.id, source: data.source, target: data.target};
+        });
+    },
+
+    /**
+     * Rebuilds the node properties table (see node_table_row in load-visual.py).
+     *
+     * @param {number} reset Graph reset counter
+     * @param {Object} graph Current graph data
+     * @returns {Array} One table row per node
+     */
+    nodeTableRows: function (reset, graph) {
+        return graph.nodes.map(function (node) {
+            var data = node.data;
+            return {
+                name: data.name,
+                mass: data.mass,
+                cog_x: data.cog[0],
+                cog_y: data.cog[1],
+                cog_z: data.cog[2],
+                force_x: data.external_force[0],
+                force_y: data.external_force[1],
+                force_z: data.external_force[2],
+                moment_x: data.moment[0],
+                moment_y: data.moment[1],
+                moment_z: data.moment[2],
+                euler_x: data.euler_angles[0],
+                euler_y: data.euler_angles[1],
+                euler_z: data.euler_angles[2],
+                rotation_order: data.rotation_order,
+                trans_x: data.translation[0],
+                trans_y: data.translation[1],
+                trans_z: data.translation[2]
+            };
+        });
+    },
+
+    /**
+     * Fills the node property inputs with the selected node's properties.
+     *
+     * @param {string} selectedId ID of the selected node
+     * @param {Object} graph Current graph data
+     * @returns {Array} The 18 input values (all null if no node is selected)
+     */
+    nodeInputFields: function (selectedId, graph) {
+        var node = selectedId ? graph.nodes.find(function (node) {
+            return node.data.id === selectedId;
+        }) : undefined;
+        if (node === undefined) {
+            return new Array(18).fill(null);
+        }
+        var data = node.data;
+        return [data.name, data.mass].concat(
+            data.translation, data.euler_angles, [data.rotation_order],
+            data.cog, data.external_force, data.moment
+        );
+    },
+
+    /**
+     * Level-of-detail view of a large graph (see loadpath/graph_view.py).
+     *
+     * Returns the visible nodes and the edges between them when at most
+     * options.detail_nodes nodes are inside the viewport; otherwise the visible
+     * nodes are clustered on a grid and edges are merged per pair of cells.
+     *
+     * @param {Object} graph Graph data
+     * @param {Object} extent Viewport {x1, y1, x2, y2} (null: all nodes)
+     * @param {Object} options {detail_nodes, grid, margin}
+     * @returns {Array} Cytoscape elements (nodes followed by edges)
+     */
+    levelOfDetail: function (graph, extent, options) {
+        var prefix = 'cluster:';
+        var placed = graph.nodes.filter(function (node) {
+            return node.position && typeof node.position.x === 'number' &&
+                typeof node.position.y === 'number';
+        });
+        if (!extent) {
+            if (placed.length === 0) {
+                return [];
+            }
+            extent = {x1: Infinity, y1: Infinity, x2: -Infinity, y2: -Infinity};
+            placed.forEach(function (node) {
+                extent.x1 = Math.min(extent.x1, node.position.x);
+                extent.y1 = Math.min(extent.y1, node.position.y);
+                extent.x2 = Math.max(extent.x2, node.position.x);
+                extent.y2 = Math.max(extent.y2, node.position.y);
+            });
+        }
+        var padX = (extent.x2 - extent.x1) * options.margin;
+        var padY = (extent.y2 - extent.y1) * options.margin;
+        var x1 = extent.x1 - padX, x2 = extent.x2 + padX;
+        var y1 = extent.y1 - padY, y2 = extent.y2 + padY;
+        var visible = placed.filter(function (node) {
+            var p = node.position;
+            return p.x >= x1 && p.x <= x2 && p.y >= y1 && p.y <= y2;
+        });
+        var elements = [];
+
+        if (visible.length <= options.detail_nodes) {
+            // Detail level - the visible nodes themselves
+            var ids = {};
+            visible.forEach(function (node) {
+                ids[node.data.id] = true;
+                elements.push(Object.assign({}, node, {classes: 'lod'}));
+            });
+            graph.edges.forEach(function (edge) {
+                if (ids[edge.data.source] && ids[edge.data.target]) {
+                    elements.push({data: edge.data, classes: 'lod'});
+                }
+            });
+            return elements;
+        }
+
+        // Overview level - one cluster per occupied grid cell
+        var cell = Math.max(x2 - x1, y2 - y1) / options.grid || 1;
+        var cells = {};
+        var order = [];
+        visible.forEach(function (node) {
+            var key = Math.floor((node.position.x - x1) / cell) + ':' +
+                Math.floor((node.position.y - y1) / cell);
+            if (!cells[key]) {
+                cells[key] = [];
+                order.push(key);
+            }
+            cells[key].push(node);
+        });
+        var representative = {};
+        var singles = [];
+        order.forEach(function (key) {
+            var members = cells[key];
+            if (members.length === 1) {
+                representative[members[0].data.id] = members[0].data.id;
+                singles.push(Object.assign({}, members[0], {classes: 'lod overview'}));
+                return;
+            }
+            var id = prefix + key, x = 0, y = 0;
+            members.forEach(function (node) {
+                representative[node.data.id] = id;
+                x += node.position.x;
+                y += node.position.y;
+            });
+            elements.push({
+                data: {id: id, name: String(members.length), count: members.length},
+                position: {x: x / members.length, y: y / members.length},
+                classes: 'lod overview cluster',
+                grabbable: false
+            });
+        });
+        elements = elements.concat(singles);
+
+        // Merge the edges between the same pair of drawn elements
+        var pairs = {};
+        var pairOrder = [];
+        graph.edges.forEach(function (edge) {
+            var source = representative[edge.data.source];
+            var target = representative[edge.data.target];
+            if (source === undefined || target === undefined || source === target) {
+                return;
+            }
+            var pair = source + '|' + target;
+            if (!pairs[pair]) {
+                pairs[pair] = {data: edge.data, source: source, target: target, count: 0};
+                pairOrder.push(pair);
+            }
+            pairs[pair].count += 1;
+        });
+        pairOrder.forEach(function (pair) {
+            var merged = pairs[pair];
+            var data = merged.data;
+            if (merged.count > 1 || merged.source.indexOf(prefix) === 0 ||
+                    merged.target.indexOf(prefix) === 0) {
+                data = {id: prefix + pair, source: merged.source, target: merged.target,
+                        count: merged.count};
+            }
+            elements.push({data: data, classes: 'lod overview'});
+        });
+        return elements;
+    },
+
+    /**
+     * Part of a graph not hidden in a collapsed sub-assembly
+     * (see visible_graph in loadpath/graph_hierarchy.py).
+     *
+     * @param {Object} graph Graph data
+     * @returns {Object} graph itself if nothing is hidden, otherwise graph data with
+     *     the visible nodes and the edges between them
+     */
+    visibleGraph: function (graph) {
+        var collapsed = graph.nodes.filter(function (node) {
+            return node.data.collapsed;
+        });
+        if (collapsed.length === 0) {
+            return graph;
+        }
+        var predecessors = {};
+        graph.edges.forEach(function (edge) {
+            var target = edge.data.target;
+            (predecessors[target] = predecessors[target] || []).push(edge.data.source);
+        });
+        var hidden = {};
+        var count = 0;
+        collapsed.forEach(function (node) {
+            var id = node.data.id;
+            var stack = [id];
+            while (stack.length > 0) {
+                (predecessors[stack.pop()] || []).forEach(function (source) {
+                    if (source !== id && !hidden[source]) {
+                        hidden[source] = true;
+                        count += 1;
+                        stack.push(source);
+                    }
+                });
+            }
+        });
+        if (count === 0) {
+            return graph;
+        }
+        return {
+            nodes: graph.nodes.filter(function (node) {
+                return !hidden[node.data.id];
+            }),
+            edges: graph.edges.filter(function (edge) {
+                return !hidden[edge.data.source] && !hidden[edge.data.target];
+            })
+        };
+    },
+
+    /**
+     * Draws graph data kept in the browser, switching to the level-of-detail view
+     * above options.threshold elements (see level_of_detail in load-visual.py).
+     * Nodes hidden in collapsed sub-assemblies are neither drawn nor counted.
+     *
+     * @param {Object} graph Current graph data
+     * @param {Object} extent Viewport reported by Cytoscape
+     * @param {Object} options Large graph options
+     * @param {boolean} large Whether the level-of-detail view is shown
+     * @returns {Array} [Cytoscape elements, large graph flag]
+     */
+    drawLargeGraph: function (graph, extent, options, large) {
+        var noUpdate = window.dash_clientside.no_update;
+        graph = window.dash_clientside.loadpath.visibleGraph(graph);
+        if (graph.nodes.length + graph.edges.length > options.threshold) {
+            return [window.dash_clientside.loadpath.levelOfDetail(graph, extent, options), true];
+        }
+        if (!large) {
+            return [noUpdate, noUpdate];  // small graphs are patched directly
+        }
+        // Back below the threshold: draw every element again
+        return [graph.nodes.concat(graph.edges.map(function (edge) {
+            return {data: edge.data};
+        })), false];
+    },
+
+    /**
+     * Requests the summary of a collapsed sub-assembly when its node is selected.
+     *
+     * @param {Object} nodeData Data of the selected node
+     * @param {string} current ID of the sub-assembly shown
+     * @returns {string} Node ID, null to clear the summary, or no update
+     */
+    subassemblyRequest: function (nodeData, current) {
+        if (nodeData && nodeData.collapsed) {
+            return nodeData.id;
+        }
+        return current ? null : window.dash_clientside.no_update;
+    },
+
+    /**
+     * Passes viewport changes on to the server while a large graph is shown.
+     *
+     * @param {Object} extent Viewport reported by Cytoscape
+     * @param {boolean} large Whether the level-of-detail view is shown
+     * @returns {Object} Viewport, or no update
+     */
+    largeGraphViewport: function (extent, large) {
+        return large ? extent : window.dash_clientside.no_update;
+    },
+
+    /**
+     * Writes moved node positions into the graph data kept in the browser.
+     *
+     * @param {Object} changes {node ID: {x, y}} of moved nodes
+     * @param {Object} graph Current graph data
+     * @returns {Object} Graph data with the new positions
+     */
+    applyNodePositions: function (changes, graph) {
+        if (!changes || !graph) {
+            return window.dash_clientside.no_update;
+        }
+        return Object.assign({}, graph, {
+            nodes: graph.nodes.map(function (node) {
+                var position = changes[node.data.id];
+                return position ? Object.assign({}, node, {position: position}) : node;
+            })
+        });
+    }
+};
@@ -0,0 +1,3 @@
+"""
+Benchmark suite of the Load Path Visual Tool (see bench.py).
+"""
@@ -0,0 +1,506 @@
+"""
+Load Path Benchmark Suite
+
+Times the graph analysis, JSON import/export and the Dash callbacks (called
+directly as functions) on synthetic models (see generators), records wall time,
+peak memory and retained memory blocks to a JSON results file and compares them with a
+stored baseline.
+
+For every benchmark, model topology and size:
+- wall time: minimum and median over repeated runs (at least ``--repeat`` runs,
+  more for fast benchmarks until ``--min-time`` seconds are spent)
+- peak memory: peak traced memory of one extra run under tracemalloc
+- retained_blocks: net number of memory blocks still alive after that run returns
+  (including its result). This is not the number of allocations made: memory
+  allocated and freed during the run is not counted
+
+The ``callback.`` benchmarks keep the graph in the browser (the default): every
+callback receives the whole graph data. The ``store.`` benchmarks run the same
+callbacks with the server-side store (LOAD_PATH_STORE=server): they receive a
+session handle, and every call goes through the GraphStore with its columnar
+graphs, session lock and version check.
+
+Inputs that a callback edits in place (graph data received from the browser, or
+the graph of a stored session) are recreated before every run, outside the timed
+region: editing callbacks get a new session for every run.
+
+Usage:
+    python -m benchmarks.bench                                  # default sizes
+    python -m benchmarks.bench --sizes 10,1000,100000,1000000 --topologies chain,turbine
+    python -m benchmarks.bench --only analysis. -o results.json
+    python -m benchmarks.bench --baseline baseline.json         # flag regressions
+    python -m benchmarks.bench -o baseline.json                 # store a new baseline
+
+Callback benchmarks load load-visual.py and therefore need Dash; they are
+skipped when it is not installed.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import argparse
+import base64
+import datetime
+import gc
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.generators import TOPOLOGIES
+from loadpath import (AnalysisCache, LoadPathGraph, LoadTransferModel, compute_edge_loads,
+                      dumps_json, find_all_load_contributors, find_load_contributors,
+                      validate_load_path)
+from loadpath.graph_json import parse_graph
+from loadpath.graph_layout import layered_layout
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'load-visual.py')
+
+DEFAULT_SIZES = (10, 1000, 100000)
+
+# A benchmark is slower than its baseline when time or memory exceed it by this factor
+DEFAULT_THRESHOLD = 1.25
+
+# Time differences below this many seconds are treated as noise
+TIME_NOISE = 0.001
+
+# Benchmarks whose output grows with nodes x path depth, and the deep topologies
+# on which they are only run up to --deep-limit nodes
+DEEP_OUTPUT = {'analysis.find_all_load_contributors': ('chain', 'turbine')}
+DEFAULT_DEEP_LIMIT = 20000
+
+
+class Model:
+    """
+    A generated model with the derived inputs of the benchmarks (built on demand).
+    """
+
+    def __init__(self, topology, size):
+        self.topology = topology
+        self.size = size
+        self.graph = TOPOLOGIES[topology](size)
+        self.ground_id = self.graph['nodes'][0]['data']['id']
+        # The connection into the grounded node carries the most load
+        self.probe_edge = next(edge['data'] for edge in self.graph['edges']
+                               if edge['data']['target'] == self.ground_id)
+        self.probe_node = self.graph['nodes'][len(self.graph['nodes']) // 2]['data']['id']
+        self._cache = {}
+
+    def derived(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def text(self):
+        return self.derived('text', lambda: json.dumps(self.graph))
+
+    def fresh(self):
+        """
+        Returns a new copy of the graph data, like the one a callback receives.
+        """
+        return json.loads(self.text)
+
+
+def _load_app(store=False):
+    """
+    Loads load-visual.py as a module (None if Dash is not installed).
+
+    Args:
+        store (bool): Keep graphs in the server-side store. Idle sessions may be
+            evicted right away, so the sessions of earlier runs do not pile up
+    """
+    if importlib.util.find_spec('dash') is None:
+        return None
+    # Settings read by the app on import (None: unset)
+    settings = {'LOAD_PATH_STORE': 'server' if store else None}
+    if store:
+        settings.update({'LOAD_PATH_STORE_CAPACITY': '4', 'LOAD_PATH_STORE_IDLE_TIMEOUT': '0',
+                         'LOAD_PATH_STORE_DB': None, 'LOAD_PATH_STORE_WRITE_THROUGH': None})
+    saved = {name: os.environ.get(name) for name in settings}
+    _set_environ(settings)
+    try:
+        spec = importlib.util.spec_from_file_location(
+            'load_visual_store' if store else 'load_visual', APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        _set_environ(saved)
+    return module
+
+
+def _set_environ(values):
+    """
+    Sets environment variables; None values are removed.
+    """
+    for name, value in values.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def _graph_value(app, graph_data):
+    """
+    Returns the graph-data store value of a callback for graph data: the data
+    itself, or the handle of a new session holding it.
+    """
+    if app.graph_store is None:
+        return graph_data
+    return app.graph_store.create(graph_data)
+
+
+def _view_value(model, app):
+    """
+    Graph-data value of callbacks that do not edit the graph (shared by all runs).
+    """
+    return model.graph if app.graph_store is None else app.graph_store.create(model.fresh())
+
+
+def _edit_value(model, app):
+    """
+    Graph-data value of a callback that edits the graph (new for every run).
+    """
+    return _graph_value(app, model.fresh())
+
+
+# ---------------------------------------------------------------- benchmarks
+#
+# Each benchmark takes (model, app) and returns (func, setup): setup() returns the
+# arguments of one timed func(*args) call.
+
+
+def bench_contributors(model, app):
+    return find_load_contributors, lambda: (model.graph, model.probe_edge['id'])
+
+
+def bench_all_contributors(model, app):
+    return find_all_load_contributors, lambda: (model.graph,)
+
+
+def bench_edge_loads(model, app):
+    return lambda graph: LoadTransferModel(graph).edge_loads(), lambda: (model.graph,)
+
+
+def bench_validate_load_path(model, app):
+    return validate_load_path, lambda: (model.graph,)
+
+
+def bench_cached_edge_loads(model, app):
+    # Repeated query on an unchanged LoadPathGraph (the first call fills the cache)
+    cache = model.derived('analysis_cache', AnalysisCache)
+    graph = model.derived('load_path_graph', lambda: LoadPathGraph(model.graph))
+    compute_edge_loads(graph, cache=cache)
+    return lambda graph: compute_edge_loads(graph, cache=cache), lambda: (graph,)
+
+
+def bench_layered_layout(model, app):
+    return layered_layout, lambda: (model.graph,)
+
+
+def bench_parse_json(model, app):
+    return lambda text: parse_graph([text]), lambda: (model.text,)
+
+
+def bench_dumps_json(model, app):
+    return dumps_json, lambda: (model.graph,)
+
+
+def _upload(model, app):
+    return model.derived('upload', lambda: 'data:application/json;base64,'
+                         + base64.b64encode(model.text.encode()).decode())
+
+
+def bench_import_json(model, app):
+    return app.import_json, lambda: (_upload(model, app), 'model.json', 0,
+                                     _graph_value(app, {'nodes': [], 'edges': []}))
+
+
+def bench_export_json(model, app):
+    value = _view_value(model, app)
+    return app.export_json, lambda: (1, value)
+
+
+def bench_update_cytoscape(model, app):
+    value = _view_value(model, app)
+    return app.update_cytoscape, lambda: (1, value)
+
+
+def bench_draw_large_graph(model, app):
+    value = _view_value(model, app)
+    return app.draw_large_graph, lambda: (value, None, False)
+
+
+def bench_update_node_properties_table(model, app):
+    value = _view_value(model, app)
+    return app.update_node_properties_table, lambda: (value, 0, app.TABLE_PAGE_SIZE,
+                                                      None, None)
+
+
+def bench_update_node_dropdown(model, app):
+    value = _view_value(model, app)
+    return app.update_node_dropdown, lambda: (1, value)
+
+
+def bench_update_connection_list(model, app):
+    value = _view_value(model, app)
+    return app.update_connection_list, lambda: (value, 0, app.CONNECTION_PAGE_SIZE,
+                                                None, None)
+
+
+def bench_update_input_fields(model, app):
+    value = _view_value(model, app)
+    return app.update_input_fields, lambda: (model.probe_node, value)
+
+
+def bench_add_node(model, app):
+    return app.add_node, lambda: (1, _edit_value(model, app))
+
+
+def bench_delete_node(model, app):
+    return app.delete_node, lambda: (1, model.probe_node, _edit_value(model, app))
+
+
+def bench_handle_node_click(model, app):
+    click_state = f"First node: {model.probe_node}. Click another node to create connection."
+    return app.handle_node_click, lambda: ({'id': model.ground_id}, click_state,
+                                           _edit_value(model, app))
+
+
+def bench_toggle_subassembly(model, app):
+    return app.toggle_subassembly, lambda: (1, model.ground_id, _edit_value(model, app))
+
+
+def bench_update_node_properties(model, app):
+    values = [1.0] * 16
+    return app.update_node_properties, lambda: (1, model.probe_node, 'Renamed', *values, 'zyx',
+                                                _edit_value(model, app))
+
+
+# Callback benchmarks, run with the graph in the browser and in the server-side store
+CALLBACKS = {
+    'import_json': bench_import_json,
+    'export_json': bench_export_json,
+    'update_cytoscape': bench_update_cytoscape,
+    'draw_large_graph': bench_draw_large_graph,
+    'update_node_properties_table': bench_update_node_properties_table,
+    'update_node_dropdown': bench_update_node_dropdown,
+    'update_connection_list': bench_update_connection_list,
+    'update_input_fields': bench_update_input_fields,
+    'add_node': bench_add_node,
+    'delete_node': bench_delete_node,
+    'handle_node_click': bench_handle_node_click,
+    'update_node_properties': bench_update_node_properties,
+    'toggle_subassembly': bench_toggle_subassembly,
+}
+
+# Benchmark name -> (function, Dash app it needs: None, 'browser' or 'store')
+BENCHMARKS = {
+    'analysis.find_load_contributors': (bench_contributors, None),
+    'analysis.find_all_load_contributors': (bench_all_contributors, None),
+    'analysis.edge_loads': (bench_edge_loads, None),
+    'analysis.cached_edge_loads': (bench_cached_edge_loads, None),
+    'analysis.validate_load_path': (bench_validate_load_path, None),
+    'layout.layered_layout': (bench_layered_layout, None),
+    'io.parse_json': (bench_parse_json, None),
+    'io.dumps_json': (bench_dumps_json, None),
+}
+BENCHMARKS.update({f'callback.{name}': (bench, 'browser') for name, bench in CALLBACKS.items()})
+BENCHMARKS.update({f'store.{name}': (bench, 'store') for name, bench in CALLBACKS.items()})
+
+
+# ---------------------------------------------------------------- measurement
+
+def measure(func, setup, repeat=3, min_time=0.2):
+    """
+    Measures one benchmark.
+
+    Args:
+        func (callable): Function to time
+        setup (callable): Returns the arguments of one call (not timed)
+        repeat (int): Minimum number of timed runs
+        min_time (float): Keep repeating fast functions until this much time is spent
+
+    Returns:
+        dict: Wall times, peak memory and retained memory blocks
+    """
+    times = []
+    gc.collect()
+    while len(times) < repeat or (sum(times) < min_time and len(times) < 1000):
+        args = setup()
+        # Like timeit, keep the garbage collector out of the timed call
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del args
+
+    # One extra run for memory, since tracing slows the code down
+    args = setup()
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - blocks
+    del result
+
+    return {
+        'time_min': min(times),
+        'time_median': statistics.median(times),
+        'runs': len(times),
+        'peak_memory': peak,
+        'retained_blocks': retained_blocks,
+    }
+
+
+def run_benchmarks(sizes, topologies, names, repeat=3, min_time=0.2,
+                   deep_limit=DEFAULT_DEEP_LIMIT, log=sys.stderr):
+    """
+    Runs the selected benchmarks on every topology and size.
+
+    Returns:
+        list: One result dict per benchmark, topology and size
+    """
+    apps = {mode: _load_app(mode == 'store')
+            for mode in {BENCHMARKS[name][1] for name in names} - {None}}
+    if any(app is None for app in apps.values()):
+        print("Dash is not installed: callback benchmarks skipped", file=log)
+    results = []
+    for topology in topologies:
+        for size in sizes:
+            model = Model(topology, size)
+            for name in names:
+                bench, mode = BENCHMARKS[name]
+                app = apps.get(mode)
+                if mode is not None and app is None:
+                    continue
+                if topology in DEEP_OUTPUT.get(name, ()) and size > deep_limit:
+                    continue
+                func, setup = bench(model, app)
+                result = {'benchmark': name, 'topology': topology,
+                          'nodes': len(model.graph['nodes']),
+                          'edges': len(model.graph['edges'])}
+                result.update(measure(func, setup, repeat, min_time))
+                results.append(result)
+                print(f"{name:40s} {topology:8s} {size:>8d}  "
+                      f"{result['time_min'] * 1000:10.2f} ms  "
+                      f"{result['peak_memory'] / 1e6:9.1f} MB", file=log)
+            del model
+            gc.collect()
+    return results
+
+
+def environment():
+    """
+    Describes the machine and library versions the results were measured with.
+    """
+    info = {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+    for package in ('numpy', 'dash'):
+        try:
+            info[package] = __import__(package).__version__
+        except ImportError:
+            pass
+    return info
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares results with a baseline.
+
+    A result regresses when its minimum time or its peak memory exceeds the
+    baseline's by more than ``threshold`` times (time differences below
+    TIME_NOISE are ignored).
+
+    Returns:
+        list: (result, baseline result, [regressed metric names]) for every result
+            that has a baseline entry
+    """
+    key = lambda r: (r['benchmark'], r['topology'], r['nodes'])
+    reference = {key(r): r for r in baseline['results']}
+    comparisons = []
+    for result in results:
+        old = reference.get(key(result))
+        if old is None:
+            continue
+        regressed = []
+        if result['time_min'] > max(old['time_min'] * threshold, old['time_min'] + TIME_NOISE):
+            regressed.append('time_min')
+        if result['peak_memory'] > old['peak_memory'] * threshold:
+            regressed.append('peak_memory')
+        comparisons.append((result, old, regressed))
+    return comparisons
+
+
+def main(argv=None):
+    """
+    Command-line entry point; returns the exit status (1 if anything regressed).
+    """
+    parser = argparse.ArgumentParser(description="Load path benchmark suite")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Comma separated model sizes (number of nodes)")
+    parser.add_argument('--topologies', default=','.join(TOPOLOGIES),
+                        help=f"Comma separated topologies ({', '.join(TOPOLOGIES)})")
+    parser.add_argument('--only', default='',
+                        help="Only run benchmarks whose names start with one of these "
+                             "comma separated prefixes (e.g. analysis.,callback.export_json)")
+    parser.add_argument('--repeat', type=int, default=3, help="Minimum number of timed runs")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Minimum total time spent per benchmark, in seconds")
+    parser.add_argument('--deep-limit', type=int, default=DEFAULT_DEEP_LIMIT,
+                        help="Largest chain/turbine model for benchmarks whose output "
+                             "grows quadratically on deep load paths")
+    parser.add_argument('-o', '--output', help="Write the results to this JSON file")
+    parser.add_argument('--baseline', help="Results file to compare with")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Regression factor for time and peak memory")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    topologies = args.topologies.split(',')
+    unknown = [topology for topology in topologies if topology not in TOPOLOGIES]
+    if unknown:
+        parser.error(f"unknown topologies: {', '.join(unknown)}")
+    prefixes = tuple(prefix for prefix in args.only.split(',') if prefix)
+    names = [name for name in BENCHMARKS if not prefixes or name.startswith(prefixes)]
+
+    results = run_benchmarks(sizes, topologies, names, args.repeat, args.min_time,
+                             args.deep_limit)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = 0
+    for result, old, regressed in compare(results, baseline, args.threshold):
+        ratio = result['time_min'] / old['time_min'] if old['time_min'] else float('nan')
+        memory = result['peak_memory'] / old['peak_memory'] if old['peak_memory'] else float('nan')
+        flag = '  REGRESSION (' + ', '.join(regressed) + ')' if regressed else ''
+        print(f"{result['benchmark']:40s} {result['topology']:8s} {result['nodes']:>8d}  "
+              f"time x{ratio:5.2f}  memory x{memory:5.2f}{flag}")
+        regressions += bool(regressed)
+    print(f"{regressions} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Synthetic Load Path Models
+
+Generators for benchmark models in the Load Path Visual Tool JSON format. Every
+model is deterministic for a given size and seed, has complete node properties
+and canvas positions, and its first node is the grounded node:
+
+- chain: N0 <- N1 <- ... (one long load path, maximal depth)
+- tree: every node carries load to its parent (balanced, ``branching`` children)
+- fan_in: every node carries load directly to the grounded node (maximal width)
+- turbine: a wind turbine like structure - foundation, tower sections, nacelle
+  with many attached components, hub and three segmented blades
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import random
+
+from loadpath.graph_json import NODE_COLORS
+from loadpath.load_transfer import ROTATION_ORDERS
+
+
+def _node(rng, node_id, x, y):
+    """
+    Returns a node with random properties at canvas position (x, y).
+    """
+    return {
+        'data': {
+            'id': node_id,
+            'name': node_id,
+            'color': rng.choice(NODE_COLORS),
+            'mass': round(rng.uniform(10, 50000), 1),
+            'cog': [round(rng.uniform(-5, 5), 2) for _ in range(3)],
+            'external_force': [round(rng.uniform(-1000, 1000), 1) for _ in range(3)],
+            'moment': [round(rng.uniform(-1000, 1000), 1) for _ in range(3)],
+            'euler_angles': [rng.choice((0, 0, 90, 30, -45)) for _ in range(3)],
+            'rotation_order': rng.choice(ROTATION_ORDERS),
+            'translation': [round(rng.uniform(-50, 50), 2) for _ in range(3)]
+        },
+        'position': {'x': x, 'y': y}
+    }
+
+
+def _graph(rng, node_ids, edges):
+    """
+    Builds graph data from node IDs and (source, target) index pairs.
+    """
+    nodes = [_node(rng, node_id, (i % 100) * 80, (i // 100) * 60)
+             for i, node_id in enumerate(node_ids)]
+    return {
+        'nodes': nodes,
+        'edges': [{'data': {'id': f'e{i}', 'source': node_ids[s], 'target': node_ids[t]}}
+                  for i, (s, t) in enumerate(edges)]
+    }
+
+
+def chain(n, seed=0):
+    """
+    Returns a single load path of ``n`` nodes (N1 -> N0, N2 -> N1, ...).
+    """
+    return _graph(random.Random(seed), [f'N{i}' for i in range(n)],
+                  [(i, i - 1) for i in range(1, n)])
+
+
+def tree(n, seed=0, branching=3):
+    """
+    Returns a balanced tree of ``n`` nodes where every node loads its parent.
+    """
+    return _graph(random.Random(seed), [f'N{i}' for i in range(n)],
+                  [(i, (i - 1) // branching) for i in range(1, n)])
+
+
+def fan_in(n, seed=0):
+    """
+    Returns ``n - 1`` nodes that all load the grounded node N0 directly.
+    """
+    return _graph(random.Random(seed), [f'N{i}' for i in range(n)],
+                  [(i, 0) for i in range(1, n)])
+
+
+def turbine(n, seed=0):
+    """
+    Returns a wind turbine like model with ``n`` nodes (at least 8).
+
+    A tenth of the nodes are tower sections and two fifths are blade segments;
+    the remaining nodes are nacelle components (gearbox, generator, ...).
+    """
+    n = max(n, 8)
+    sections = max(n // 10, 1)
+    segments = max(n // 5 // 3 * 2, 1)       # per blade
+    components = n - 3 - sections - 3 * segments
+
+    node_ids = ['Foundation']
+    edges = []
+
+    def add(node_id, target):
+        node_ids.append(node_id)
+        edges.append((len(node_ids) - 1, target))
+        return len(node_ids) - 1
+
+    below = 0
+    for i in range(sections):
+        below = add(f'Tower Section {i + 1}', below)
+    nacelle = add('Nacelle', below)
+    hub = add('Hub', nacelle)
+    for i in range(components):
+        add(f'Nacelle Component {i + 1}', nacelle)
+    for blade in range(3):
+        inner = hub
+        for i in range(segments):
+            inner = add(f'Blade {blade + 1} Segment {i + 1}', inner)
+    return _graph(random.Random(seed), node_ids, edges)
+
+
+# Topology name -> generator(n, seed)
+TOPOLOGIES = {
+    'chain': chain,
+    'tree': tree,
+    'fan_in': fan_in,
+    'turbine': turbine,
+}
@@ -19,19 +19,102 @@ Email: pkyadav01234@gmail.com
 Date: March, 2025
 Status: Development
 Python Version: Python 3
-Dependencies: dash, dash-cytoscape, json, random, datetime, re
+Dependencies: dash, dash-cytoscape, random, datetime
 """
 
 import dash
-from dash import html, dcc, Input, Output, State, dash_table
+from dash import html, dcc, Input, Output, State, Patch, ClientsideFunction, dash_table, set_props
 import dash_cytoscape as cyto
-import json
+import base64
+import functools
+import inspect
+import os
 import random
 import datetime  # Add datetime import for timestamp
-import re  # Add regex for JSON formatting
+from collections import OrderedDict
+from urllib.parse import parse_qs
+
+from loadpath.graph_binary import EXTENSION as BINARY_EXTENSION, read_binary
+from loadpath.graph_columns import ColumnarGraph
+from loadpath.graph_hierarchy import (SubassemblyLoads, collapsed_nodes, direct_contributors,
+                                      hidden_nodes, visible_graph)
+from loadpath.graph_index import GraphIndex
+from loadpath.graph_json import build_graph, dumps_json, read_graph_base64
+from loadpath.graph_layout import LayoutCache, apply_positions, fill_positions, free_position, layered_layout
+from loadpath.graph_store import (GraphStore, SessionNotFoundError, StoreFullError,
+                                  VersionConflictError)
+from loadpath.graph_view import CLUSTER_PREFIX, is_large_graph, level_of_detail
+from loadpath.load_cache import AnalysisCache
+from loadpath.load_incremental import IncrementalLoadAnalysis
+from loadpath.load_transfer import GRAVITY
+from loadpath.load_validation import closing_path, validate_load_path
+from loadpath.metrics import CallbackMetrics, install_flask_hooks, install_metrics_endpoints
+from loadpath.table_query import table_page
 
 app = dash.Dash(__name__)
 
+# Optional server-side graph storage. By default the whole graph is kept in the
+# graph-data store in the browser, and every edit request uploads it. With
+# LOAD_PATH_STORE=server graph-data only holds a small {'session', 'version'} handle
+# and the model stays on the server (LRU cache, optionally backed by the SQLite file
+# in LOAD_PATH_STORE_DB), so edit requests only carry the handle and the IDs they
+# need. Open the app with ?session=<id> to share one model between several tabs or
+# users. Stored graphs keep their node properties in columns (see graph_columns).
+if os.environ.get('LOAD_PATH_STORE') == 'server':
+    graph_store = GraphStore(
+        capacity=int(os.environ.get('LOAD_PATH_STORE_CAPACITY', 32)),
+        path=os.environ.get('LOAD_PATH_STORE_DB'),
+        write_through=os.environ.get('LOAD_PATH_STORE_WRITE_THROUGH') == '1',
+        graph_factory=ColumnarGraph.from_json,
+        idle_timeout=float(os.environ.get('LOAD_PATH_STORE_IDLE_TIMEOUT', 3600))
+    )
+else:
+    graph_store = None
+
+# The node properties table and the connection table show one page at a time. With
+# graph data in the browser they page, filter and sort there ('native'); with the
+# server-side store only the visible page is sent ('custom', see table_page).
+TABLE_PAGE_SIZE = 50
+CONNECTION_PAGE_SIZE = 20
+table_action = 'custom' if graph_store is not None else 'native'
+
+# Large graph mode. Above LOAD_PATH_LARGE_GRAPH elements (nodes + edges) the canvas only
+# shows the part of the graph inside the viewport: the nodes themselves when at most
+# LOAD_PATH_LOD_NODES of them are visible, otherwise clusters on a grid with merged
+# edges (see graph_view). Labels are hidden when they get too small to read.
+LARGE_GRAPH_OPTIONS = {
+    'threshold': int(os.environ.get('LOAD_PATH_LARGE_GRAPH', 3000)),
+    'detail_nodes': int(os.environ.get('LOAD_PATH_LOD_NODES', 1500)),
+    'grid': 48,
+    'margin': 0.25,
+}
+
+# Optional callback instrumentation. With LOAD_PATH_METRICS=1 every callback request
+# is timed and its payload sizes recorded (LOAD_PATH_METRICS_BUFFER recent requests
+# are kept). The totals are served at /metrics in the Prometheus text format and the
+# recent requests at /metrics/recent.
+# LOAD_PATH_METRICS_PANEL=1 also shows them in a table below the graph. When
+# disabled, nothing is installed.
+if os.environ.get('LOAD_PATH_METRICS') == '1':
+    callback_metrics = CallbackMetrics(int(os.environ.get('LOAD_PATH_METRICS_BUFFER', 1000)))
+    
+    def callback_name(output):
+        """
+        Returns the function name of the callback producing ``output``.
+        """
+        callback = app.callback_map.get(output, {}).get('callback')
+        if callback is None or callback.__name__ == 'update_metrics_panel':
+            return None  # the panel's own polling is not recorded
+        return callback.__name__
+    
+    install_flask_hooks(app.server, callback_metrics, callback_name,
+                        app.config.requests_pathname_prefix)
+    install_metrics_endpoints(app.server, callback_metrics)
+else:
+    callback_metrics = None
+show_metrics_panel = (callback_metrics is not None
+                      and os.environ.get('LOAD_PATH_METRICS_PANEL') == '1')
+
 # Add node property input fields
 node_properties = html.Div([
     html.H3("Node Properties"),
@@ -109,14 +192,39 @@ graph_builder = html.Div([
     html.H3("Interactive Graph Builder"),
     html.Button("Add Node", id='add-node-btn', n_clicks=0),
     html.Button("Delete Selected Node", id='delete-node-btn', n_clicks=0, style={'margin-left': '10px'}),
+    html.Button("Collapse/Expand Selected", id='toggle-subassembly-btn', n_clicks=0,
+                style={'margin-top': '10px'}),
+    html.Button("Auto Layout", id='layout-btn', n_clicks=0, style={'margin-left': '10px'}),
     html.Div(id='click-data'),
-    html.Div(id='connection-list'),
+    html.Div(id='subassembly-summary', style={'margin-top': '10px'}),
+    html.Div([
+        html.H3("Connections:"),
+        dash_table.DataTable(
+            id='connection-table',
+            columns=[
+                {'name': 'Connection', 'id': 'id'},
+                {'name': 'From', 'id': 'source'},
+                {'name': 'To', 'id': 'target'}
+            ],
+            data=[],
+            page_action=table_action,
+            page_size=CONNECTION_PAGE_SIZE,
+            filter_action=table_action,
+            sort_action=table_action,
+            sort_mode='multi',
+            style_cell={'textAlign': 'left', 'minWidth': '60px'},
+            style_header={
+                'backgroundColor': 'rgb(230, 230, 230)',
+                'fontWeight': 'bold'
+            }
+        )
+    ], id='connection-list'),
     html.Div([
         html.Button("Export to JSON", id='export-json-btn', n_clicks=0),
         html.Button("Import from JSON", id='import-json-btn', n_clicks=0),
         dcc.Upload(
             id='upload-json',
-            children=html.Div(['Drag and Drop or ', html.A('Select a JSON File')]),
+            children=html.Div(['Drag and Drop or ', html.A(f'Select a JSON or {BINARY_EXTENSION} File')]),
             style={
                 'width': '100%',
                 'height': '60px',
@@ -157,6 +265,11 @@ node_properties_table = html.Div([
             {'name': 'Trans Z', 'id': 'trans_z'}
         ],
         data=[],
+        page_action=table_action,
+        page_size=TABLE_PAGE_SIZE,
+        filter_action=table_action,
+        sort_action=table_action,
+        sort_mode='multi',
         style_table={'overflowX': 'auto'},
         style_cell={
             'textAlign': 'center',
@@ -177,11 +290,56 @@ node_properties_table = html.Div([
     'backgroundColor': '#f9f9f9'
     })
 
+# Callback metrics table (only shown with LOAD_PATH_METRICS_PANEL=1)
+metrics_panel = html.Div([
+    html.H3("Callback Metrics"),
+    dcc.Interval(id='metrics-interval', interval=2000),
+    dash_table.DataTable(
+        id='metrics-table',
+        columns=[
+            {'name': 'Callback', 'id': 'callback'},
+            {'name': 'Calls', 'id': 'calls'},
+            {'name': 'Errors', 'id': 'errors'},
+            {'name': 'Total (ms)', 'id': 'total_ms'},
+            {'name': 'Mean (ms)', 'id': 'mean_ms'},
+            {'name': 'Max (ms)', 'id': 'max_ms'},
+            {'name': 'Mean In (bytes)', 'id': 'mean_bytes_in'},
+            {'name': 'Mean Out (bytes)', 'id': 'mean_bytes_out'}
+        ],
+        data=[],
+        sort_action='native',
+        style_cell={'textAlign': 'center', 'minWidth': '80px'},
+        style_header={
+            'backgroundColor': 'rgb(230, 230, 230)',
+            'fontWeight': 'bold'
+        }
+    )
+], style={
+    'marginTop': '10px',
+    'padding': '10px',
+    'borderRadius': '10px',
+    'backgroundColor': '#f9f9f9'
+    })
+
 app.layout = html.Div([
-    # Store for graph data
+    # Store for graph data (or its server-side session handle)
     dcc.Store(id='graph-data', data={'nodes': [], 'edges': []}),
-    # Store for node positions
-    dcc.Store(id='node-positions', data={}),
+    dcc.Location(id='url'),
+    # Counter bumped whenever graph-data is replaced as a whole (e.g. on import)
+    dcc.Store(id='graph-reset', data=0),
+    # Current session handle after an edit was rejected as outdated (server-side store)
+    dcc.Store(id='graph-resync', data=None),
+    # Node positions seen last by the browser ({'reset', 'positions'})
+    dcc.Store(id='node-positions', data=None),
+    # Positions of the nodes moved by the last drag
+    dcc.Store(id='position-changes', data=None),
+    # Whether the canvas shows the level-of-detail view of a large graph
+    dcc.Store(id='large-graph', data=False),
+    dcc.Store(id='large-graph-options', data=LARGE_GRAPH_OPTIONS),
+    # Viewport of a large graph drawn on the server
+    dcc.Store(id='viewport', data=None),
+    # ID of the collapsed node whose sub-assembly summary is requested
+    dcc.Store(id='subassembly-request', data=None),
     # Store for downloaded JSON
     dcc.Download(id='download-json'),
     # Store for selected node
@@ -249,11 +407,53 @@ app.layout = html.Div([
                             'border-color': '#333',
                             'border-style': 'solid'
                         }
+                    },
+                    # Collapsed sub-assemblies (see graph_hierarchy)
+                    {
+                        'selector': 'node[?collapsed]',
+                        'style': {
+                            'shape': 'round-rectangle',
+                            'width': 45,
+                            'height': 45,
+                            'border-width': '4px',
+                            'border-style': 'double',
+                            'border-color': '#555'
+                        }
+                    },
+                    # Level-of-detail view of large graphs (see graph_view)
+                    {
+                        'selector': 'node.lod',
+                        'style': {'min-zoomed-font-size': 8}
+                    },
+                    {
+                        'selector': 'node.overview',
+                        'style': {'content': ''}
+                    },
+                    {
+                        'selector': 'node.cluster',
+                        'style': {
+                            'content': 'data(name)',
+                            'background-color': '#95a5a6',
+                            'shape': 'round-rectangle',
+                            'width': 'mapData(count, 2, 500, 30, 90)',
+                            'height': 'mapData(count, 2, 500, 30, 90)'
+                        }
+                    },
+                    {
+                        'selector': 'edge.overview',
+                        'style': {
+                            'curve-style': 'haystack',
+                            'haystack-radius': 0,
+                            'target-arrow-shape': 'none',
+                            'width': 1,
+                            'opacity': 0.6
+                        }
                     }
                 ]
             ),
             # Node properties table below the plot
             node_properties_table,
+            *([metrics_panel] if show_metrics_panel else []),
             html.Footer('© 2025 Pramod Kumar Yadav (@iAmPramodYadav)'),
         ], style={
             'width': '75%', 'height': '80vh',
@@ -266,12 +466,366 @@ app.layout = html.Div([
     })
 ])
 
+# Views derived from graph-data. They mirror graph-data by position: the cytoscape
+# elements hold all nodes followed by all edges, the dropdown options and table rows
+# hold one entry per node and the connection table holds one row per edge. With the
+# server-side store the two tables only hold the visible page and are refreshed
+# from the server instead (see update_node_properties_table). While a sub-assembly
+# is collapsed, the elements only hold the visible part of the graph (see
+# graph_hierarchy) and edits are patched by comparing the views (see view_patch).
+GRAPH_OUTPUTS = [
+    Output('graph-data', 'data', allow_duplicate=True),
+    Output('cytoscape', 'elements', allow_duplicate=True),
+    Output('select-node-dropdown', 'options', allow_duplicate=True),
+    Output('node-properties-table', 'data', allow_duplicate=True),
+    Output('connection-table', 'data', allow_duplicate=True),
+]
+
+def node_option(node_data):
+    """
+    Builds the node dropdown option for a node.
+    """
+    return {'label': node_data['name'], 'value': node_data['id']}
+
+def node_table_row(node_data):
+    """
+    Builds the node properties table row for a node.
+    """
+    return {
+        'name': node_data['name'],
+        'mass': node_data['mass'],
+        'cog_x': node_data['cog'][0],
+        'cog_y': node_data['cog'][1],
+        'cog_z': node_data['cog'][2],
+        'force_x': node_data['external_force'][0],
+        'force_y': node_data['external_force'][1],
+        'force_z': node_data['external_force'][2],
+        'moment_x': node_data['moment'][0],
+        'moment_y': node_data['moment'][1],
+        'moment_z': node_data['moment'][2],
+        'euler_x': node_data['euler_angles'][0],
+        'euler_y': node_data['euler_angles'][1],
+        'euler_z': node_data['euler_angles'][2],
+        'rotation_order': node_data['rotation_order'],
+        'trans_x': node_data['translation'][0],
+        'trans_y': node_data['translation'][1],
+        'trans_z': node_data['translation'][2]
+    }
+
+def connection_row(edge_data):
+    """
+    Builds the connection table row for an edge.
+    """
+    return {'id': edge_data['id'], 'source': edge_data['source'], 'target': edge_data['target']}
+
+def resolve_graph(value):
+    """
+    Returns the graph data behind a graph-data store value.
+    
+    Args:
+        value (dict): Graph data, or a server-side session handle
+        
+    Returns:
+        dict: Graph data (the live server-side copy when a handle is given)
+    """
+    if graph_store is None or 'session' not in value:
+        return value
+    return graph_store.get(value['session'])
+
+def graph_index(value):
+    """
+    Returns a lookup index over the graph data behind a graph-data store value.
+    
+    Server-side sessions keep their index between callbacks; graph data sent by the
+    browser is indexed in one pass.
+    
+    Args:
+        value (dict): Graph data, or a server-side session handle
+        
+    Returns:
+        GraphIndex: Index over the (live) graph data
+    """
+    if graph_store is None or 'session' not in value:
+        return GraphIndex(value)
+    return graph_store.index(value['session'])
+
+def no_update_outputs():
+    """
+    Returns dash.no_update for every output of the running callback.
+    """
+    outputs = dash.callback_context.outputs_list
+    return [dash.no_update] * len(outputs) if isinstance(outputs, list) else dash.no_update
+
+def session_callback(argument, edit=False):
+    """
+    Decorates a callback that works on the graph behind a graph-data value.
+    
+    With the server-side store the callback runs under the session lock (see
+    GraphStore.session), so concurrent requests of one session (double clicks,
+    several tabs) do not interleave their changes. Edits are also rejected if the
+    handle sent by the browser is not the current version: the browser is then
+    re-synced to the stored graph (see resync_graph) instead of applying an edit
+    made on an outdated view.
+    
+    A session that is no longer stored on the server (e.g. after a restart without
+    LOAD_PATH_STORE_DB) is reported in the status line and the outputs are left
+    unchanged; the graph is never replaced by an empty one.
+    
+    Args:
+        argument (str): Name of the callback argument holding the graph-data value
+        edit (bool): Whether the callback edits the graph based on the browser's view
+        
+    Returns:
+        callable: Decorator
+    """
+    def decorate(func):
+        position = list(inspect.signature(func).parameters).index(argument)
+        
+        @functools.wraps(func)
+        def run(*args):
+            value = args[position]
+            if graph_store is None or not isinstance(value, dict) or 'session' not in value:
+                return func(*args)
+            session_id = value['session']
+            try:
+                with graph_store.session(session_id, value.get('version') if edit else None):
+                    return func(*args)
+            except SessionNotFoundError as error:
+                set_props('click-data', {'children': html.Div(
+                    f"{error}: the model is no longer stored on the server. "
+                    f"Reload the page to start a new one.", style={'color': 'red'})})
+            except VersionConflictError:
+                set_props('graph-resync', {'data': graph_store.handle(session_id)})
+                set_props('click-data', {'children': html.Div(
+                    "The model was changed by another request in the meantime, so this "
+                    "action was not applied. The latest version is shown now.",
+                    style={'color': 'darkorange'})})
+            return no_update_outputs()
+        return run
+    return decorate
+
+def store_graph(value, graph_data):
+    """
+    Returns the graph-data store value for a graph that replaces the current one.
+    
+    Args:
+        value (dict): Current graph data, or a server-side session handle
+        graph_data (dict): New graph data
+        
+    Returns:
+        dict: The new graph data, or the updated session handle
+    """
+    if graph_store is None or 'session' not in value:
+        return graph_data
+    return graph_store.put(value['session'], graph_data)
+
+def query_table(count, row, page_current, page_size, sort_by, filter_query):
+    """
+    Returns one page of a table in custom paging mode (see table_page).
+    
+    An unparsable filter expression shows an empty table instead of failing.
+    
+    Returns:
+        tuple: (Rows of the page, Number of pages, Page shown)
+    """
+    try:
+        return table_page(count, row, page_current, page_size, sort_by, filter_query)
+    except ValueError:
+        return [], 1, 0
+
+def view_elements(view):
+    """
+    Returns the Cytoscape elements of a visible graph (all nodes, then all edges).
+    """
+    return [node.copy() for node in view['nodes']] + [edge.copy() for edge in view['edges']]
+
+def view_patch(old, new):
+    """
+    Returns the Patch that turns the elements ``old`` into ``new``.
+    
+    Both lists must keep the nodes and edges they share in the same order, which
+    edits do (new items are appended). Elements that were hidden or shown are
+    deleted or inserted, changed ones replaced; unchanged ones are not sent.
+    
+    Args:
+        old (list): Elements shown before the edit
+        new (list): Elements to show after the edit
+        
+    Returns:
+        dash.Patch: Operations applied to the cytoscape elements in order
+    """
+    key = lambda element: ('source' in element['data'], element['data']['id'])
+    old_elements = {key(element): element for element in old}
+    new_keys = {key(element) for element in new}
+    patch = Patch()
+    # Step 1: Delete from the back so the remaining indices stay valid
+    for i in range(len(old) - 1, -1, -1):
+        if key(old[i]) not in new_keys:
+            del patch[i]
+    # Step 2: The elements left are in new order; insert and replace front to back
+    for i, element in enumerate(new):
+        previous = old_elements.get(key(element))
+        if previous is None:
+            patch.insert(i, element)
+        elif previous != element:
+            patch[i] = element
+    return patch
+
+def view_callback(function_name, *dependencies):
+    """
+    Registers a callback that only reshapes graph-data for display.
+    
+    When graph-data holds the graph itself, the clientside function of the same
+    name in assets/clientside.js is used, so the update needs no server round trip.
+    With the server-side store the browser only has a session handle, and the
+    decorated Python function runs on the server instead.
+    
+    Args:
+        function_name (str): Name of the function in assets/clientside.js
+        *dependencies: Outputs, Inputs and States of the callback
+        
+    Returns:
+        callable: Decorator registering the Python function as fallback
+    """
+    def register(func):
+        if graph_store is None:
+            app.clientside_callback(
+                ClientsideFunction(namespace='loadpath', function_name=function_name),
+                *dependencies
+            )
+        else:
+            app.callback(*dependencies)(func)
+        return func
+    return register
+
+class GraphPatch:
+    """
+    Collects the deltas of one edit for graph-data and every view derived from it.
+    
+    Callbacks return these partial updates (dash.Patch) instead of the whole graph,
+    so the response size is proportional to the change, not to the graph. With the
+    server-side store the edits are applied to the stored graph instead and
+    graph-data only receives the new session handle. Edges must be deleted before
+    the node they are attached to.
+    
+    While a sub-assembly is collapsed, the elements are patched from the difference
+    between the visible parts of the graph before and after the edit, so expanding
+    a sub-assembly only sends its newly shown children.
+    
+    Args:
+        value (dict): graph-data store value the edit is applied to
+        track_view (bool): Compare the visible parts even if nothing is collapsed
+            yet (for edits that collapse sub-assemblies)
+        
+    Attributes:
+        index (GraphIndex): Lookup index, kept up to date with every edit
+        graph (dict): Graph data behind ``value``
+        renamed (list): (old ID, new ID) of every renamed node
+        touched_nodes (set): IDs of added, updated and deleted nodes
+        touched_edges (set): IDs of added, updated and deleted edges
+    """
+    def __init__(self, value, track_view=False):
+        self.value = value
+        self.index = graph_index(value)
+        self.graph = self.index.graph
+        self.server_side = self.graph is not value
+        collapsed = collapsed_nodes(self.graph)
+        view = visible_graph(self.graph, hidden_nodes(self.graph, collapsed))
+        # Large graphs are drawn from graph-data by draw_large_graph instead
+        self.large = is_large_graph(view, LARGE_GRAPH_OPTIONS['threshold'])
+        self.view = view_elements(view) if (collapsed or track_view) and not self.large else None
+        self.n_nodes = len(self.graph['nodes'])
+        self.data = Patch()
+        self.elements = Patch()
+        self.options = Patch()
+        self.rows = Patch()
+        self.items = Patch()
+        # Changed IDs, to update the load analysis of the session (see update_session_analysis)
+        self.renamed = []
+        self.touched_nodes = set()
+        self.touched_edges = set()
+    
+    def add_node(self, node):
+        self.touched_nodes.add(node['data']['id'])
+        self.index.add_node(node)
+        self.data['nodes'].append(node)
+        self.elements.insert(self.n_nodes, node)
+        self.options.append(node_option(node['data']))
+        self.rows.append(node_table_row(node['data']))
+        self.n_nodes += 1
+    
+    def update_node(self, index, node_data):
+        old_id = self.graph['nodes'][index]['data']['id']
+        if old_id != node_data['id']:
+            self.renamed.append((old_id, node_data['id']))
+        self.touched_nodes.add(node_data['id'])
+        self.index.update_node(index, node_data)
+        self.data['nodes'][index]['data'] = node_data
+        self.elements[index]['data'] = node_data
+        self.options[index] = node_option(node_data)
+        self.rows[index] = node_table_row(node_data)
+    
+    def delete_node(self, index):
+        self.touched_nodes.add(self.graph['nodes'][index]['data']['id'])
+        self.index.delete_node(index)
+        del self.data['nodes'][index]
+        del self.elements[index]
+        del self.options[index]
+        del self.rows[index]
+        self.n_nodes -= 1
+    
+    def add_edge(self, edge):
+        self.touched_edges.add(edge['data']['id'])
+        self.index.add_edge(edge)
+        self.data['edges'].append(edge)
+        self.elements.append(edge)
+        self.items.append(connection_row(edge['data']))
+    
+    def update_edge(self, index, edge_data):
+        self.touched_edges.update((self.graph['edges'][index]['data']['id'], edge_data['id']))
+        self.index.update_edge(index, edge_data)
+        self.data['edges'][index]['data'] = edge_data
+        self.elements[self.n_nodes + index]['data'] = edge_data
+        self.items[index] = connection_row(edge_data)
+    
+    def delete_edges(self, indices):
+        # Delete from the back so the remaining indices stay valid
+        for index in sorted(indices, reverse=True):
+            self.touched_edges.add(self.graph['edges'][index]['data']['id'])
+            del self.data['edges'][index]
+            del self.elements[self.n_nodes + index]
+            del self.items[index]
+        self.index.delete_edges(indices)
+    
+    def outputs(self):
+        """
+        Returns the patches in GRAPH_OUTPUTS order.
+        """
+        if self.view is not None:
+            view = visible_graph(self.graph)
+            if is_large_graph(view, LARGE_GRAPH_OPTIONS['threshold']):
+                elements = dash.no_update
+            else:
+                elements = view_patch(self.view, view_elements(view))
+        else:
+            elements = dash.no_update if self.large else self.elements
+        if self.server_side:
+            # The tables only hold one page; they are refreshed for the new handle
+            handle = store_graph(self.value, self.graph)
+            update_session_analysis(self, handle)
+            return [handle, elements, self.options, dash.no_update, dash.no_update]
+        return [self.data, elements, self.options, self.rows, self.items]
+
+NO_GRAPH_UPDATE = [dash.no_update] * len(GRAPH_OUTPUTS)
+
 # Callback to add nodes on button click
 @app.callback(
-    Output('graph-data', 'data'),
+    GRAPH_OUTPUTS,
     Input('add-node-btn', 'n_clicks'),
-    State('graph-data', 'data')
+    State('graph-data', 'data'),
+    prevent_initial_call=True
 )
+@session_callback('data', edit=True)
 def add_node(n_clicks, data):
     """
     Creates a new node with default properties and a unique name.
@@ -281,32 +835,32 @@ def add_node(n_clicks, data):
         data (dict): Current graph data containing nodes and edges
         
     Returns:
-        dict: Updated graph data with the new node added
+        list: Patches adding the new node to the graph data and its views
         
     The function:
     1. Generates a unique node name (Node0, Node1, etc.)
-    2. Assigns random position and color
+    2. Places it next to the bottom layer of the graph and assigns a random color
     3. Initializes default mechanical properties (mass, forces, etc.)
     4. Adds the node to the graph data
     """
     if not n_clicks:
-        return dash.no_update
+        return NO_GRAPH_UPDATE
     
-    # Generate a unique node name that doesn't already exist
-    existing_names = [node['data']['name'] for node in data['nodes']]
+    patch = GraphPatch(data)
+    
+    # Generate a unique node name that doesn't already exist (node IDs are the names)
     node_name = None
     counter = 0
-    while node_name is None or node_name in existing_names:
+    while node_name is None or patch.index.node(node_name) is not None:
         node_name = f'Node{counter}'
         counter += 1
         
     colors = ['#FF4136', '#2ECC40', '#0074D9', '#FF851B', '#B10DC9']
     
-    # Random position for button click
-    pos_x = random.uniform(100, 800)
-    pos_y = random.uniform(100, 500)
+    # Free slot on the bottom (grounded) layer, see graph_layout
+    position = free_position(patch.graph)
         
-    data['nodes'].append({
+    patch.add_node({
         'data': {
             'id': node_name,  # Use name as ID for simplicity
             'name': node_name,
@@ -319,9 +873,9 @@ def add_node(n_clicks, data):
             'rotation_order': 'xyz',
             'translation': [0, 0, 0]
         },
-        'position': {'x': pos_x, 'y': pos_y}
+        'position': position
     })
-    return data
+    return patch.outputs()
 
 # Store selected node
 @app.callback(
@@ -344,13 +898,14 @@ def store_selected_node(node_data):
 
 # Callback to delete selected node
 @app.callback(
-    [Output('graph-data', 'data', allow_duplicate=True),
-     Output('click-data', 'children', allow_duplicate=True)],
+    GRAPH_OUTPUTS +
+    [Output('click-data', 'children', allow_duplicate=True)],
     Input('delete-node-btn', 'n_clicks'),
     State('selected-node', 'data'),
     State('graph-data', 'data'),
     prevent_initial_call=True
 )
+@session_callback('graph_data', edit=True)
 def delete_node(n_clicks, selected_node_id, graph_data):
     """
     Deletes a selected node and all its connected edges from the graph.
@@ -361,59 +916,329 @@ def delete_node(n_clicks, selected_node_id, graph_data):
         graph_data (dict): Current graph data containing nodes and edges
         
     Returns:
-        tuple: (Updated graph data, Status message)
+        list: Patches for the graph data and its views, followed by a status message
         
     The function:
-    1. Removes the specified node from the nodes list
-    2. Removes all edges connected to the deleted node
+    1. Removes all edges connected to the deleted node
+    2. Removes the specified node from the nodes list
     3. Resets the connection state
     """
     if not n_clicks or not selected_node_id:
-        return dash.no_update, dash.no_update
+        return NO_GRAPH_UPDATE + [dash.no_update]
     
-    # Remove the node
-    graph_data['nodes'] = [node for node in graph_data['nodes'] 
-                          if node['data']['id'] != selected_node_id]
+    patch = GraphPatch(graph_data)
+    node_index = patch.index.node_position(selected_node_id)
+    if node_index is None:
+        return NO_GRAPH_UPDATE + [dash.no_update]
     
     # Remove any edges connected to this node
-    graph_data['edges'] = [edge for edge in graph_data['edges'] 
-                          if edge['data']['source'] != selected_node_id and 
-                             edge['data']['target'] != selected_node_id]
+    patch.delete_edges([patch.index.edge_position(edge_id)
+                        for edge_id in patch.index.edges_of(selected_node_id)])
+    # Remove the node
+    patch.delete_node(node_index)
     
     # Reset the click state to avoid connection issues
-    return graph_data, "Click a node to start new connection."
+    return patch.outputs() + ["Click a node to start new connection."]
+
+# Analysis results by model content (see load_cache)
+analysis_cache = AnalysisCache(capacity=32)
+
+# Incremental load analysis of each server-side session: session ID -> [version,
+# IncrementalLoadAnalysis]. GraphPatch edits update it in place; edits touching
+# more than ANALYSIS_EDIT_LIMIT nodes and edges (and any other new version) build
+# it again on the next use instead.
+session_analyses = OrderedDict()
+ANALYSIS_EDIT_LIMIT = 1000
+
+def session_analysis(graph_data):
+    """
+    Returns the incremental load analysis of the current version of a session.
+    
+    Must be called inside graph_store.session() of the session.
+    
+    Args:
+        graph_data (dict): Server-side session handle
+        
+    Returns:
+        IncrementalLoadAnalysis: Analysis of the session's graph
+    """
+    session, version = graph_data['session'], graph_data.get('version')
+    cached = session_analyses.get(session)
+    if cached is None or cached[0] != version:
+        cached = session_analyses[session] = [
+            version, IncrementalLoadAnalysis(resolve_graph(graph_data), GRAVITY)]
+        while len(session_analyses) > graph_store.capacity:
+            session_analyses.popitem(last=False)
+    session_analyses.move_to_end(session)
+    return cached[1]
+
+def update_session_analysis(patch, handle):
+    """
+    Applies a stored GraphPatch edit to the incremental load analysis of its session.
+    
+    Renames are applied first, then the touched nodes and edges are read back from
+    the edited graph, so the order of the edits within the patch does not matter.
+    
+    Args:
+        patch (GraphPatch): Edit of a server-side session
+        handle (dict): Session handle after the edit
+    """
+    session = handle['session']
+    cached = session_analyses.get(session)
+    if cached is None:
+        return
+    analysis = cached[1]
+    if (cached[0] != patch.value.get('version')
+            or len(patch.touched_nodes) + len(patch.touched_edges) > ANALYSIS_EDIT_LIMIT
+            or any(new_id in analysis.nodes for _, new_id in patch.renamed)):
+        del session_analyses[session]
+        return
+    
+    # Step 1: Renames keep the connections and loads of the node
+    for old_id, new_id in patch.renamed:
+        analysis.rename_node(old_id, new_id)
+    # Step 2: New and updated nodes (add_node updates existing ones)
+    for node_id in patch.touched_nodes:
+        node = patch.index.node(node_id)
+        if node is not None:
+            analysis.add_node(node_id, node['data'])
+    # Step 3: Connections
+    for edge_id in patch.touched_edges:
+        edge = patch.index.edge(edge_id)
+        if edge is None:
+            analysis.remove_edge(edge_id)
+        else:
+            analysis.add_edge(edge_id, edge['data']['source'], edge['data']['target'])
+    # Step 4: Deleted nodes
+    for node_id in patch.touched_nodes:
+        if patch.index.node(node_id) is None:
+            analysis.remove_node(node_id)
+    cached[0] = handle['version']
+
+def loads_key(graph_data):
+    """
+    Returns the content key of the loads of the graph behind a graph-data value.
+    
+    The keys of server-side sessions are remembered per session version (see
+    AnalysisCache), so repeated lookups of the same version do not hash the graph
+    again.
+    
+    Args:
+        graph_data (dict): Graph data, or a server-side session handle
+        
+    Returns:
+        str: Key over the topology and the node properties of the graph
+    """
+    if graph_store is None or 'session' not in graph_data:
+        return analysis_cache.loads_key(graph_data, GRAVITY)
+    return analysis_cache.loads_key(resolve_graph(graph_data), GRAVITY,
+                                    version=(graph_data['session'], graph_data.get('version')))
+
+def subassembly_loads(graph_data):
+    """
+    Returns the loads of every sub-assembly of the graph behind a graph-data value.
+    
+    They are computed for all nodes at once and cached by the content of the
+    graph, so moving, collapsing or expanding nodes keeps them; only edits of the
+    connections or node properties compute them again.
+    
+    Args:
+        graph_data (dict): Graph data, or a server-side session handle
+        
+    Returns:
+        SubassemblyLoads: Totals of every sub-assembly
+    """
+    return analysis_cache.memoize('subassembly', loads_key(graph_data),
+                                  lambda: SubassemblyLoads(resolve_graph(graph_data)),
+                                  persist=False)
 
-# Callback to update cytoscape with stored data while preserving positions
+def subassembly_summary(graph_data, node_id):
+    """
+    Describes the collapsed sub-assembly of a node.
+    
+    Args:
+        graph_data (dict): Graph data, or a server-side session handle
+        node_id (str): ID of the collapsed node
+        
+    Returns:
+        html.Div: Component count, total mass, and the resultant force and moment
+            transferred by the sub-assembly (moment about the node's origin)
+    """
+    if graph_store is None or 'session' not in graph_data:
+        summary = subassembly_loads(graph_data).summary(node_id)
+    else:
+        # Server-side sessions keep their totals up to date edit by edit
+        with graph_store.session(graph_data['session']):
+            summary = session_analysis(graph_data).subassembly(node_id)
+    if summary is None:
+        return ''
+    vector = lambda values: ', '.join(f'{value:.4g}' for value in values)
+    return html.Div([
+        html.B(f"Sub-assembly {node_id} (collapsed)"),
+        html.Div(f"Components: {summary['nodes']}, total mass: {summary['mass']:.6g} kg"),
+        html.Div(f"Force (N): [{vector(summary['force'])}]"),
+        html.Div(f"Moment (N·m): [{vector(summary['moment'])}]")
+    ])
+
+# Callback to collapse or expand the sub-assembly of the selected node
+@app.callback(
+    GRAPH_OUTPUTS +
+    [Output('subassembly-summary', 'children', allow_duplicate=True)],
+    Input('toggle-subassembly-btn', 'n_clicks'),
+    State('selected-node', 'data'),
+    State('graph-data', 'data'),
+    prevent_initial_call=True
+)
+@session_callback('graph_data', edit=True)
+def toggle_subassembly(n_clicks, selected_node_id, graph_data):
+    """
+    Collapses the sub-assembly of the selected node, or expands it by one level.
+    
+    A collapsed node stands for itself and every node transferring load into it.
+    Expanding shows only its direct contributors; those with contributors of their
+    own are collapsed in turn, so the number of elements shown stays small.
+    
+    Args:
+        n_clicks (int): Number of times the collapse/expand button has been clicked
+        selected_node_id (str): ID of the selected node
+        graph_data (dict): Current graph data
+        
+    Returns:
+        list: Patches for the graph data and its views, followed by the summary
+            of the collapsed sub-assembly (or a status message)
+    """
+    if not n_clicks or not selected_node_id:
+        return NO_GRAPH_UPDATE + [dash.no_update]
+    
+    patch = GraphPatch(graph_data, track_view=True)
+    node_index = patch.index.node_position(selected_node_id)
+    if node_index is None:
+        return NO_GRAPH_UPDATE + ["Select a node to collapse or expand."]
+    contributors = direct_contributors(patch.index, selected_node_id)
+    if not contributors:
+        return NO_GRAPH_UPDATE + [f"{selected_node_id} has no contributors to collapse."]
+    
+    node_data = patch.graph['nodes'][node_index]['data'].copy()
+    collapse = not node_data.pop('collapsed', False)
+    if collapse:
+        node_data['collapsed'] = True
+    patch.update_node(node_index, node_data)
+    if not collapse:
+        # Expand one level: contributors with contributors of their own stay collapsed
+        for contributor_id in contributors:
+            contributor_index = patch.index.node_position(contributor_id)
+            if contributor_index is None or not direct_contributors(patch.index, contributor_id):
+                continue
+            contributor_data = patch.graph['nodes'][contributor_index]['data'].copy()
+            if not contributor_data.get('collapsed'):
+                contributor_data['collapsed'] = True
+                patch.update_node(contributor_index, contributor_data)
+    
+    outputs = patch.outputs()
+    summary = subassembly_summary(outputs[0] if patch.server_side else patch.graph,
+                                  selected_node_id) if collapse else ''
+    return outputs + [summary]
+
+# Show the summary of a collapsed sub-assembly when its node is selected. Only
+# selections of collapsed nodes (and the next one after them) reach the server.
+app.clientside_callback(
+    ClientsideFunction(namespace='loadpath', function_name='subassemblyRequest'),
+    Output('subassembly-request', 'data'),
+    Input('cytoscape', 'tapNodeData'),
+    State('subassembly-request', 'data'),
+    prevent_initial_call=True
+)
+
+@app.callback(
+    Output('subassembly-summary', 'children'),
+    Input('subassembly-request', 'data'),
+    State('graph-data', 'data'),
+    prevent_initial_call=True
+)
+@session_callback('graph_data')
+def show_subassembly(node_id, graph_data):
+    """
+    Shows the summary of the selected collapsed sub-assembly.
+    
+    Args:
+        node_id (str): ID of the selected collapsed node (None: clear the summary)
+        graph_data (dict): Current graph data
+        
+    Returns:
+        html.Div or str: Sub-assembly summary
+    """
+    if not node_id:
+        return ''
+    return subassembly_summary(graph_data, node_id)
+
+# Layouts of the most recently laid out topologies (see graph_layout)
+layout_cache = LayoutCache()
+
+# Callback to lay out the whole graph
+@app.callback(
+    [Output('graph-data', 'data', allow_duplicate=True),
+     Output('graph-reset', 'data', allow_duplicate=True)],
+    Input('layout-btn', 'n_clicks'),
+    State('graph-reset', 'data'),
+    State('graph-data', 'data'),
+    prevent_initial_call=True
+)
+@session_callback('graph_data', edit=True)
+def auto_layout(n_clicks, reset, graph_data):
+    """
+    Places every node with the layered layout: grounded nodes on the bottom layer
+    and every component one layer above the component it transfers load into.
+    
+    Layouts are cached by graph topology, so laying out an unchanged graph again
+    (e.g. after nodes were moved by hand) only costs a hash.
+    
+    Args:
+        n_clicks (int): Number of times the layout button has been clicked
+        reset (int): Graph reset counter, bumped so that all views are rebuilt
+        graph_data (dict): Current graph data, or its server-side session handle
+        
+    Returns:
+        tuple: (Laid out graph data (or session handle), New reset counter)
+    """
+    if not n_clicks:
+        return dash.no_update, dash.no_update
+    graph = resolve_graph(graph_data)
+    apply_positions(graph, layered_layout(graph, cache=layout_cache))
+    return store_graph(graph_data, graph), (reset or 0) + 1
+
+# Callback to rebuild cytoscape from stored data
 @app.callback(
     Output('cytoscape', 'elements'),
-    [Input('graph-data', 'data')],
-    [State('cytoscape', 'elements')]
+    [Input('graph-reset', 'data')],
+    [State('graph-data', 'data')]
 )
-def update_cytoscape(data, current_elements):
+@session_callback('data')
+def update_cytoscape(reset, data):
     """
-    Updates the Cytoscape visualization while preserving node positions.
+    Rebuilds the Cytoscape visualization from the graph data.
+    
+    Only runs when graph-data is replaced as a whole; individual edits patch the
+    elements directly (see GraphPatch). Node positions come from the graph data,
+    which is kept up to date when nodes are moved (see store_node_positions).
+    Nodes inside collapsed sub-assemblies are left out. Large graphs are drawn by
+    draw_large_graph instead.
     
     Args:
+        reset (int): Graph reset counter
         data (dict): Current graph data containing nodes and edges
-        current_elements (list): Current Cytoscape elements with positions
         
     Returns:
         list: Updated elements for Cytoscape visualization
         
     The function:
-    1. Preserves node positions from current layout
-    2. Ensures node IDs match their names
-    3. Validates and includes only edges between existing nodes
-    4. Maintains consistent edge IDs
-    """
-    # Create a dictionary of current node positions
-    current_positions = {}
-    if current_elements:
-        for element in current_elements:
-            if 'position' in element and 'data' in element and 'id' in element['data']:
-                current_positions[element['data']['id']] = element['position']
-    
-    # Create new elements with preserved positions
+    1. Ensures node IDs match their names
+    2. Validates and includes only edges between existing nodes
+    3. Maintains consistent edge IDs
+    """
+    data = visible_graph(resolve_graph(data))
+    if is_large_graph(data, LARGE_GRAPH_OPTIONS['threshold']):
+        return dash.no_update
+    
     elements = []
     
     # First add all nodes
@@ -424,12 +1249,7 @@ def update_cytoscape(data, current_elements):
         if 'id' not in node_copy['data']:
             node_copy['data']['id'] = node_copy['data']['name']
         
-        node_id = node_copy['data']['id']
-        node_ids.add(node_id)  # Add to valid node ids set
-        
-        # If we have a stored position for this node, use it
-        if node_id in current_positions:
-            node_copy['position'] = current_positions[node_id]
+        node_ids.add(node_copy['data']['id'])  # Add to valid node ids set
         elements.append(node_copy)
     
     # Then add edges only between existing nodes
@@ -447,46 +1267,130 @@ def update_cytoscape(data, current_elements):
     
     return elements
 
-# Store node positions when they are moved
-@app.callback(
+# Track node positions in the browser: only the coordinates of moved nodes are
+# reported (see assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='loadpath', function_name='storeNodePositions'),
     Output('node-positions', 'data'),
-    Input('cytoscape', 'tapNodeData'),
-    Input('cytoscape', 'mouseoverNodeData'),
-    Input('cytoscape', 'elements'),  # Add elements as a direct input to trigger on element changes
+    Output('position-changes', 'data'),
+    Input('cytoscape', 'elements'),
+    State('graph-reset', 'data'),
     State('node-positions', 'data')
 )
-def store_node_positions(tap_data, mouseover_data, elements, positions):
+
+# Write moved node positions into graph-data, so that positions are kept on
+# rebuilds and exports. Graph data kept in the browser is updated there; the
+# server-side store only receives the moved nodes.
+if graph_store is None:
+    app.clientside_callback(
+        ClientsideFunction(namespace='loadpath', function_name='applyNodePositions'),
+        Output('graph-data', 'data', allow_duplicate=True),
+        Input('position-changes', 'data'),
+        State('graph-data', 'data'),
+        prevent_initial_call=True
+    )
+else:
+    @app.callback(
+        Output('graph-data', 'data', allow_duplicate=True),
+        Input('position-changes', 'data'),
+        State('graph-data', 'data'),
+        prevent_initial_call=True
+    )
+    @session_callback('graph_data')
+    def store_node_positions(changes, graph_data):
+        """
+        Stores the positions of moved nodes in the server-side graph.
+        
+        Positions are applied by node ID and are already shown in the browser, so
+        they are stored whatever version the handle is at and keep the version:
+        moving nodes never makes a following edit outdated.
+        
+        Args:
+            changes (dict): New positions ({'x', 'y'}) of the moved nodes by node ID
+            graph_data (dict): Server-side session handle
+            
+        Returns:
+            dash.no_update: The session handle is unchanged
+        """
+        if not changes or 'session' not in graph_data:
+            return dash.no_update
+        session_id = graph_data['session']
+        index = graph_index(graph_data)
+        nodes = index.graph['nodes']
+        for node_id, position in changes.items():
+            node_index = index.node_position(node_id)
+            if node_index is not None:  # deleted in the meantime
+                nodes[node_index]['position'] = {'x': position['x'], 'y': position['y']}
+        graph_store.put(session_id, index.graph, version=graph_store.version(session_id))
+        return dash.no_update
+
+# Draw large graphs in the level-of-detail view, following the viewport. Graph data
+# kept in the browser is drawn there; with the server-side store only the viewport
+# of a large graph is sent and the visible elements come back.
+@session_callback('graph_data')
+def draw_large_graph(graph_data, viewport, large):
     """
-    Stores the current positions of all nodes in the graph.
+    Draws the part of a large graph inside the viewport (server-side store only).
+    
+    Nodes hidden in collapsed sub-assemblies are neither drawn nor counted.
     
     Args:
-        tap_data (dict): Data from node tap event
-        mouseover_data (dict): Data from node mouseover event
-        elements (list): Current Cytoscape elements
-        positions (dict): Current stored positions
+        graph_data (dict): Server-side session handle
+        viewport (dict): Viewport extent in model coordinates (None: whole graph)
+        large (bool): Whether the level-of-detail view is currently shown
         
     Returns:
-        dict: Updated positions dictionary mapping node IDs to their positions
-    """
-    # This callback captures positions from elements when interactions happen
-    # or when elements are updated
-    if elements:
-        positions = {}  # Reset positions to avoid stale data
-        for element in elements:
-            if 'position' in element and 'data' in element and 'id' in element['data']:
-                # Store positions by ID, not by name
-                positions[element['data']['id']] = element['position']
-    return positions
+        tuple: (Cytoscape elements, Whether the level-of-detail view is shown)
+    """
+    data = visible_graph(resolve_graph(graph_data))
+    if is_large_graph(data, LARGE_GRAPH_OPTIONS['threshold']):
+        options = LARGE_GRAPH_OPTIONS
+        return level_of_detail(data, viewport, options['detail_nodes'], options['grid'],
+                               options['margin']), True
+    if not large:
+        return dash.no_update, dash.no_update  # small graphs are patched directly
+    # Back below the threshold: draw every element again
+    return update_cytoscape(None, graph_data), False
+
+if graph_store is None:
+    app.clientside_callback(
+        ClientsideFunction(namespace='loadpath', function_name='drawLargeGraph'),
+        Output('cytoscape', 'elements', allow_duplicate=True),
+        Output('large-graph', 'data'),
+        Input('graph-data', 'data'),
+        Input('cytoscape', 'extent'),
+        State('large-graph-options', 'data'),
+        State('large-graph', 'data'),
+        prevent_initial_call=True
+    )
+else:
+    # Only viewport changes of large graphs reach the server
+    app.clientside_callback(
+        ClientsideFunction(namespace='loadpath', function_name='largeGraphViewport'),
+        Output('viewport', 'data'),
+        Input('cytoscape', 'extent'),
+        State('large-graph', 'data'),
+        prevent_initial_call=True
+    )
+    app.callback(
+        Output('cytoscape', 'elements', allow_duplicate=True),
+        Output('large-graph', 'data'),
+        Input('graph-data', 'data'),
+        Input('viewport', 'data'),
+        State('large-graph', 'data'),
+        prevent_initial_call=True
+    )(draw_large_graph)
 
 # Callback to handle node connections
 @app.callback(
-    [Output('graph-data', 'data', allow_duplicate=True),
-     Output('click-data', 'children')],
+    GRAPH_OUTPUTS +
+    [Output('click-data', 'children')],
     Input('cytoscape', 'tapNodeData'),
     State('click-data', 'children'),
     State('graph-data', 'data'),
     prevent_initial_call=True
 )
+@session_callback('graph_data', edit=True)
 def handle_node_click(node_data, click_state, graph_data):
     """
     Handles node click events for creating connections between nodes.
@@ -497,59 +1401,52 @@ def handle_node_click(node_data, click_state, graph_data):
         graph_data (dict): Current graph data
         
     Returns:
-        tuple: (Updated graph data, Status message)
+        list: Patches for the graph data and its views, followed by a status message
         
     The function:
     1. Manages the two-click process for creating edges
-    2. Validates node existence and prevents self-loops
+    2. Validates node existence and prevents self-loops and load path loops
     3. Handles edge recreation and updates
     4. Maintains sequential edge IDs (e0, e1, etc.)
     """
     if not node_data or 'id' not in node_data:
-        return dash.no_update, dash.no_update
+        return NO_GRAPH_UPDATE + [dash.no_update]
         
     clicked_id = node_data['id']
+    if clicked_id.startswith(CLUSTER_PREFIX):
+        return NO_GRAPH_UPDATE + ["Zoom in to select a node of this cluster."]
+    patch = GraphPatch(graph_data)
     
     # Verify the clicked node exists in the graph data
-    node_exists = any(node['data']['id'] == clicked_id for node in graph_data['nodes'])
-    if not node_exists:
-        return graph_data, "Node no longer exists. Click a valid node."
+    if patch.index.node(clicked_id) is None:
+        return NO_GRAPH_UPDATE + ["Node no longer exists. Click a valid node."]
     
     if not click_state or 'First node:' not in click_state:
-        return graph_data, f"First node: {clicked_id}. Click another node to create connection."
+        return NO_GRAPH_UPDATE + [f"First node: {clicked_id}. Click another node to create connection."]
     else:
         first_id = click_state.split(': ')[1].split('.')[0]
         
         # Verify first node still exists
-        first_node_exists = any(node['data']['id'] == first_id for node in graph_data['nodes'])
-        if not first_node_exists:
-            return graph_data, f"First node no longer exists. New first node: {clicked_id}. Click another node to create connection."
+        if patch.index.node(first_id) is None:
+            return NO_GRAPH_UPDATE + [f"First node no longer exists. New first node: {clicked_id}. Click another node to create connection."]
         
         # Don't create self-loops
         if first_id == clicked_id:
-            return graph_data, f"Cannot connect a node to itself. First node: {clicked_id}. Click another node to create connection."
+            return NO_GRAPH_UPDATE + [f"Cannot connect a node to itself. First node: {clicked_id}. Click another node to create connection."]
         
-        # Get existing edges between these nodes
-        existing_edges = [edge for edge in graph_data['edges'] 
-                         if (edge['data']['source'] == first_id and edge['data']['target'] == clicked_id) or
-                            (edge['data']['source'] == clicked_id and edge['data']['target'] == first_id)]
+        # Don't close a load path loop (existing edges between the nodes are replaced)
+        replaced = patch.index.edges_between(first_id, clicked_id)
+        loop = closing_path(patch.index, first_id, clicked_id, ignore=replaced)
+        if loop is not None:
+            return NO_GRAPH_UPDATE + [f"Cannot connect {first_id} to {clicked_id}: load already flows from "
+                                      f"{clicked_id} to {first_id} ({', '.join(loop)}), so the connection "
+                                      f"would close a loop. Click a node to start new connection."]
         
         # Remove any existing edges between these nodes
-        if existing_edges:
-            graph_data['edges'] = [edge for edge in graph_data['edges'] if edge not in existing_edges]
-        
-        # Find the highest existing edge number
-        max_edge_num = -1
-        for edge in graph_data['edges']:
-            if 'id' in edge['data'] and edge['data']['id'].startswith('e'):
-                try:
-                    edge_num = int(edge['data']['id'][1:])
-                    max_edge_num = max(max_edge_num, edge_num)
-                except ValueError:
-                    continue
+        patch.delete_edges([patch.index.edge_position(edge_id) for edge_id in replaced])
         
         # Create new edge with next sequential ID
-        edge_id = f'e{max_edge_num + 1}'
+        edge_id = patch.index.next_edge_id()
         new_edge = {
             'data': {
                 'id': edge_id,
@@ -559,46 +1456,61 @@ def handle_node_click(node_data, click_state, graph_data):
         }
         
         # Add the new edge
-        graph_data['edges'].append(new_edge)
-        return graph_data, "Connection created. Click a node to start new connection."
+        patch.add_edge(new_edge)
+        return patch.outputs() + ["Connection created. Click a node to start new connection."]
 
-# Callback to display connection list
-@app.callback(
-    Output('connection-list', 'children'),
-    Input('graph-data', 'data')
-)
-def update_connection_list(data):
+# Callback to rebuild the connection table
+@session_callback('graph_data')
+def update_connection_list(graph_data, page_current, page_size, sort_by, filter_query):
     """
-    Updates the displayed list of connections in the UI.
+    Returns one page of the connection table (server-side store only).
+    
+    Runs whenever the session handle changes, i.e. after every edit, and when the
+    table is paged, filtered or sorted. Only the rows of the visible page are sent.
     
     Args:
-        data (dict): Current graph data
+        graph_data (dict): Server-side session handle
+        page_current (int): Requested page
+        page_size (int): Rows per page
+        sort_by (list): Sort columns and directions
+        filter_query (str): Filter expression of the table
         
     Returns:
-        dash component: HTML component showing the list of connections
-        
-    Format: edge_id: source_node → target_node
+        tuple: (Rows of the page, Number of pages, Page shown)
     """
-    if not data['edges']:
-        return "No connections yet"
-        
-    connections = [
-        html.Li(f"{edge['data']['id']}: {edge['data']['source']} → {edge['data']['target']}")
-        for edge in data['edges']
-    ]
-    return html.Div([
-        html.H3("Connections:"),
-        html.Ul(connections)
-    ])
+    edges = resolve_graph(graph_data)['edges']
+    return query_table(len(edges), lambda i: connection_row(edges[i]['data']),
+                       page_current, page_size, sort_by, filter_query)
+
+if graph_store is None:
+    # The browser has every row and pages, filters and sorts them itself
+    app.clientside_callback(
+        ClientsideFunction(namespace='loadpath', function_name='connectionRows'),
+        Output('connection-table', 'data'),
+        Input('graph-reset', 'data'),
+        State('graph-data', 'data')
+    )
+else:
+    app.callback(
+        Output('connection-table', 'data'),
+        Output('connection-table', 'page_count'),
+        Output('connection-table', 'page_current'),
+        Input('graph-data', 'data'),
+        Input('connection-table', 'page_current'),
+        Input('connection-table', 'page_size'),
+        Input('connection-table', 'sort_by'),
+        Input('connection-table', 'filter_query')
+    )(update_connection_list)
 
 # Callback to handle connection deletion
 @app.callback(
-    [Output('graph-data', 'data', allow_duplicate=True),
-     Output('click-data', 'children', allow_duplicate=True)],
+    GRAPH_OUTPUTS +
+    [Output('click-data', 'children', allow_duplicate=True)],
     Input('cytoscape', 'tapEdgeData'), 
     State('graph-data', 'data'),
     prevent_initial_call=True
 )
+@session_callback('graph_data', edit=True)
 def delete_connection(edge_data, graph_data):
     """
     Deletes a selected edge from the graph.
@@ -608,21 +1520,22 @@ def delete_connection(edge_data, graph_data):
         graph_data (dict): Current graph data
         
     Returns:
-        tuple: (Updated graph data, Status message)
+        list: Patches for the graph data and its views, followed by a status message
     """
     if not edge_data or 'id' not in edge_data:
-        return dash.no_update, dash.no_update
+        return NO_GRAPH_UPDATE + [dash.no_update]
         
     # Delete by edge ID
-    graph_data['edges'] = [edge for edge in graph_data['edges'] 
-                         if edge['data'].get('id') != edge_data['id']]
+    patch = GraphPatch(graph_data)
+    edge_index = patch.index.edge_position(edge_data['id'])
+    patch.delete_edges([] if edge_index is None else [edge_index])
     
     # Return updated message to confirm deletion
-    return graph_data, "Connection deleted. Click a node to start new connection."
+    return patch.outputs() + ["Connection deleted. Click a node to start new connection."]
 
 # Callback to update node properties
 @app.callback(
-    Output('graph-data', 'data', allow_duplicate=True),
+    GRAPH_OUTPUTS,
     Input('update-node-btn', 'n_clicks'),
     [State('select-node-dropdown', 'value'),  # Get currently selected node
      State('node-name-input', 'value')] +
@@ -634,10 +1547,10 @@ def delete_connection(edge_data, graph_data):
       'euler-x', 'euler-y', 'euler-z',
       'trans-x', 'trans-y', 'trans-z']] +
     [State('rotation-order', 'value'),
-     State('graph-data', 'data'),
-     State('cytoscape', 'elements')],
+     State('graph-data', 'data')],
     prevent_initial_call=True
 )
+@session_callback('graph_data', edit=True)
 def update_node_properties(n_clicks, selected_node_id, new_name,
                          mass, 
                          cog_x, cog_y, cog_z,
@@ -645,7 +1558,7 @@ def update_node_properties(n_clicks, selected_node_id, new_name,
                          moment_x, moment_y, moment_z,
                          euler_x, euler_y, euler_z,
                          trans_x, trans_y, trans_z,
-                         rotation_order, graph_data, elements):
+                         rotation_order, graph_data):
     """
     Updates the properties of a selected node.
     
@@ -656,142 +1569,107 @@ def update_node_properties(n_clicks, selected_node_id, new_name,
         *args: Various node properties (mass, position, rotation, forces, etc.)
         
     Returns:
-        dict: Updated graph data
+        list: Patches for the graph data and its views
         
     The function:
     1. Updates node name and ID
     2. Updates mechanical properties
-    3. Preserves node position
+    3. Leaves the node position untouched (only node data is patched)
     4. Updates edge references if node name changes
     """
     if not selected_node_id:
-        return dash.no_update
+        return NO_GRAPH_UPDATE
     
-    # Get current positions from elements
-    current_positions = {}
-    for element in elements:
-        if 'position' in element and 'data' in element and 'id' in element['data']:
-            current_positions[element['data']['id']] = element['position']
+    patch = GraphPatch(graph_data)
     
     # Find the node in graph_data
-    for node in graph_data['nodes']:
-        if node['data']['id'] == selected_node_id:
-            # Preserve the node's position
-            if selected_node_id in current_positions and 'position' in node:
-                node['position'] = current_positions[selected_node_id]
-                
-            # Use new_name if provided, otherwise keep existing name
-            if new_name and new_name != node['data']['name']:
-                # If the name changes, we need to update all edges referencing this node
-                for edge in graph_data['edges']:
-                    if edge['data']['source'] == selected_node_id:
-                        edge['data']['source'] = new_name
-                    if edge['data']['target'] == selected_node_id:
-                        edge['data']['target'] = new_name
-                
-                # Update the node ID to match the new name
-                node['data']['id'] = new_name
-                
-            # Update all properties
-            node['data'].update({
-                'name': new_name if new_name else node['data']['name'],
-                'mass': float(mass) if mass is not None else 0,
-                'cog': [float(x) if x is not None else 0 for x in [cog_x, cog_y, cog_z]],
-                'external_force': [float(x) if x is not None else 0 for x in [force_x, force_y, force_z]],
-                'moment': [float(x) if x is not None else 0 for x in [moment_x, moment_y, moment_z]],
-                'euler_angles': [float(x) if x is not None else 0 for x in [euler_x, euler_y, euler_z]],
-                'rotation_order': rotation_order if rotation_order else 'xyz',
-                'translation': [float(x) if x is not None else 0 for x in [trans_x, trans_y, trans_z]]
-            })
-            break
+    index = patch.index.node_position(selected_node_id)
+    if index is not None:
+        node_data = patch.graph['nodes'][index]['data'].copy()
+        # Use new_name if provided, otherwise keep existing name
+        if new_name and new_name != node_data['name']:
+            # If the name changes, we need to update all edges referencing this node
+            for edge_id in patch.index.edges_of(selected_node_id):
+                i = patch.index.edge_position(edge_id)
+                edge_data = patch.graph['edges'][i]['data'].copy()
+                if edge_data['source'] == selected_node_id:
+                    edge_data['source'] = new_name
+                if edge_data['target'] == selected_node_id:
+                    edge_data['target'] = new_name
+                patch.update_edge(i, edge_data)
             
-    return graph_data
-
-# Callback to update node properties table
-@app.callback(
-    Output('node-properties-table', 'data'),
-    Input('graph-data', 'data')
-)
-def update_node_properties_table(data):
-    table_data = []
-    for node in data['nodes']:
-        node_data = node['data']
-        table_data.append({
-            'name': node_data['name'],
-            'mass': node_data['mass'],
-            'cog_x': node_data['cog'][0],
-            'cog_y': node_data['cog'][1],
-            'cog_z': node_data['cog'][2],
-            'force_x': node_data['external_force'][0],
-            'force_y': node_data['external_force'][1],
-            'force_z': node_data['external_force'][2],
-            'moment_x': node_data['moment'][0],
-            'moment_y': node_data['moment'][1],
-            'moment_z': node_data['moment'][2],
-            'euler_x': node_data['euler_angles'][0],
-            'euler_y': node_data['euler_angles'][1],
-            'euler_z': node_data['euler_angles'][2],
-            'rotation_order': node_data['rotation_order'],
-            'trans_x': node_data['translation'][0],
-            'trans_y': node_data['translation'][1],
-            'trans_z': node_data['translation'][2]
+            # Update the node ID to match the new name
+            node_data['id'] = new_name
+            
+        # Update all properties
+        node_data.update({
+            'name': new_name if new_name else node_data['name'],
+            'mass': float(mass) if mass is not None else 0,
+            'cog': [float(x) if x is not None else 0 for x in [cog_x, cog_y, cog_z]],
+            'external_force': [float(x) if x is not None else 0 for x in [force_x, force_y, force_z]],
+            'moment': [float(x) if x is not None else 0 for x in [moment_x, moment_y, moment_z]],
+            'euler_angles': [float(x) if x is not None else 0 for x in [euler_x, euler_y, euler_z]],
+            'rotation_order': rotation_order if rotation_order else 'xyz',
+            'translation': [float(x) if x is not None else 0 for x in [trans_x, trans_y, trans_z]]
         })
-    return table_data
+        patch.update_node(index, node_data)
+            
+    return patch.outputs()
 
-# Function to format JSON with compact arrays
-def format_json_compact_arrays(json_str):
+# Callback to rebuild node properties table
+@session_callback('graph_data')
+def update_node_properties_table(graph_data, page_current, page_size, sort_by, filter_query):
     """
-    Formats JSON string to make arrays more compact and readable.
+    Returns one page of the node properties table (server-side store only).
     
     Args:
-        json_str (str): JSON string to format
+        graph_data (dict): Server-side session handle
+        page_current (int): Requested page
+        page_size (int): Rows per page
+        sort_by (list): Sort columns and directions
+        filter_query (str): Filter expression of the table
         
     Returns:
-        str: Formatted JSON string with compact arrays
-        
-    The function:
-    1. Identifies array patterns in the JSON
-    2. Compacts multi-line arrays into single lines
-    3. Preserves proper indentation for objects
-    """
-    # Use regex to find arrays and compact them
-    # This pattern looks for array patterns with newlines and extra spaces
-    pattern = r'\[\s*\n\s*([^][]*?)\s*\n\s*\]'
-    
-    # Function to process each match
-    def compact_array(match):
-        # Get the content of the array
-        content = match.group(1)
-        # Split by comma and newline, then clean each element
-        elements = re.split(r',\s*\n\s*', content)
-        elements = [elem.strip() for elem in elements]
-        # Rejoin with comma and space
-        return f"[{', '.join(elements)}]"
-    
-    # Apply the pattern repeatedly until no more changes
-    prev_json = ""
-    while prev_json != json_str:
-        prev_json = json_str
-        json_str = re.sub(pattern, compact_array, json_str, flags=re.DOTALL)
-    
-    return json_str
+        tuple: (Rows of the page, Number of pages, Page shown)
+    """
+    nodes = resolve_graph(graph_data)['nodes']
+    return query_table(len(nodes), lambda i: node_table_row(nodes[i]['data']),
+                       page_current, page_size, sort_by, filter_query)
+
+if graph_store is None:
+    app.clientside_callback(
+        ClientsideFunction(namespace='loadpath', function_name='nodeTableRows'),
+        Output('node-properties-table', 'data'),
+        Input('graph-reset', 'data'),
+        State('graph-data', 'data')
+    )
+else:
+    app.callback(
+        Output('node-properties-table', 'data'),
+        Output('node-properties-table', 'page_count'),
+        Output('node-properties-table', 'page_current'),
+        Input('graph-data', 'data'),
+        Input('node-properties-table', 'page_current'),
+        Input('node-properties-table', 'page_size'),
+        Input('node-properties-table', 'sort_by'),
+        Input('node-properties-table', 'filter_query')
+    )(update_node_properties_table)
 
 # Callback to export graph data to JSON
 @app.callback(
     Output('download-json', 'data'),
     Input('export-json-btn', 'n_clicks'),
     State('graph-data', 'data'),
-    State('cytoscape', 'elements'),  # Add elements state to get current positions
     prevent_initial_call=True
 )
-def export_json(n_clicks, data, elements):
+@session_callback('data')
+def export_json(n_clicks, data):
     """
     Exports the current graph to a JSON file.
     
     Args:
         n_clicks (int): Number of times the export button has been clicked
-        data (dict): Current graph data
-        elements (list): Current Cytoscape elements
+        data (dict): Current graph data (node positions included)
         
     Returns:
         dict: Dictionary containing the formatted JSON content and filename
@@ -809,24 +1687,19 @@ def export_json(n_clicks, data, elements):
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"load_path_data_{timestamp}.json"
     
-    # Get current positions from cytoscape elements
-    current_positions = {}
-    if elements:
-        for element in elements:
-            if 'position' in element and 'data' in element and 'id' in element['data']:
-                current_positions[element['data']['id']] = element['position']
-    
     # Clean up the data structure before export
     export_data = {'nodes': [], 'edges': []}
     
+    data = resolve_graph(data)
+    
     # Process nodes with current positions
     for node in data['nodes']:
         node_data = node['data'].copy()
         # Make sure node ID is the same as name to keep things consistent
         node_data['id'] = node_data['name']
         
-        # Get current position from cytoscape if available
-        position = current_positions.get(node_data['id'], {'x': 0, 'y': 0})
+        # Current position (kept up to date when nodes are moved)
+        position = node.get('position') or {'x': 0, 'y': 0}
         
         export_data['nodes'].append({
             'data': node_data,
@@ -843,124 +1716,91 @@ def export_json(n_clicks, data, elements):
             'data': edge_data
         })
     
-    # First generate the JSON with standard formatting
-    json_str = json.dumps(export_data, indent=2)
-    
-    # Then apply our custom formatting to compact arrays
-    formatted_json = format_json_compact_arrays(json_str)
+    # Generate the JSON with compact arrays in a single pass (see graph_json)
+    formatted_json = dumps_json(export_data)
     
     return dict(
         content=formatted_json,
         filename=filename
     )
 
+def import_message(filename, graph_data):
+    """
+    Returns the import status message, with a warning for every structural problem
+    of the imported load path (loops, several or no ground points, see load_validation).
+    """
+    lines = [html.Div(f"Successfully imported {filename}")]
+    for problem in validate_load_path(graph_data)['problems']:
+        lines.append(html.Div(f"Warning: {problem}", style={'color': 'darkorange'}))
+    return html.Div(lines)
+
 # Callback to import graph data from JSON
 @app.callback(
     [Output('graph-data', 'data', allow_duplicate=True),
+     Output('graph-reset', 'data'),
      Output('json-output', 'children')],
     Input('upload-json', 'contents'),
     State('upload-json', 'filename'),
+    State('graph-reset', 'data'),
+    State('graph-data', 'data'),
     prevent_initial_call=True
 )
-def import_json(contents, filename):
+# An import replaces the whole graph, so it is not rejected as outdated
+@session_callback('graph_data')
+def import_json(contents, filename, reset, graph_data):
     """
-    Imports graph data from a JSON file.
+    Imports graph data from a JSON file or a binary model file.
     
     Args:
         contents (str): Base64 encoded file contents
         filename (str): Name of the uploaded file
+        reset (int): Graph reset counter, bumped so that all views are rebuilt
+        graph_data (dict): Current graph data, or its server-side session handle
         
     Returns:
-        tuple: (Processed graph data, Status message)
+        tuple: (Processed graph data (or session handle), New reset counter, Status message)
         
     The function:
-    1. Decodes and validates JSON data
+    1. Decodes and parses the upload incrementally
     2. Processes nodes with all required properties
-    3. Preserves node positions from the file
-    4. Validates and processes edges
+    3. Preserves node positions from the file and lays out nodes without one
+    4. Validates and processes edges, and warns about load path loops
     5. Ensures ID consistency
     """
     if contents is None:
-        return dash.no_update, dash.no_update
-    
-    content_type, content_string = contents.split(',')
+        return dash.no_update, dash.no_update, dash.no_update
     
     try:
-        if 'json' in filename:
-            # Decode the base64 string
-            import base64
-            decoded = base64.b64decode(content_string).decode('utf-8')
-            imported_data = json.loads(decoded)
-            
-            # Process the imported data
-            processed_data = {'nodes': [], 'edges': []}
-            
-            # Process nodes
-            for node in imported_data['nodes']:
-                node_data = node['data'].copy()
-                
-                # Make sure ID exists and is the same as name for consistency
-                if 'name' in node_data:
-                    node_data['id'] = node_data['name']
-                
-                # Ensure all required fields exist with default values
-                if 'color' not in node_data:
-                    node_data['color'] = random.choice(['#FF4136', '#2ECC40', '#0074D9', '#FF851B', '#B10DC9'])
-                if 'mass' not in node_data:
-                    node_data['mass'] = 0
-                if 'cog' not in node_data:
-                    node_data['cog'] = [0, 0, 0]
-                if 'external_force' not in node_data:
-                    node_data['external_force'] = [0, 0, 0]
-                if 'moment' not in node_data:
-                    node_data['moment'] = [0, 0, 0]
-                if 'euler_angles' not in node_data:
-                    node_data['euler_angles'] = [0, 0, 0]
-                if 'rotation_order' not in node_data:
-                    node_data['rotation_order'] = 'xyz'
-                if 'translation' not in node_data:
-                    node_data['translation'] = [0, 0, 0]
-                
-                # Preserve the exact position from the imported data
-                position = node.get('position', {'x': random.uniform(100, 800), 'y': random.uniform(100, 500)})
-                processed_data['nodes'].append({
-                    'data': node_data,
-                    'position': position
-                })
-            
-            # Create a set of valid node IDs
-            valid_node_ids = {node['data']['id'] for node in processed_data['nodes']}
-            
-            # Process edges
-            for i, edge in enumerate(imported_data['edges']):
-                edge_data = edge['data'].copy()
-                
-                # Make sure edge has an ID
-                if 'id' not in edge_data:
-                    edge_data['id'] = f'e{i}'
-                    
-                # Only add edges that connect to valid nodes
-                if edge_data['source'] in valid_node_ids and edge_data['target'] in valid_node_ids:
-                    processed_data['edges'].append({
-                        'data': edge_data
-                    })
-            
-            return processed_data, html.Div(f"Successfully imported {filename}")
+        if filename.endswith(BINARY_EXTENSION):
+            # Binary model file (see graph_binary)
+            model = read_binary(base64.b64decode(contents.split(',', 1)[1]))
+            processed_data = build_graph(model.iter_items())
+            fill_positions(processed_data, cache=layout_cache)
+            return store_graph(graph_data, processed_data), (reset or 0) + 1, import_message(filename, processed_data)
+        elif 'json' in filename:
+            # Decode and process the upload in chunks (see graph_json)
+            processed_data = read_graph_base64(contents)
+            fill_positions(processed_data, cache=layout_cache)
+            return store_graph(graph_data, processed_data), (reset or 0) + 1, import_message(filename, processed_data)
         else:
-            return dash.no_update, html.Div("Please upload a JSON file", style={'color': 'red'})
+            return dash.no_update, dash.no_update, html.Div(f"Please upload a JSON or {BINARY_EXTENSION} file", style={'color': 'red'})
     except Exception as e:
-        return dash.no_update, html.Div(f"Error processing file: {str(e)}", style={'color': 'red'})
+        return dash.no_update, dash.no_update, html.Div(f"Error processing file: {str(e)}", style={'color': 'red'})
 
-# Callback to update node dropdown options
-@app.callback(
+# Callback to rebuild node dropdown options
+@view_callback(
+    'nodeOptions',
     Output('select-node-dropdown', 'options'),
-    Input('graph-data', 'data')
+    Input('graph-reset', 'data'),
+    State('graph-data', 'data')
 )
-def update_node_dropdown(data):
-    return [{'label': node['data']['name'], 'value': node['data']['id']} for node in data['nodes']]
+@session_callback('data')
+def update_node_dropdown(reset, data):
+    return [node_option(node['data']) for node in resolve_graph(data)['nodes']]
 
 # Callback to update input fields when node is selected
-@app.callback(
+@view_callback(
+    'nodeInputFields',
     [Output('node-name-input', 'value'),
      Output('node-mass-input', 'value'),
      Output('node-trans-x-input', 'value'),
@@ -982,35 +1822,103 @@ def update_node_dropdown(data):
     Input('select-node-dropdown', 'value'),
     State('graph-data', 'data')
 )
+@session_callback('graph_data')
 def update_input_fields(selected_id, graph_data):
     if not selected_id:
         return [None] * 18  # Return None for all outputs
     
-    for node in graph_data['nodes']:
-        if node['data']['id'] == selected_id:
-            node_data = node['data']
-            return [
-                node_data['name'],
-                node_data['mass'],
-                node_data['translation'][0],
-                node_data['translation'][1],
-                node_data['translation'][2],
-                node_data['euler_angles'][0],
-                node_data['euler_angles'][1],
-                node_data['euler_angles'][2],
-                node_data['rotation_order'],
-                node_data['cog'][0],
-                node_data['cog'][1],
-                node_data['cog'][2],
-                node_data['external_force'][0],
-                node_data['external_force'][1],
-                node_data['external_force'][2],
-                node_data['moment'][0],
-                node_data['moment'][1],
-                node_data['moment'][2]
-            ]
+    node = graph_index(graph_data).node(selected_id)
+    if node is not None:
+        node_data = node['data']
+        return [
+            node_data['name'],
+            node_data['mass'],
+            node_data['translation'][0],
+            node_data['translation'][1],
+            node_data['translation'][2],
+            node_data['euler_angles'][0],
+            node_data['euler_angles'][1],
+            node_data['euler_angles'][2],
+            node_data['rotation_order'],
+            node_data['cog'][0],
+            node_data['cog'][1],
+            node_data['cog'][2],
+            node_data['external_force'][0],
+            node_data['external_force'][1],
+            node_data['external_force'][2],
+            node_data['moment'][0],
+            node_data['moment'][1],
+            node_data['moment'][2]
+        ]
     
     return [None] * 18  # Return None for all outputs if node not found
 
+# Callback to open a server-side graph session (server-side store only)
+if graph_store is not None:
+    @app.callback(
+        [Output('graph-data', 'data', allow_duplicate=True),
+         Output('graph-reset', 'data', allow_duplicate=True)],
+        Input('graph-resync', 'data'),
+        State('graph-reset', 'data'),
+        prevent_initial_call=True
+    )
+    def resync_graph(handle, reset):
+        """
+        Shows the stored graph again after an outdated edit was rejected.
+        
+        Args:
+            handle (dict): Current session handle (see session_callback)
+            reset (int): Graph reset counter, bumped so that all views are rebuilt
+            
+        Returns:
+            tuple: (Session handle, New reset counter)
+        """
+        return handle, (reset or 0) + 1
+    
+    @app.callback(
+        [Output('graph-data', 'data', allow_duplicate=True),
+         Output('graph-reset', 'data', allow_duplicate=True)],
+        Input('url', 'search'),
+        State('graph-reset', 'data'),
+        prevent_initial_call='initial_duplicate'
+    )
+    def open_session(search, reset):
+        """
+        Attaches the page to a server-side graph session.
+        
+        When the store is full (no LOAD_PATH_STORE_DB and every cached model is in
+        use), the page keeps its model in the browser instead.
+        
+        Args:
+            search (str): URL query string, optionally containing ?session=<id>
+            reset (int): Graph reset counter, bumped so that all views are rebuilt
+            
+        Returns:
+            tuple: (Session handle, New reset counter)
+        """
+        session_id = parse_qs((search or '').lstrip('?')).get('session', [None])[0]
+        if session_id:
+            try:
+                return graph_store.handle(session_id), (reset or 0) + 1
+            except SessionNotFoundError as error:
+                set_props('click-data', {'children': html.Div(
+                    f"{error}: started a new model instead.", style={'color': 'red'})})
+        try:
+            return graph_store.create(), (reset or 0) + 1
+        except StoreFullError as error:
+            set_props('click-data', {'children': html.Div(
+                f"{error}: this model is kept in the browser instead.",
+                style={'color': 'darkorange'})})
+            return dash.no_update, dash.no_update
+
+# Callback to refresh the metrics panel (metrics panel only)
+if show_metrics_panel:
+    @app.callback(
+        Output('metrics-table', 'data'),
+        Input('metrics-interval', 'n_intervals')
+    )
+    def update_metrics_panel(n_intervals):
+        return callback_metrics.summary()
+
 if __name__ == '__main__':
     app.run_server(port=r'8051', debug=True)
@@ -0,0 +1,74 @@
+"""
+Load Path Analysis Package
+
+Graph model, analysis and data format code of the Load Path Visual Tool, usable
+without the Dash application (load-visual.py):
+
+- load_graph: indexed load path graph (LoadPathGraph)
+- load_contrib: load contributors of one or every connection
+- load_transfer: NumPy engine for connection forces and moments
+- load_cases / load_parallel: batched and multi-process load case sweeps
+- load_incremental: incremental load analysis for interactive edits
+- load_cache: analysis results cached by model content
+- load_validation: loop and ground point checks
+- load_report: batch report command-line tool
+- graph_json / graph_binary / graph_columns: JSON, binary and columnar models
+- graph_index / graph_store: lookup index and server-side session store
+- graph_view / graph_hierarchy / graph_layout / table_query: large graph views,
+  collapsible sub-assemblies, automatic layout and table paging of the application
+
+The names below are imported on first access, so ``import loadpath`` (or the
+contributor analysis alone) does not load NumPy, the process pool or Dash:
+
+    >>> from loadpath import find_load_contributors      # pure Python
+    >>> from loadpath import LoadTransferModel           # imports NumPy now
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import importlib
+
+# Public name -> module that defines it
+_EXPORTS = {
+    'LoadPathGraph': 'load_graph',
+    'find_load_contributors': 'load_contrib',
+    'find_all_load_contributors': 'load_contrib',
+    'LoadTransferModel': 'load_transfer',
+    'compute_edge_loads': 'load_transfer',
+    'run_load_cases': 'load_cases',
+    'save_load_cases': 'load_cases',
+    'read_load_cases': 'load_cases',
+    'run_load_cases_parallel': 'load_parallel',
+    'IncrementalLoadAnalysis': 'load_incremental',
+    'AnalysisCache': 'load_cache',
+    'validate_load_path': 'load_validation',
+    'check_load_path': 'load_validation',
+    'LoadPathLoopError': 'load_validation',
+    'run_reports': 'load_report',
+    'read_graph': 'graph_json',
+    'read_raw_graph': 'graph_json',
+    'write_json': 'graph_json',
+    'dumps_json': 'graph_json',
+    'read_binary': 'graph_binary',
+    'write_binary': 'graph_binary',
+    'ColumnarGraph': 'graph_columns',
+    'GraphIndex': 'graph_index',
+    'GraphStore': 'graph_store',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
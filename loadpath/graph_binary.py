@@ -0,0 +1,403 @@
+"""
+Binary Load Path Model Format
+
+This module stores load path graphs in a compact binary container (``.lpg``) that
+can be opened through ``mmap`` without parsing:
+
+- Per-node numeric properties are contiguous little-endian typed arrays
+  (mass (N,), cog / external_force / moment / euler_angles / translation (N, 3),
+  rotation order codes (N,), canvas positions (N, 2))
+- Edges are int32 source/target node index arrays
+- Node IDs, names, colors and edge IDs are indexes into one shared string table
+
+File layout:
+    8 bytes   magic b"LPGRAPH\\0"
+    4 bytes   format version (uint32)
+    4 bytes   header length (uint32)
+    header    UTF-8 JSON: counts and {name: [dtype, shape, offset]} for every array
+    arrays    starting at the next 64-byte boundary; offsets are relative to it
+              and 64-byte aligned
+
+Nodes that only appear as edge endpoints are stored after the declared nodes with
+zero properties, so edge indexes always resolve. Node properties other than the
+ones listed above are not stored; numbers are stored as float64.
+
+Usage:
+    python -m loadpath.graph_binary model.json model.lpg     # convert JSON to binary
+    python -m loadpath.graph_binary model.lpg model.json     # convert binary to JSON
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from .load_graph import LoadPathGraph
+from .load_transfer import ROTATION_ORDERS, rotation_order_codes
+
+MAGIC = b'LPGRAPH\0'
+FORMAT_VERSION = 1
+
+# File extension of the binary format
+EXTENSION = '.lpg'
+
+# Vector node properties stored as (N, 3) float64 arrays
+VECTOR_PROPERTIES = ('cog', 'external_force', 'moment', 'euler_angles', 'translation')
+
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGNMENT = 64
+
+
+def _align(offset):
+    """
+    Rounds an offset up to the array alignment.
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class _StringTable:
+    """
+    Deduplicating string table used while writing.
+    """
+
+    def __init__(self):
+        self.index = {}
+
+    def add(self, value):
+        if value is None:
+            return -1
+        return self.index.setdefault(value, len(self.index))
+
+    def arrays(self):
+        encoded = [value.encode('utf-8') for value in self.index]
+        offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def write_binary(path, json_data):
+    """
+    Writes graph data to a binary model file.
+
+    Args:
+        path (str): Output file path
+        json_data (dict): Graph data in the Load Path Visual Tool JSON format
+
+    Raises:
+        ValueError: If a node has an unsupported rotation order
+
+    Example:
+        >>> write_binary('turbine_structure.lpg', json_data)
+    """
+    nodes = json_data.get('nodes', [])
+    edges = json_data.get('edges', [])
+    strings = _StringTable()
+
+    # Step 1: Declared nodes, in file order
+    node_data = [node['data'] for node in nodes]
+    row_of = {}
+    ids = []
+    for row, data in enumerate(node_data):
+        row_of.setdefault(data['id'], row)
+        ids.append(data['id'])
+    names = [strings.add(data.get('name')) for data in node_data]
+    colors = [strings.add(data.get('color')) for data in node_data]
+    positions = [node.get('position') or {} for node in nodes]
+    n_declared = len(nodes)
+
+    # Step 2: Edges (endpoints that are not declared nodes get their own rows)
+    edge_ids = []
+    sources = []
+    targets = []
+    for i, edge in enumerate(edges):
+        data = edge['data']
+        edge_ids.append(strings.add(data.get('id', f'e{i}')))
+        for endpoint, column in ((data['source'], sources), (data['target'], targets)):
+            if endpoint not in row_of:
+                row_of[endpoint] = len(ids)
+                ids.append(endpoint)
+            column.append(row_of[endpoint])
+    n_nodes = len(ids)
+    n_extra = n_nodes - n_declared
+
+    # Step 3: Node property columns (undeclared endpoints get zeros)
+    arrays = {
+        'mass': np.array([data.get('mass') or 0 for data in node_data] + [0] * n_extra,
+                         dtype='<f8'),
+        'rotation_order': np.concatenate([
+            rotation_order_codes([data.get('rotation_order') or 'xyz' for data in node_data]),
+            np.zeros(n_extra, dtype=np.int8)]).astype(np.uint8),
+        'position': np.array(
+            [(p.get('x', np.nan), p.get('y', np.nan)) for p in positions]
+            + [(np.nan, np.nan)] * n_extra, dtype='<f8').reshape(n_nodes, 2),
+    }
+    for name in VECTOR_PROPERTIES:
+        arrays[name] = np.array([data.get(name) or (0, 0, 0) for data in node_data]
+                                + [(0, 0, 0)] * n_extra, dtype='<f8').reshape(n_nodes, 3)
+    arrays['edge_source'] = np.array(sources, dtype='<i4')
+    arrays['edge_target'] = np.array(targets, dtype='<i4')
+    arrays['node_id'] = np.array([strings.add(node_id) for node_id in ids], dtype='<i4')
+    arrays['node_name'] = np.array(names + [-1] * n_extra, dtype='<i4')
+    arrays['node_color'] = np.array(colors + [-1] * n_extra, dtype='<i4')
+    arrays['edge_id'] = np.array(edge_ids, dtype='<i4')
+    arrays['string_data'], arrays['string_offsets'] = strings.arrays()
+
+    # Step 4: Lay out the arrays after the header
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = [array.dtype.str, list(array.shape), offset]
+        offset = _align(offset + array.nbytes)
+    header = {
+        'nodes': n_nodes,
+        'declared_nodes': n_declared,
+        'edges': len(edges),
+        'rotation_orders': ROTATION_ORDERS,
+        'arrays': layout,
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    with open(path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name][2])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+
+
+class BinaryModel:
+    """
+    Load path model opened from a binary file, backed by zero-copy array views.
+
+    Rows 0..declared_nodes-1 are the declared nodes in file order; further rows are
+    nodes that only appear as edge endpoints.
+
+    Attributes:
+        n_nodes (int): Number of node rows
+        n_declared (int): Number of declared nodes
+        n_edges (int): Number of edges
+        mass (numpy.ndarray): (N,) node masses
+        cog, external_force, moment, euler_angles, translation (numpy.ndarray):
+            (N, 3) vector properties
+        rotation_order (numpy.ndarray): (N,) codes into ROTATION_ORDERS
+        position (numpy.ndarray): (N, 2) canvas positions (NaN if unknown)
+        edge_source, edge_target (numpy.ndarray): (E,) int32 node rows
+    """
+
+    def __init__(self, buffer, mapping=None):
+        """
+        Attaches to the binary model held in ``buffer``.
+
+        Args:
+            buffer: Bytes-like object or mmap containing the file
+            mapping (mmap.mmap, optional): Memory map to close with the model
+
+        Raises:
+            ValueError: If the buffer is not a supported binary model
+        """
+        magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a binary load path model")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary model version {version}")
+        header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+        data_start = _align(_PREAMBLE.size + header_length)
+        if header['rotation_orders'] != ROTATION_ORDERS:
+            raise ValueError("Binary model uses unknown rotation order codes")
+
+        self._mapping = mapping
+        self.n_nodes = header['nodes']
+        self.n_declared = header['declared_nodes']
+        self.n_edges = header['edges']
+        self.arrays = {
+            name: np.frombuffer(buffer, dtype=np.dtype(dtype), count=int(np.prod(shape)),
+                                offset=data_start + offset).reshape(shape)
+            for name, (dtype, shape, offset) in header['arrays'].items()
+        }
+        for name in ('mass', 'rotation_order', 'position', 'edge_source', 'edge_target')\
+                + VECTOR_PROPERTIES:
+            setattr(self, name, self.arrays[name])
+        self._strings = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Releases the array views and the memory map.
+
+        The map stays open (until garbage collected) while views obtained from the
+        model are still referenced elsewhere.
+        """
+        self.arrays = {}
+        for name in ('mass', 'rotation_order', 'position', 'edge_source', 'edge_target')\
+                + VECTOR_PROPERTIES:
+            setattr(self, name, None)
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                pass
+            self._mapping = None
+
+    def _string_list(self, indexes):
+        """
+        Decodes string table indexes into a list of strings (None for -1).
+        """
+        if self._strings is None:
+            data = self.arrays['string_data'].tobytes()
+            offsets = self.arrays['string_offsets'].tolist()
+            text = data.decode('utf-8')
+            if len(text) == len(data):  # ASCII: byte offsets are character offsets
+                self._strings = [text[a:b] for a, b in zip(offsets, offsets[1:])]
+            else:
+                self._strings = [data[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+        strings = self._strings
+        return [strings[i] if i >= 0 else None for i in indexes.tolist()]
+
+    @property
+    def node_ids(self):
+        """
+        Node ID of every row.
+        """
+        return self._string_list(self.arrays['node_id'])
+
+    @property
+    def edge_ids(self):
+        """
+        Edge IDs in file order.
+        """
+        return self._string_list(self.arrays['edge_id'])
+
+    def properties(self):
+        """
+        Returns the node property columns (views, one row per node).
+
+        Returns:
+            dict: Property name -> numpy.ndarray
+        """
+        properties = {name: getattr(self, name) for name in VECTOR_PROPERTIES}
+        properties['mass'] = self.mass
+        properties['rotation_order'] = self.rotation_order
+        return properties
+
+    def to_graph(self):
+        """
+        Builds the indexed LoadPathGraph of the model without any JSON decoding.
+
+        The graph carries the node property columns, so LoadTransferModel reads them
+        straight from the file.
+
+        Returns:
+            LoadPathGraph: Indexed graph
+        """
+        return LoadPathGraph.from_arrays(self.node_ids, self.n_declared, self.edge_ids,
+                                         self.edge_source, self.edge_target,
+                                         properties=self.properties())
+
+    def iter_items(self):
+        """
+        Yields the model as raw JSON-style nodes and edges.
+
+        Returns:
+            generator: ('nodes', node) and ('edges', edge) pairs in file order, in
+                the form accepted by graph_json.build_graph
+        """
+        ids = self.node_ids
+        names = self._string_list(self.arrays['node_name'])
+        colors = self._string_list(self.arrays['node_color'])
+        columns = {name: getattr(self, name)[:self.n_declared].tolist()
+                   for name in ('mass',) + VECTOR_PROPERTIES}
+        orders = self.rotation_order[:self.n_declared].tolist()
+        positions = self.position[:self.n_declared].tolist()
+        for row in range(self.n_declared):
+            data = {'id': ids[row]}
+            if names[row] is not None:
+                data['name'] = names[row]
+            if colors[row] is not None:
+                data['color'] = colors[row]
+            data['mass'] = columns['mass'][row]
+            for name in VECTOR_PROPERTIES:
+                data[name] = columns[name][row]
+            data['rotation_order'] = ROTATION_ORDERS[orders[row]]
+            node = {'data': data}
+            x, y = positions[row]
+            if x == x and y == y:  # NaN marks an unknown position
+                node['position'] = {'x': x, 'y': y}
+            yield 'nodes', node
+
+        sources = self.edge_source.tolist()
+        targets = self.edge_target.tolist()
+        for edge_id, source, target in zip(self.edge_ids, sources, targets):
+            yield 'edges', {'data': {'id': edge_id, 'source': ids[source], 'target': ids[target]}}
+
+    def to_json(self):
+        """
+        Converts the model back to graph data in the JSON format.
+
+        Returns:
+            dict: Graph data {'nodes': [...], 'edges': [...]}
+        """
+        graph = {'nodes': [], 'edges': []}
+        for key, item in self.iter_items():
+            graph[key].append(item)
+        return graph
+
+
+def read_binary(source):
+    """
+    Opens a binary model file (memory mapped) or an in-memory binary model.
+
+    Args:
+        source (str or bytes-like): File path, or the file contents
+
+    Returns:
+        BinaryModel: Model with zero-copy array views
+
+    Example:
+        >>> with read_binary('turbine_structure.lpg') as model:
+        ...     total_mass = model.mass.sum()
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return BinaryModel(mapping, mapping)
+    return BinaryModel(source)
+
+
+def is_binary(source):
+    """
+    Returns True if ``source`` (a file path or bytes) holds a binary model.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            source = f.read(len(MAGIC))
+    return bytes(source[:len(MAGIC)]) == MAGIC
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from .graph_json import write_json
+
+    parser = argparse.ArgumentParser(description="Convert between JSON and binary load path models")
+    parser.add_argument('input', help="Input file (.json or .lpg)")
+    parser.add_argument('output', help="Output file (.lpg or .json)")
+    args = parser.parse_args()
+
+    if is_binary(args.input):
+        with read_binary(args.input) as model:
+            write_json(model.to_json(), args.output)
+    else:
+        with open(args.input) as f:
+            write_binary(args.output, json.load(f))
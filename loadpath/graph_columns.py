@@ -0,0 +1,750 @@
+"""
+Columnar Graph Model
+
+This module keeps the nodes of a load path graph as a column store instead of one
+dict per node:
+
+- mass (N,) and rotation order codes (N,) arrays
+- cog / external_force / moment / euler_angles / translation (N, 3) arrays
+- canvas positions (N, 2) (NaN when a node has no position)
+- lists of node IDs, names and colors
+
+The graph still looks like the Cytoscape-style JSON data used by the application:
+``graph['nodes']`` is a list-like sequence of lightweight row views (``__slots__``
+objects holding only the table and the row number) that read and write the
+columns, and ``graph['edges']`` is a plain list of edge dicts. GraphIndex, the
+application callbacks and the analysis functions therefore work on it unchanged,
+while a node costs a few hundred bytes instead of a dict with six nested lists.
+
+LoadPathGraph.from_json() builds analysis graphs from the columns directly
+(see ColumnarGraph.to_graph), so find_load_contributors() and LoadTransferModel
+skip the per-node dicts entirely.
+
+Numeric properties are stored as float64, with one bit per value recording
+whether it was an integer, so values read back with their original type (a mass
+of 54000 stays 54000, not 54000.0) and exports are unchanged. Node keys and
+property values that do not fit the columns (e.g. unknown properties, integers
+too large for a float64, or an unsupported rotation order) are kept per node and
+returned unchanged.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+from .graph_binary import VECTOR_PROPERTIES
+from .load_graph import LoadPathGraph
+from .load_transfer import ROTATION_ORDERS
+
+_ORDER_CODES = {order: code for code, order in enumerate(ROTATION_ORDERS)}
+
+# Node data keys held in columns, in the order node data dicts are rebuilt
+_DATA_KEYS = ('id', 'name', 'color', 'mass', 'cog', 'external_force', 'moment',
+              'euler_angles', 'rotation_order', 'translation')
+
+_DATA_KEY_SET = set(_DATA_KEYS)
+_NODE_KEY_SET = {'data', 'position'}
+
+# Integers up to this magnitude are exact in float64
+_EXACT_INT = 2 ** 53
+
+# Bit offsets of the values in the integer flags column: mass, the three
+# components of every vector property, then the x and y position
+_MASS_SHIFT = 0
+_VECTOR_SHIFTS = {name: 1 + 3 * i for i, name in enumerate(VECTOR_PROPERTIES)}
+_POSITION_SHIFT = 1 + 3 * len(VECTOR_PROPERTIES)
+_POSITION_BITS = 0b11 << _POSITION_SHIFT
+
+
+def _int_bits(values, shift):
+    """
+    Returns the integer flags of ``values``, starting at bit ``shift``.
+
+    Returns None if a value cannot be stored in a float64 column without loss.
+    """
+    bits = 0
+    for i, value in enumerate(values):
+        value_type = type(value)
+        if value_type is int:
+            if not -_EXACT_INT <= value <= _EXACT_INT:
+                return None
+            bits |= 1 << (shift + i)
+        elif value_type is not float:
+            return None
+    return bits
+
+
+def _row_flags(data, position):
+    """
+    Returns the integer flags of a node in the application's layout, or None if
+    one of its values does not fit the columns.
+    """
+    flags = _int_bits((data['mass'], position['x'], position['y']), _MASS_SHIFT)
+    if flags is None:
+        return None
+    # Position bits follow the vector bits in the column
+    flags = (flags & 1) | (flags >> 1) << _POSITION_SHIFT
+    for name, shift in _VECTOR_SHIFTS.items():
+        value = data[name]
+        if not isinstance(value, (list, tuple)) or len(value) != 3:
+            return None
+        bits = _int_bits(value, shift)
+        if bits is None:
+            return None
+        flags |= bits
+    return flags
+
+
+def _typed(values, bits):
+    """
+    Converts the column values whose bit is set in ``bits`` back to int.
+    """
+    return [int(value) if bits >> i & 1 else value for i, value in enumerate(values)]
+
+
+class _Missing:
+    """
+    Marker for a column property that a node does not have.
+    """
+
+    def __repr__(self):
+        return '<missing>'
+
+
+_MISSING = _Missing()
+
+
+class NodeTable:
+    """
+    Column store of node properties, grown geometrically like a list.
+
+    Attributes:
+        size (int): Number of nodes
+        ids (list): Node IDs
+        names (list): Node names (None if missing)
+        colors (list): Node colors (None if missing)
+        mass (numpy.ndarray): Masses, (capacity,)
+        rotation_order (numpy.ndarray): Rotation order codes (positions in
+            ROTATION_ORDERS, -1 if not supported), (capacity,)
+        vectors (dict): Vector property name -> (capacity, 3) array
+        position (numpy.ndarray): Canvas positions, (capacity, 2)
+        int_flags (numpy.ndarray): Per node, one bit per mass, vector component and
+            position coordinate that was given as an integer, (capacity,)
+        data_extras (list): Per node, data values not held in columns (or None)
+        node_extras (list): Per node, top-level node keys other than 'data' and
+            'position' (or None)
+
+    Only the first ``size`` rows of the arrays are in use; see properties().
+    """
+
+    def __init__(self, capacity=16):
+        self.size = 0
+        self.ids = []
+        self.names = []
+        self.colors = []
+        self.data_extras = []
+        self.node_extras = []
+        self.mass = np.zeros(capacity)
+        self.rotation_order = np.zeros(capacity, dtype=np.int8)
+        self.vectors = {name: np.zeros((capacity, 3)) for name in VECTOR_PROPERTIES}
+        self.position = np.full((capacity, 2), np.nan)
+        self.int_flags = np.zeros(capacity, dtype=np.uint32)
+
+    # ------------------------------------------------------------------- rows
+
+    def append(self, node):
+        """
+        Adds a node ({'data': {...}, 'position': {...}}) and returns its row.
+        """
+        row = self.size
+        self._reserve(row + 1)
+        self.size += 1
+        self.ids.append(None)
+        self.names.append(None)
+        self.colors.append(None)
+        self.data_extras.append(None)
+        self.node_extras.append(None)
+        self.set_node(row, node)
+        return row
+
+    def extend(self, nodes):
+        """
+        Adds many nodes at once.
+
+        Nodes in the application's layout (exactly the column properties, valid
+        values and a numeric position) are converted column by column; any other
+        node goes through append()'s per-value checks.
+        """
+        nodes = list(nodes)
+        start = self.size
+        self._reserve(start + len(nodes))
+        other = []
+        columns = {name: [] for name in ('mass', 'rotation_order', 'position', 'int_flags')
+                   + VECTOR_PROPERTIES}
+        for row, node in enumerate(nodes, start):
+            data = node['data']
+            position = node.get('position')
+            order = _ORDER_CODES.get(data.get('rotation_order'))
+            flags = None
+            if (data.keys() == _DATA_KEY_SET and node.keys() == _NODE_KEY_SET
+                    and order is not None
+                    and data['name'] is not None and data['color'] is not None
+                    and position.keys() == {'x', 'y'}):
+                flags = _row_flags(data, position)
+            if flags is not None:
+                columns['mass'].append(data['mass'])
+                columns['rotation_order'].append(order)
+                columns['position'].append((position['x'], position['y']))
+                for name in VECTOR_PROPERTIES:
+                    columns[name].append(data[name])
+                columns['int_flags'].append(flags)
+            else:
+                other.append(row)
+                columns['mass'].append(0)
+                columns['rotation_order'].append(0)
+                columns['position'].append((np.nan, np.nan))
+                columns['int_flags'].append(0)
+                for name in VECTOR_PROPERTIES:
+                    columns[name].append((0, 0, 0))
+            self.ids.append(data['id'])
+            self.names.append(data.get('name'))
+            self.colors.append(data.get('color'))
+        count = len(nodes)
+        self.data_extras.extend([None] * count)
+        self.node_extras.extend([None] * count)
+        self.size += count
+        if count:
+            end = start + count
+            self.mass[start:end] = columns.pop('mass')
+            self.rotation_order[start:end] = columns.pop('rotation_order')
+            self.position[start:end] = columns.pop('position')
+            self.int_flags[start:end] = columns.pop('int_flags')
+            for name, values in columns.items():
+                self.vectors[name][start:end] = values
+        for row in other:
+            self.set_node(row, nodes[row - start])
+
+    def delete(self, row):
+        """
+        Removes a row; the rows behind it move up by one.
+        """
+        size = self.size
+        for column in self._columns():
+            column[row:size - 1] = column[row + 1:size]
+        for values in (self.ids, self.names, self.colors, self.data_extras, self.node_extras):
+            del values[row]
+        self.size -= 1
+
+    def set_node(self, row, node):
+        """
+        Replaces a whole node.
+        """
+        self.set_data(row, node['data'])
+        extras = {key: value for key, value in node.items() if key not in ('data', 'position')}
+        self.node_extras[row] = extras or None
+        self.set_position(row, node.get('position'))
+
+    def set_data(self, row, data):
+        """
+        Replaces the data of a node.
+        """
+        extras = {}
+        self.ids[row] = data['id']
+        self.names[row] = data.get('name')
+        self.colors[row] = data.get('color')
+        for key in ('name', 'color'):
+            if key in data and data[key] is None:
+                extras[key] = None
+
+        mass = data.get('mass', 0)
+        flags = _int_bits((mass,), _MASS_SHIFT)
+        if flags is None:
+            extras['mass'] = data['mass']
+            mass = flags = 0
+        self.mass[row] = mass
+
+        order = data.get('rotation_order') or 'xyz'
+        code = _ORDER_CODES.get(order, -1) if isinstance(order, str) else -1
+        if code < 0 or order != data.get('rotation_order', 'xyz'):
+            extras['rotation_order'] = data.get('rotation_order')
+        self.rotation_order[row] = code
+
+        for name, column in self.vectors.items():
+            value = data.get(name)
+            bits = None
+            if isinstance(value, (list, tuple)) and len(value) == 3:
+                bits = _int_bits(value, _VECTOR_SHIFTS[name])
+            if bits is not None:
+                column[row] = value
+                flags |= bits
+            else:
+                column[row] = 0
+                extras[name] = value
+        for key, value in data.items():
+            if key not in _DATA_KEYS:
+                extras[key] = value
+        # Missing properties read back as missing, not as zeros
+        for name in ('mass', 'rotation_order') + VECTOR_PROPERTIES:
+            if name not in data:
+                extras[name] = _MISSING
+        self.int_flags[row] = (self.int_flags.item(row) & _POSITION_BITS) | flags
+        self.data_extras[row] = extras or None
+
+    def set_value(self, row, key, value):
+        """
+        Sets one data value of a node.
+        """
+        data = self.data(row)
+        data[key] = value
+        self.set_data(row, data)
+
+    def set_position(self, row, position):
+        """
+        Sets the canvas position of a node (None removes it).
+        """
+        extras = self.node_extras[row]
+        if extras is not None:
+            extras.pop('position', None)
+            self.node_extras[row] = extras or None
+        self.position[row] = np.nan
+        self.int_flags[row] &= ~np.uint32(_POSITION_BITS)
+        if position is None:
+            return
+        bits = None
+        if isinstance(position, dict) and position.keys() == {'x', 'y'}:
+            bits = _int_bits((position['x'], position['y']), _POSITION_SHIFT)
+        if bits is not None:
+            self.position[row] = (position['x'], position['y'])
+            self.int_flags[row] |= np.uint32(bits)
+        else:
+            self.node_extras[row] = dict(extras or {}, position=position)
+
+    def set_positions(self, rows, positions):
+        """
+        Sets the canvas positions of many nodes from an (n, 2) float array.
+
+        Args:
+            rows (list): Node rows
+            positions (numpy.ndarray): (len(rows), 2) positions
+        """
+        for row in rows:
+            if self.node_extras[row] is not None:
+                self.set_position(row, None)   # drop positions kept outside the column
+        self.position[rows] = positions
+        self.int_flags[rows] &= ~np.uint32(_POSITION_BITS)
+
+    # ----------------------------------------------------------------- values
+
+    def value(self, row, key):
+        """
+        Returns one data value of a node.
+
+        Raises:
+            KeyError: If the node has no such value
+        """
+        extras = self.data_extras[row]
+        if extras is not None and key in extras:
+            value = extras[key]
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if key == 'id':
+            return self.ids[row]
+        if key == 'name' or key == 'color':
+            value = (self.names if key == 'name' else self.colors)[row]
+            if value is None:
+                raise KeyError(key)
+            return value
+        if key == 'mass':
+            mass = self.mass.item(row)
+            return int(mass) if self.int_flags.item(row) >> _MASS_SHIFT & 1 else mass
+        if key == 'rotation_order':
+            return ROTATION_ORDERS[self.rotation_order[row]]
+        column = self.vectors.get(key)
+        if column is None:
+            raise KeyError(key)
+        values = column[row].tolist()
+        bits = self.int_flags.item(row) >> _VECTOR_SHIFTS[key] & 0b111
+        return _typed(values, bits) if bits else values
+
+    def data_keys(self, row):
+        """
+        Returns the data keys of a node, in data dict order.
+        """
+        extras = self.data_extras[row] or {}
+        keys = []
+        for key in _DATA_KEYS:
+            if key in extras:
+                if extras[key] is not _MISSING:
+                    keys.append(key)
+            elif not ((key == 'name' and self.names[row] is None)
+                      or (key == 'color' and self.colors[row] is None)):
+                keys.append(key)
+        return keys + [key for key in extras if key not in _DATA_KEYS]
+
+    def data(self, row):
+        """
+        Returns the data of a node as a new dict.
+        """
+        if self.data_extras[row] is not None:
+            return {key: self.value(row, key) for key in self.data_keys(row)}
+        # Every value is in the columns: read the integer flags only once
+        flags = self.int_flags.item(row)
+        data = {'id': self.ids[row]}
+        for key, values in (('name', self.names), ('color', self.colors)):
+            if values[row] is not None:
+                data[key] = values[row]
+        mass = self.mass.item(row)
+        data['mass'] = int(mass) if flags >> _MASS_SHIFT & 1 else mass
+        for key in _DATA_KEYS[4:]:
+            if key == 'rotation_order':
+                data[key] = ROTATION_ORDERS[self.rotation_order[row]]
+                continue
+            values = self.vectors[key][row].tolist()
+            bits = flags >> _VECTOR_SHIFTS[key] & 0b111
+            data[key] = _typed(values, bits) if bits else values
+        return data
+
+    def node(self, row):
+        """
+        Returns a node as a new dict ({'data': {...}, 'position': {...}}).
+        """
+        node = {'data': self.data(row)}
+        position = self.position_of(row)
+        if position is not None:
+            node['position'] = position
+        if self.node_extras[row]:
+            node.update(self.node_extras[row])
+        return node
+
+    def position_of(self, row):
+        """
+        Returns the canvas position of a node ({'x': ..., 'y': ...}), or None.
+        """
+        x, y = self.position[row].tolist()
+        if x != x or y != y:
+            return None
+        bits = self.int_flags.item(row) >> _POSITION_SHIFT
+        if bits:
+            x, y = _typed((x, y), bits)
+        return {'x': x, 'y': y}
+
+    def properties(self):
+        """
+        Returns the property columns of all nodes (views of the in-use rows).
+
+        Returns:
+            dict: Property name -> array, as used by LoadTransferModel
+
+        Raises:
+            ValueError: If a node has an unsupported rotation order
+        """
+        size = self.size
+        rotation_order = self.rotation_order[:size]
+        unsupported = np.flatnonzero(rotation_order < 0)
+        if len(unsupported):
+            row = unsupported[0]
+            raise ValueError(f"Unsupported rotation order "
+                             f"'{self.data_extras[row]['rotation_order']}' "
+                             f"(expected one of {ROTATION_ORDERS})")
+        properties = {'mass': self.mass[:size], 'rotation_order': rotation_order}
+        for name, column in self.vectors.items():
+            properties[name] = column[:size]
+        return properties
+
+    # -------------------------------------------------------------- internals
+
+    def _columns(self):
+        """
+        Returns every array column.
+        """
+        return [self.mass, self.rotation_order, self.position, self.int_flags,
+                *self.vectors.values()]
+
+    def _reserve(self, size):
+        """
+        Grows the arrays to hold at least ``size`` rows.
+        """
+        capacity = len(self.mass)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+
+        def grow(column, fill=0):
+            grown = np.full((capacity,) + column.shape[1:], fill, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            return grown
+
+        self.mass = grow(self.mass)
+        self.rotation_order = grow(self.rotation_order)
+        self.position = grow(self.position, np.nan)
+        self.int_flags = grow(self.int_flags)
+        self.vectors = {name: grow(column) for name, column in self.vectors.items()}
+
+
+class NodeDataView:
+    """
+    Dict-like view of the data of one node row.
+
+    Values are read from (and written to) the columns on access. Like every row
+    view it refers to a row number, so it is only valid until a row in front of
+    it is deleted.
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, key):
+        return self.table.value(self.row, key)
+
+    def __setitem__(self, key, value):
+        self.table.set_value(self.row, key, value)
+
+    def __contains__(self, key):
+        return key in self.table.data_keys(self.row)
+
+    def __iter__(self):
+        return iter(self.table.data_keys(self.row))
+
+    def __len__(self):
+        return len(self.table.data_keys(self.row))
+
+    def __eq__(self, other):
+        return self.copy() == (other.copy() if isinstance(other, NodeDataView) else other)
+
+    def __repr__(self):
+        return f'NodeDataView({self.copy()!r})'
+
+    def get(self, key, default=None):
+        try:
+            return self.table.value(self.row, key)
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.table.data_keys(self.row)
+
+    def values(self):
+        return list(self.copy().values())
+
+    def items(self):
+        return list(self.copy().items())
+
+    def copy(self):
+        """
+        Returns the node data as a new dict.
+        """
+        return self.table.data(self.row)
+
+
+class NodeView:
+    """
+    Dict-like view of one node row ({'data': ..., 'position': ...}).
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, key):
+        if key == 'data':
+            return NodeDataView(self.table, self.row)
+        if key == 'position':
+            position = self.table.position_of(self.row)
+            if position is not None:
+                return position
+        extras = self.table.node_extras[self.row]
+        if extras is None or key not in extras:
+            raise KeyError(key)
+        return extras[key]
+
+    def __setitem__(self, key, value):
+        if key == 'data':
+            self.table.set_data(self.row, value)
+        elif key == 'position':
+            self.table.set_position(self.row, value)
+        else:
+            self.table.node_extras[self.row] = dict(self.table.node_extras[self.row] or {},
+                                                    **{key: value})
+
+    def __contains__(self, key):
+        return key == 'data' or key in self.table.node(self.row)
+
+    def __iter__(self):
+        return iter(self.table.node(self.row))
+
+    def __eq__(self, other):
+        return self.copy() == (other.copy() if isinstance(other, NodeView) else other)
+
+    def __repr__(self):
+        return f'NodeView({self.copy()!r})'
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return self.table.node(self.row).keys()
+
+    def copy(self):
+        """
+        Returns the node as a new dict (with a new data dict).
+        """
+        return self.table.node(self.row)
+
+
+class NodeList:
+    """
+    List-like sequence of the node rows of a NodeTable.
+
+    Items are NodeView objects; append() and item assignment take node dicts, pop()
+    returns one.
+    """
+
+    __slots__ = ('table',)
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return self.table.size
+
+    def __iter__(self):
+        table = self.table
+        return (NodeView(table, row) for row in range(table.size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [NodeView(self.table, row) for row in range(self.table.size)[index]]
+        return NodeView(self.table, self._row(index))
+
+    def __setitem__(self, index, node):
+        self.table.set_node(self._row(index), node)
+
+    def __delitem__(self, index):
+        self.table.delete(self._row(index))
+
+    def append(self, node):
+        self.table.append(node)
+
+    def pop(self, index=-1):
+        row = self._row(index)
+        node = self.table.node(row)
+        self.table.delete(row)
+        return node
+
+    def _row(self, index):
+        size = self.table.size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('node index out of range')
+        return index
+
+
+class ColumnarGraph:
+    """
+    Graph data ({'nodes': ..., 'edges': [...]}) with column-stored nodes.
+
+    Example:
+        >>> graph = ColumnarGraph.from_json(json_data)
+        >>> graph['nodes'][0]['data']['mass']
+        350000
+        >>> graph.table.properties()['mass'].sum()
+        >>> find_load_contributors(graph, 'e3')
+        >>> json_data = graph.to_json()
+    """
+
+    def __init__(self, table=None, edges=None):
+        """
+        Args:
+            table (NodeTable, optional): Node columns (default: no nodes)
+            edges (list, optional): Edge dicts ({'data': {...}})
+        """
+        self.table = table if table is not None else NodeTable()
+        self.nodes = NodeList(self.table)
+        self.edges = edges if edges is not None else []
+
+    @classmethod
+    def from_json(cls, json_data):
+        """
+        Builds a columnar graph from graph data in the JSON format.
+
+        Edge dicts are shared with ``json_data``.
+
+        Args:
+            json_data (dict): Graph data with 'nodes' and 'edges' lists
+
+        Returns:
+            ColumnarGraph: Graph holding the same nodes and edges
+        """
+        nodes = json_data.get('nodes', [])
+        table = NodeTable(max(len(nodes), 16))
+        table.extend(nodes)
+        return cls(table, list(json_data.get('edges', [])))
+
+    def __getitem__(self, key):
+        if key == 'nodes':
+            return self.nodes
+        if key == 'edges':
+            return self.edges
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in ('nodes', 'edges')
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return ['nodes', 'edges']
+
+    def to_json(self):
+        """
+        Returns the graph as plain JSON data (new node dicts, shared edge dicts).
+        """
+        table = self.table
+        return {'nodes': [table.node(row) for row in range(table.size)],
+                'edges': self.edges}
+
+    def to_graph(self):
+        """
+        Builds the LoadPathGraph of this graph from the columns.
+
+        Nodes that only appear as edge endpoints get zero properties.
+
+        Returns:
+            LoadPathGraph: Indexed graph with ``properties`` set
+        """
+        table = self.table
+        node_ids = list(table.ids)
+        row_of = {}
+        for row, node_id in enumerate(node_ids):
+            row_of.setdefault(node_id, row)
+
+        edge_ids = []
+        sources = []
+        targets = []
+        for i, edge in enumerate(self.edges):
+            data = edge['data']
+            edge_ids.append(data.get('id', f'e{i}'))
+            for endpoint, column in ((data['source'], sources), (data['target'], targets)):
+                if endpoint not in row_of:
+                    row_of[endpoint] = len(node_ids)
+                    node_ids.append(endpoint)
+                column.append(row_of[endpoint])
+
+        properties = table.properties()
+        n_extra = len(node_ids) - table.size
+        if n_extra:
+            properties = {name: np.concatenate([values, np.zeros((n_extra,) + values.shape[1:],
+                                                                 dtype=values.dtype)])
+                          for name, values in properties.items()}
+        return LoadPathGraph.from_arrays(node_ids, table.size, edge_ids, sources, targets,
+                                         properties)
@@ -0,0 +1,196 @@
+"""
+Sub-assembly Hierarchy
+
+The load path defines the sub-assemblies of a model: the sub-assembly of a
+component is the component together with everything that transfers load into it
+(its upstream set), e.g. the Hub Assembly carries the Rotor Blades and the Nacelle
+Assembly carries both. A sub-assembly can be collapsed ("collapsed": true in the
+node data) and is then drawn as the single node of its component:
+
+- collapsed_nodes / hidden_nodes find the collapsed components and every component
+  hidden inside one of them
+- visible_graph returns the graph without the hidden components, which is what the
+  canvas shows
+- direct_contributors lists the components shown when a sub-assembly is expanded
+  (the application keeps their own sub-assemblies collapsed, so every expansion
+  only adds one level)
+- SubassemblyLoads computes the mass, force and moment of every sub-assembly of a
+  model in one upstream reduction (see load_transfer.UpstreamReducer)
+
+Example:
+    >>> view = visible_graph(graph)   # graph itself if nothing is collapsed
+    >>> loads = SubassemblyLoads(graph)
+    >>> loads.summary('Nacelle Assembly')['mass']
+    181000.0
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+from .load_transfer import GRAVITY, LoadTransferModel, UpstreamReducer
+
+
+def collapsed_nodes(graph):
+    """
+    Returns the IDs of the nodes whose sub-assembly is collapsed, in node order.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+
+    Returns:
+        list: Node IDs
+    """
+    table = getattr(graph, 'table', None)
+    if table is not None:
+        # Columnar graphs keep non-property data values per row
+        return [table.ids[row] for row, extras in enumerate(table.data_extras[:table.size])
+                if extras is not None and extras.get('collapsed')]
+    return [node['data']['id'] for node in graph['nodes'] if node['data'].get('collapsed')]
+
+
+def hidden_nodes(graph, collapsed=None):
+    """
+    Returns the IDs of the nodes hidden inside collapsed sub-assemblies.
+
+    A node is hidden if it lies upstream of a collapsed node. A collapsed node is
+    never hidden by its own sub-assembly (e.g. inside a loop), but is hidden if it
+    lies inside another collapsed sub-assembly.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        collapsed (list, optional): IDs of the collapsed nodes (default: from the
+            node data)
+
+    Returns:
+        set: Hidden node IDs (empty if nothing is collapsed)
+    """
+    if collapsed is None:
+        collapsed = collapsed_nodes(graph)
+    if not collapsed:
+        return set()
+
+    predecessors = {}
+    for edge in graph['edges']:
+        data = edge['data']
+        predecessors.setdefault(data['target'], []).append(data['source'])
+
+    # Nodes upstream of a hidden node are hidden already, so every node is
+    # expanded at most once over all collapsed nodes
+    hidden = set()
+    for node_id in collapsed:
+        stack = [node_id]
+        while stack:
+            for source in predecessors.get(stack.pop(), ()):
+                if source != node_id and source not in hidden:
+                    hidden.add(source)
+                    stack.append(source)
+    return hidden
+
+
+def visible_graph(graph, hidden=None):
+    """
+    Returns the part of a graph that is not hidden in a collapsed sub-assembly.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        hidden (set, optional): Hidden node IDs (default: hidden_nodes(graph))
+
+    Returns:
+        dict: ``graph`` itself if nothing is hidden, otherwise graph data sharing
+            the node and edge dicts of the visible nodes and of the edges between them
+    """
+    if hidden is None:
+        hidden = hidden_nodes(graph)
+    if not hidden:
+        return graph
+    nodes = graph['nodes']
+    table = getattr(graph, 'table', None)
+    node_ids = (table.ids[:table.size] if table is not None
+                else [node['data']['id'] for node in nodes])
+    return {
+        'nodes': [nodes[row] for row, node_id in enumerate(node_ids) if node_id not in hidden],
+        'edges': [edge for edge in graph['edges']
+                  if edge['data']['source'] not in hidden
+                  and edge['data']['target'] not in hidden]
+    }
+
+
+def direct_contributors(index, node_id):
+    """
+    Returns the IDs of the nodes with an edge into ``node_id`` (without itself).
+
+    Args:
+        index (GraphIndex): Lookup index of the graph
+        node_id (str): Node ID
+
+    Returns:
+        list: Node IDs, in edge order and without duplicates
+    """
+    contributors = {}
+    for edge_id in index.edges_of(node_id):
+        data = index.edge(edge_id)['data']
+        if data['target'] == node_id and data['source'] != node_id:
+            contributors[data['source']] = None
+    return list(contributors)
+
+
+class SubassemblyLoads:
+    """
+    Mass, force and moment of the sub-assembly of every node of a model.
+
+    All sub-assemblies are summed at once: the per-node loads of the load transfer
+    model are reduced over the upstream set of every node, so looking up a summary
+    afterwards costs nothing.
+
+    Attributes:
+        node_ids (list): Node IDs in array order
+        count (numpy.ndarray): (N,) number of components in each sub-assembly
+        mass (numpy.ndarray): (N,) total mass in kg
+        force (numpy.ndarray): (N, 3) resultant global force in N
+        moment (numpy.ndarray): (N, 3) resultant moment in N·m about the node's origin
+    """
+
+    def __init__(self, json_data, gravity=GRAVITY):
+        """
+        Args:
+            json_data (dict or LoadPathGraph): Graph data (or a ColumnarGraph), or a
+                LoadPathGraph built from it
+            gravity (tuple): Gravitational acceleration vector in the global frame
+        """
+        model = LoadTransferModel(json_data, gravity=gravity)
+        self.node_ids = model.node_ids
+        self.node_index = model.graph.node_index
+
+        # Step 1: One reduction over every node's upstream set
+        forces, moments = model.node_loads()
+        values = np.column_stack([forces, moments, model.mass, np.ones(len(self.node_ids))])
+        sums = UpstreamReducer(model.graph, self.node_ids).reduce(values)
+
+        # Step 2: Move the moments from the global origin to each node's origin
+        self.force = sums[:, :3]
+        self.moment = sums[:, 3:6] - np.cross(model.translation, self.force)
+        self.mass = sums[:, 6]
+        self.count = np.rint(sums[:, 7]).astype(np.int64)
+
+    def summary(self, node_id):
+        """
+        Returns the totals of one sub-assembly.
+
+        Args:
+            node_id (str): Node ID
+
+        Returns:
+            dict: {'nodes', 'mass', 'force', 'moment'}, or None for unknown nodes
+        """
+        i = self.node_index.get(node_id)
+        if i is None:
+            return None
+        return {
+            'nodes': int(self.count[i]),
+            'mass': float(self.mass[i]),
+            'force': self.force[i].tolist(),
+            'moment': self.moment[i].tolist()
+        }
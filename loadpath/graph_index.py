@@ -0,0 +1,255 @@
+"""
+Graph Lookup Index
+
+This module keeps hash indexes over the Cytoscape-style graph data used by the
+application, so that callbacks can find nodes and edges without scanning lists:
+
+- node ID -> position in ``nodes``
+- edge ID -> position in ``edges``
+- (source, target) -> edge IDs
+- node ID -> IDs of the edges attached to it
+- the next free sequential edge ID (e0, e1, ...)
+
+All edits of an indexed graph go through the index, which applies them to the
+graph lists and keeps the lookups up to date. Lookups are constant time; deleting
+an item only renumbers the items behind it.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+
+def _edge_number(edge_id):
+    """
+    Returns N for sequential edge IDs of the form "e<N>", else None.
+    """
+    if isinstance(edge_id, str) and edge_id.startswith('e') and edge_id[1:].isdigit():
+        return int(edge_id[1:])
+    return None
+
+
+class GraphIndex:
+    """
+    Lookup indexes over graph data ({'nodes': [...], 'edges': [...]}).
+
+    If IDs are duplicated, lookups return the first occurrence, like a scan would.
+
+    Example:
+        >>> index = GraphIndex(graph_data)
+        >>> index.node('Tower')['data']['mass']
+        350000
+        >>> index.edges_between('Nacelle', 'Tower')
+        ['e1']
+        >>> index.add_edge({'data': {'id': index.next_edge_id(),
+        ...                          'source': 'Hub', 'target': 'Nacelle'}})
+    """
+
+    def __init__(self, graph):
+        """
+        Builds the indexes in one pass over the graph.
+
+        Args:
+            graph (dict): Graph data with 'nodes' and 'edges' lists (edited in place)
+        """
+        self.graph = graph
+        self.nodes = graph['nodes']
+        self.edges = graph['edges']
+        self.node_positions = {}
+        self.edge_positions = {}
+        self.pair_edges = {}   # (source, target) -> {edge ID: None}
+        self.node_edges = {}   # node ID -> {edge ID: None}
+        self.duplicate_node_ids = set()
+        self.next_edge_number = 0
+
+        for position, node in enumerate(self.nodes):
+            self._link_node(node['data']['id'], position)
+        for position, edge in enumerate(self.edges):
+            self._link_edge(edge['data'], position)
+
+    # ------------------------------------------------------------------ lookups
+
+    def node(self, node_id):
+        """
+        Returns the node with the given ID, or None.
+        """
+        position = self.node_positions.get(node_id)
+        return None if position is None else self.nodes[position]
+
+    def node_position(self, node_id):
+        """
+        Returns the position of a node in the nodes list, or None.
+        """
+        return self.node_positions.get(node_id)
+
+    def edge(self, edge_id):
+        """
+        Returns the edge with the given ID, or None.
+        """
+        position = self.edge_positions.get(edge_id)
+        return None if position is None else self.edges[position]
+
+    def edge_position(self, edge_id):
+        """
+        Returns the position of an edge in the edges list, or None.
+        """
+        return self.edge_positions.get(edge_id)
+
+    def edges_between(self, first_id, second_id):
+        """
+        Returns the IDs of the edges connecting two nodes, in either direction.
+        """
+        edge_ids = list(self.pair_edges.get((first_id, second_id), ()))
+        if first_id != second_id:
+            edge_ids += self.pair_edges.get((second_id, first_id), ())
+        return edge_ids
+
+    def edges_of(self, node_id):
+        """
+        Returns the IDs of the edges attached to a node.
+        """
+        return list(self.node_edges.get(node_id, ()))
+
+    def next_edge_id(self):
+        """
+        Returns the next unused sequential edge ID (one above the highest e<N> seen).
+        """
+        return f'e{self.next_edge_number}'
+
+    # -------------------------------------------------------------------- edits
+
+    def add_node(self, node):
+        """
+        Appends a node and returns its position.
+        """
+        position = len(self.nodes)
+        self.nodes.append(node)
+        self._link_node(node['data']['id'], position)
+        return position
+
+    def update_node(self, position, node_data):
+        """
+        Replaces the data of the node at ``position`` (the ID may change).
+
+        Edges referencing the old ID have to be updated separately.
+        """
+        old_id = self.nodes[position]['data']['id']
+        self.nodes[position]['data'] = node_data
+        if node_data['id'] == old_id:
+            return
+        if self.node_positions.get(old_id) == position:
+            del self.node_positions[old_id]
+            if old_id in self.duplicate_node_ids:
+                self._find_next(old_id, position + 1)
+        self._link_node(node_data['id'], position)
+
+    def delete_node(self, position):
+        """
+        Removes the node at ``position``.
+
+        Edges attached to it have to be deleted separately.
+        """
+        node_id = self.nodes.pop(position)['data']['id']
+        if self.node_positions.get(node_id) == position:
+            del self.node_positions[node_id]
+        self._shift(self.nodes, self.node_positions, position,
+                    lambda node: node['data']['id'])
+
+    def add_edge(self, edge):
+        """
+        Appends an edge and returns its position.
+        """
+        position = len(self.edges)
+        self.edges.append(edge)
+        self._link_edge(edge['data'], position)
+        return position
+
+    def update_edge(self, position, edge_data):
+        """
+        Replaces the data of the edge at ``position``.
+        """
+        self._unlink_edge(self.edges[position]['data'], position)
+        self.edges[position]['data'] = edge_data
+        self._link_edge(edge_data, position)
+
+    def delete_edges(self, positions):
+        """
+        Removes the edges at the given positions.
+        """
+        positions = sorted(set(positions), reverse=True)
+        if not positions:
+            return
+        for position in positions:
+            self._unlink_edge(self.edges[position]['data'], position)
+            del self.edges[position]
+        self._shift(self.edges, self.edge_positions, positions[-1],
+                    lambda edge: edge['data']['id'])
+
+    # ---------------------------------------------------------------- internals
+
+    def _link_node(self, node_id, position):
+        """
+        Adds a node to the lookups.
+        """
+        current = self.node_positions.get(node_id)
+        if current is not None:
+            self.duplicate_node_ids.add(node_id)
+        if current is None or current > position:
+            self.node_positions[node_id] = position
+
+    def _find_next(self, node_id, start):
+        """
+        Indexes the next occurrence of a duplicated node ID from ``start`` on.
+        """
+        for position in range(start, len(self.nodes)):
+            if self.nodes[position]['data']['id'] == node_id:
+                self.node_positions[node_id] = position
+                return
+
+    def _link_edge(self, edge_data, position):
+        """
+        Adds an edge to the lookups.
+        """
+        edge_id = edge_data['id']
+        self.edge_positions.setdefault(edge_id, position)
+        source, target = edge_data['source'], edge_data['target']
+        self.pair_edges.setdefault((source, target), {})[edge_id] = None
+        self.node_edges.setdefault(source, {})[edge_id] = None
+        self.node_edges.setdefault(target, {})[edge_id] = None
+        number = _edge_number(edge_id)
+        if number is not None and number >= self.next_edge_number:
+            self.next_edge_number = number + 1
+
+    def _unlink_edge(self, edge_data, position):
+        """
+        Removes an edge from the lookups.
+        """
+        edge_id = edge_data['id']
+        if self.edge_positions.get(edge_id) != position:
+            return  # a duplicate ID shadowed by an earlier edge
+        del self.edge_positions[edge_id]
+        source, target = edge_data['source'], edge_data['target']
+        for table, key in ((self.pair_edges, (source, target)),
+                           (self.node_edges, source), (self.node_edges, target)):
+            members = table.get(key)
+            if members is not None:
+                members.pop(edge_id, None)
+                if not members:
+                    del table[key]
+
+    @staticmethod
+    def _reindex_one(positions, item_id, position):
+        """
+        Points ``item_id`` at ``position`` unless an earlier item has the same ID.
+        """
+        current = positions.get(item_id)
+        if current is None or current > position:
+            positions[item_id] = position
+
+    @classmethod
+    def _shift(cls, items, positions, start, key):
+        """
+        Renumbers the items from ``start`` on after a deletion.
+        """
+        for position in range(start, len(items)):
+            cls._reindex_one(positions, key(items[position]), position)
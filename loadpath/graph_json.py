@@ -0,0 +1,574 @@
+"""
+Load Path JSON Import and Export
+
+This module reads and writes load path graph files (the format of the
+application's Export JSON button) without holding the whole document at once.
+
+Import:
+- The input is consumed in chunks, either from a file on disk or from a base64
+  encoded upload (the ``contents`` of a dcc.Upload component)
+- Nodes and edges are decoded one element at a time and normalized as they arrive
+  (missing properties get their defaults), so the decoded document is never held
+  next to the imported graph
+- Nodes without a position are left without one; the application places them
+  with the layered layout (see graph_layout)
+- Edges are validated against the known node IDs as they arrive; edges whose
+  source or target node does not exist are dropped
+
+Export:
+- The document is written in a single pass, directly in the export layout
+  (two-space indentation with short arrays on one line), to a string, a file or
+  a chunk iterator for streaming downloads
+
+Usage:
+    python -m loadpath.graph_json model.json [-o normalized.json]
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import base64
+import codecs
+import json
+import random
+import re
+import sys
+
+# Colors assigned to imported nodes without a color
+NODE_COLORS = ['#FF4136', '#2ECC40', '#0074D9', '#FF851B', '#B10DC9']
+
+# Size of the text chunks read from the input (characters)
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = ' \t\n\r'
+
+
+# Default values of node properties missing from an imported node
+NODE_DEFAULTS = {
+    'mass': 0,
+    'cog': [0, 0, 0],
+    'external_force': [0, 0, 0],
+    'moment': [0, 0, 0],
+    'euler_angles': [0, 0, 0],
+    'rotation_order': 'xyz',
+    'translation': [0, 0, 0]
+}
+
+
+def normalize_node(node):
+    """
+    Converts an imported node to the application's node layout.
+
+    The node ID is set to the node name, missing properties are filled with their
+    defaults. A missing position stays missing (see graph_layout.fill_positions).
+
+    Args:
+        node (dict): Imported node ({'data': {...}, 'position': {...}})
+
+    Returns:
+        dict: Node with 'data' and, if it had one, 'position'
+    """
+    node_data = _shared_keys(node['data'])
+    # Make sure ID exists and is the same as name for consistency
+    if 'name' in node_data:
+        node_data['id'] = node_data['name']
+    if 'color' not in node_data:
+        node_data['color'] = random.choice(NODE_COLORS)
+    for key, value in NODE_DEFAULTS.items():
+        if key not in node_data:
+            node_data[key] = list(value) if isinstance(value, list) else value
+    if 'position' not in node:
+        return {'data': node_data}
+    return {'data': node_data, 'position': node['position']}
+
+
+def _shared_keys(data):
+    """
+    Returns ``data`` with interned keys.
+
+    Every element is decoded separately, so without this each node and edge would
+    carry its own copies of the property name strings.
+    """
+    return {sys.intern(key): value for key, value in data.items()}
+
+
+class _TextStream:
+    """
+    Incremental JSON tokenizer over an iterable of text chunks.
+
+    Values are decoded with json.JSONDecoder.raw_decode; the buffer only grows when a
+    single value does not fit into the text read so far.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """
+        Appends the next chunk to the buffer, dropping the consumed text.
+        """
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Returns the next non-whitespace character without consuming it ('' at EOF).
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """
+        Consumes the next non-whitespace character, which must be ``char``.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON: expected '{char}' but found "
+                             f"'{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self):
+        """
+        Decodes and consumes the next JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                end = None
+            # A value that ends with the buffer (e.g. a number) may continue in the next chunk
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            if not self._fill() and end is None:
+                raise ValueError("Invalid JSON: unexpected end of file")
+
+    def items(self):
+        """
+        Yields the elements of an array one at a time.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+
+def iter_graph_items(chunks):
+    """
+    Yields the raw nodes and edges of a graph document as they are parsed.
+
+    Args:
+        chunks (iterable): Text chunks of the JSON document
+
+    Yields:
+        tuple: ('nodes', node) or ('edges', edge) in document order
+
+    Raises:
+        ValueError: If the document is not a JSON object or is malformed
+    """
+    stream = _TextStream(chunks)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key in ('nodes', 'edges') and stream.peek() == '[':
+            for item in stream.items():
+                yield key, item
+        else:
+            stream.value()  # other top-level entries are not part of the graph
+        if stream.peek() == ',':
+            stream.pos += 1
+        else:
+            stream.expect('}')
+            return
+
+
+def parse_graph(chunks):
+    """
+    Builds normalized graph data from the text chunks of a graph document.
+
+    Args:
+        chunks (iterable): Text chunks of the JSON document
+
+    Returns:
+        dict: Graph data {'nodes': [...], 'edges': [...]}
+
+    Raises:
+        ValueError: If the document is malformed
+        KeyError: If a node or edge has no 'data' (or an edge no source/target)
+    """
+    return build_graph(iter_graph_items(chunks))
+
+
+def build_graph(items):
+    """
+    Builds normalized graph data from a sequence of raw nodes and edges.
+
+    Nodes are normalized with normalize_node. Edges without an ID get "e<i>" (their
+    position in the file); edges referencing unknown nodes are dropped. Edges that
+    appear before the nodes section are validated once all nodes are known.
+
+    Args:
+        items (iterable): ('nodes', node) and ('edges', edge) pairs in document
+            order, as yielded by iter_graph_items
+
+    Returns:
+        dict: Graph data {'nodes': [...], 'edges': [...]}
+
+    Raises:
+        KeyError: If a node or edge has no 'data' (or an edge no source/target)
+    """
+    graph = {'nodes': [], 'edges': []}
+    node_ids = set()
+    pending = []  # edges read before all nodes were known
+    nodes_done = False
+    n_edges = 0
+    section = None
+    for key, item in items:
+        if key != section:
+            # A finished nodes section means every endpoint can be checked right away
+            nodes_done = nodes_done or section == 'nodes'
+            section = key
+        if key == 'nodes':
+            node = normalize_node(item)
+            graph['nodes'].append(node)
+            node_ids.add(node['data']['id'])
+            continue
+        edge_data = _shared_keys(item['data'])
+        edge_data.setdefault('id', f'e{n_edges}')
+        n_edges += 1
+        if not nodes_done:
+            pending.append(edge_data)
+        elif edge_data['source'] in node_ids and edge_data['target'] in node_ids:
+            graph['edges'].append({'data': edge_data})
+
+    if pending:
+        edges = [{'data': edge_data} for edge_data in pending
+                 if edge_data['source'] in node_ids and edge_data['target'] in node_ids]
+        graph['edges'][:0] = edges
+    return graph
+
+
+def file_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    Yields text chunks read from an open text file.
+    """
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def base64_chunks(contents, chunk_size=CHUNK_SIZE):
+    """
+    Yields decoded text chunks of a base64 data URL (``data:...;base64,<data>``).
+
+    The upload is decoded piecewise, so the decoded document is never held in full.
+    """
+    start = contents.index(',') + 1 if contents.startswith('data:') else 0
+    step = max(4, chunk_size // 4 * 4)  # whole base64 quanta
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    for offset in range(start, len(contents), step):
+        yield decoder.decode(base64.b64decode(contents[offset:offset + step]))
+    yield decoder.decode(b'', final=True)
+
+
+def read_graph(path, chunk_size=CHUNK_SIZE):
+    """
+    Reads and normalizes a graph file from disk in chunks.
+
+    Args:
+        path (str): JSON file path
+        chunk_size (int): Characters read per chunk
+
+    Returns:
+        dict: Graph data {'nodes': [...], 'edges': [...]}
+
+    Example:
+        >>> graph = read_graph('turbine_structure.json')
+        >>> len(graph['nodes']), len(graph['edges'])
+        (7, 6)
+    """
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        return parse_graph(file_chunks(file, chunk_size))
+
+
+def read_raw_graph(path, chunk_size=CHUNK_SIZE):
+    """
+    Reads a graph file from disk in chunks, keeping nodes and edges as they are.
+
+    Unlike read_graph, nothing is normalized or dropped, so node IDs, missing
+    properties and edges to undeclared nodes stay as in the file (the analyses
+    handle them themselves).
+
+    Args:
+        path (str): JSON file path
+        chunk_size (int): Characters read per chunk
+
+    Returns:
+        dict: Graph data {'nodes': [...], 'edges': [...]}
+    """
+    graph = {'nodes': [], 'edges': []}
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        for key, item in iter_graph_items(file_chunks(file, chunk_size)):
+            if 'data' in item:
+                item['data'] = _shared_keys(item['data'])
+            graph[key].append(item)
+    return graph
+
+
+def read_graph_base64(contents, chunk_size=CHUNK_SIZE):
+    """
+    Reads and normalizes a graph from base64 encoded upload contents.
+
+    Args:
+        contents (str): Upload contents (base64 data URL)
+        chunk_size (int): Encoded characters decoded per chunk
+
+    Returns:
+        dict: Graph data {'nodes': [...], 'edges': [...]}
+    """
+    return parse_graph(base64_chunks(contents, chunk_size))
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+# Containers nested less deeply than this are streamed element by element
+_STREAM_DEPTH = 2
+
+_INDENTS = ['\n' + ' ' * (2 * level) for level in range(32)]
+
+_encode_string = json.encoder.encode_basestring_ascii
+_encode_flat = json.JSONEncoder(separators=(', ', ': ')).encode
+
+
+def _indent(level):
+    """
+    Returns a newline followed by the indentation of ``level``.
+    """
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return '\n' + ' ' * (2 * level)
+
+
+_FLOAT_SPECIAL = {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+# Compact-array separators inside the text of an encoded array element
+_LINE_SEPARATOR = re.compile(r',\n *')
+
+
+def _encode_float(value):
+    """
+    Encodes a float the way the json module does.
+    """
+    text = float.__repr__(value)
+    return _FLOAT_SPECIAL.get(text, text)
+
+
+# Encoders of scalar values by exact type
+_SCALARS = {
+    str: _encode_string,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+
+
+def _encode_key(key):
+    """
+    Encodes a dictionary key the way the json module does.
+    """
+    if isinstance(key, str):
+        return _encode_string(key)
+    if isinstance(key, bool) or key is None:
+        return {True: '"true"', False: '"false"', None: '"null"'}[key]
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _has_brackets(value):
+    """
+    Returns True if the JSON text of ``value`` contains a square bracket.
+    """
+    if isinstance(value, str):
+        return '[' in value or ']' in value
+    if isinstance(value, dict):
+        return any(isinstance(key, str) and ('[' in key or ']' in key) or _has_brackets(item)
+                   for key, item in value.items())
+    return isinstance(value, (list, tuple))
+
+
+def _encode(value, level):
+    """
+    Encodes a value in the export layout.
+
+    The layout is json.dumps(indent=2) with every array that contains no other
+    brackets (no nested arrays, no brackets inside strings) written on one line,
+    with its comma-newline separators - including those of objects inside it -
+    replaced by ", ". Strings cannot contain raw newlines, so an element's text can
+    be compacted after encoding.
+    """
+    encode = _SCALARS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        inner = _indent(level + 1)
+        parts = []
+        for key, item in value.items():
+            encode = _SCALARS.get(type(item))
+            parts.append((_encode_string(key) if type(key) is str else _encode_key(key))
+                         + ': ' + (encode(item) if encode else _encode(item, level + 1)))
+        return '{' + inner + (',' + inner).join(parts) + _indent(level) + '}'
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return '[]'
+        items = []
+        for item in value:
+            encode = _SCALARS.get(type(item))
+            items.append(encode(item) if encode else _encode(item, level + 1))
+        text = ', '.join(items)
+        if '[' not in text and ']' not in text:
+            return '[' + _LINE_SEPARATOR.sub(', ', text) + ']'
+        inner = _indent(level + 1)
+        return '[' + inner + (',' + inner).join(items) + _indent(level) + ']'
+    if isinstance(value, str):
+        return _encode_string(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _fragments(value, level=0):
+    """
+    Yields the export text of ``value``, one element of each outer container at a time.
+    """
+    if level >= _STREAM_DEPTH:
+        yield _encode(value, level)
+    elif isinstance(value, dict) and value:
+        inner = _indent(level + 1)
+        for i, (key, item) in enumerate(value.items()):
+            yield ('{' if i == 0 else ',') + inner + _encode_key(key) + ': '
+            yield from _fragments(item, level + 1)
+        yield _indent(level) + '}'
+    elif isinstance(value, (list, tuple)) and value and any(map(_has_brackets, value)):
+        inner = _indent(level + 1)
+        for i, item in enumerate(value):
+            yield ('[' if i == 0 else ',') + inner
+            yield from _fragments(item, level + 1)
+        yield _indent(level) + ']'
+    else:
+        yield _encode(value, level)
+
+
+def iter_json_chunks(data, chunk_size=CHUNK_SIZE):
+    """
+    Yields the export text of graph data in chunks of about ``chunk_size`` characters.
+
+    Suitable for streaming responses; the full document is never built in memory.
+
+    Args:
+        data (dict): Graph data (any JSON-serializable value)
+        chunk_size (int): Approximate chunk size in characters
+
+    Yields:
+        str: Consecutive pieces of the document
+    """
+    parts = []
+    size = 0
+    for fragment in _fragments(data):
+        parts.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts = []
+            size = 0
+    if parts:
+        yield ''.join(parts)
+
+
+def dumps_json(data):
+    """
+    Returns the export text of graph data.
+
+    The text is identical to ``json.dumps(data, indent=2)`` with arrays that do not
+    contain other arrays written on a single line (e.g. "cog": [0, 0, 0]), but it
+    is produced in a single pass.
+
+    Args:
+        data (dict): Graph data (any JSON-serializable value)
+
+    Returns:
+        str: Formatted JSON document
+    """
+    return ''.join(_fragments(data))
+
+
+def write_json(data, file, chunk_size=CHUNK_SIZE):
+    """
+    Writes the export text of graph data to a file without building it in memory.
+
+    Args:
+        data (dict): Graph data (any JSON-serializable value)
+        file (str or file object): Output path, or an open text file
+        chunk_size (int): Characters written per chunk
+    """
+    if isinstance(file, str):
+        with open(file, 'w', encoding='utf-8') as f:
+            return write_json(data, f, chunk_size)
+    for chunk in iter_json_chunks(data, chunk_size):
+        file.write(chunk)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import and validate a load path JSON file")
+    parser.add_argument('file', help="Graph JSON file")
+    parser.add_argument('-o', '--output', help="Write the normalized graph to this file")
+    args = parser.parse_args()
+
+    graph = read_graph(args.file)
+    print(f"{args.file}: {len(graph['nodes'])} nodes, {len(graph['edges'])} edges",
+          file=sys.stderr)
+    if args.output:
+        write_json(graph, args.output)
@@ -0,0 +1,394 @@
+"""
+Layered Graph Layout
+
+Server-side layout of load path graphs, following the load flow: grounded nodes
+(no outgoing connection) are placed on the bottom layer and every component sits
+one layer above the component it transfers load into, so loads flow down the
+canvas. The layout is a layered (Sugiyama-style) layout built in linear time:
+
+1. Layering: a breadth-first search from the grounded nodes against the edge
+   direction assigns every node its distance to ground and a parent (the first
+   node it was reached from). Loops are broken by visiting every node only once;
+   nodes that cannot reach ground are laid out from the first of them
+2. Ordering: every parent's contributors are kept together in edge order, which
+   gives a crossing-free drawing of forest-shaped load paths. Edges that are not
+   part of the search tree (shared sub-paths) are drawn but not straightened
+3. Coordinates: leaves take one slot each, and every node is centred over the
+   slots of its contributors
+
+Layouts are cached under a hash of the graph topology (see LayoutCache), so
+reopening a model or laying it out again costs one hash. When nodes are added to
+a laid out graph, fill_positions places only the new nodes, next to the nodes they
+are connected to, and every stored position is kept.
+
+Example:
+    >>> cache = LayoutCache()
+    >>> positions = layered_layout(graph, cache=cache)   # (n, 2) array, node order
+    >>> fill_positions(graph, cache=cache)               # only nodes without one
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from .graph_view import node_positions
+
+# Horizontal distance between neighbouring slots and vertical distance between
+# layers (canvas pixels)
+NODE_SPACING = 120
+LAYER_SPACING = 120
+
+
+def _node_ids(graph):
+    """
+    Returns the node IDs of a graph in node order.
+    """
+    table = getattr(graph, 'table', None)
+    if table is not None:
+        return table.ids[:table.size]
+    return [node['data']['id'] for node in graph['nodes']]
+
+
+def topology_hash(graph, node_spacing=NODE_SPACING, layer_spacing=LAYER_SPACING):
+    """
+    Returns the hash of everything a layout depends on: the node IDs and the edge
+    endpoints (both in order) and the spacings. Positions and node properties are
+    not included.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        node_spacing (float): Horizontal slot distance
+        layer_spacing (float): Vertical layer distance
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{node_spacing!r}|{layer_spacing!r}'.encode())
+    digest.update('\0'.join(map(str, _node_ids(graph))).encode('utf-8', 'surrogatepass'))
+    digest.update(b'\1')
+    digest.update('\0'.join(f"{edge['data']['source']}\t{edge['data']['target']}"
+                            for edge in graph['edges']).encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """
+    Thread-safe LRU cache of layouts, keyed by topology_hash.
+
+    Example:
+        >>> cache = LayoutCache(capacity=16)
+        >>> positions = layered_layout(graph, cache=cache)   # computed
+        >>> positions = layered_layout(graph, cache=cache)   # cached
+        >>> cache.hits
+        1
+    """
+
+    def __init__(self, capacity=16):
+        """
+        Args:
+            capacity (int): Maximum number of layouts kept
+        """
+        self.capacity = capacity
+        self.layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns a copy of a cached layout (None if unknown).
+        """
+        with self._lock:
+            positions = self.layouts.get(key)
+            if positions is None:
+                self.misses += 1
+                return None
+            self.layouts.move_to_end(key)
+            self.hits += 1
+            return positions.copy()
+
+    def put(self, key, positions):
+        """
+        Stores a layout, dropping the least recently used ones beyond capacity.
+        """
+        with self._lock:
+            self.layouts[key] = positions.copy()
+            self.layouts.move_to_end(key)
+            while len(self.layouts) > self.capacity:
+                self.layouts.popitem(last=False)
+
+
+def layered_layout(graph, node_spacing=NODE_SPACING, layer_spacing=LAYER_SPACING,
+                   cache=None):
+    """
+    Computes the layered layout of a graph.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        node_spacing (float): Horizontal slot distance
+        layer_spacing (float): Vertical layer distance
+        cache (LayoutCache, optional): Cache of layouts
+
+    Returns:
+        numpy.ndarray: (n, 2) canvas positions in node order. Grounded nodes are on
+            the bottom layer; the leftmost slot is centred at x = node_spacing
+    """
+    key = None
+    if cache is not None:
+        key = topology_hash(graph, node_spacing, layer_spacing)
+        positions = cache.get(key)
+        if positions is not None:
+            return positions
+
+    node_ids = list(_node_ids(graph))
+    n = len(node_ids)
+    index = {}
+    for i, node_id in enumerate(node_ids):
+        index.setdefault(node_id, i)   # duplicated IDs: edges attach to the first
+
+    # Step 1: Contributors of every node; nodes without outgoing edges are grounded
+    predecessors = [[] for _ in range(n)]
+    grounded = bytearray([1]) * n
+    for edge in graph['edges']:
+        data = edge['data']
+        source = index.get(data['source'])
+        target = index.get(data['target'])
+        if source is None or target is None or source == target:
+            continue
+        predecessors[target].append(source)
+        grounded[source] = 0
+
+    # Step 2: Breadth-first search from the grounded nodes against the edges
+    depth = [0] * n
+    children = [()] * n
+    visited = bytearray(n)
+    order = []
+    roots = []
+
+    def search(root):
+        visited[root] = 1
+        roots.append(root)
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            found = []
+            for p in predecessors[v]:
+                if not visited[p]:
+                    visited[p] = 1
+                    depth[p] = depth[v] + 1
+                    found.append(p)
+            if found:
+                children[v] = found
+                queue.extend(found)
+
+    for root in range(n):
+        if grounded[root]:
+            search(root)
+    for root in range(n):
+        if not visited[root]:   # only reaches a loop without ground
+            search(root)
+
+    # Step 3: Width of every subtree (in slots) and the offset of its root, bottom-up
+    width = [1.0] * n
+    center = [0.5] * n
+    for v in reversed(order):
+        kids = children[v]
+        if kids:
+            total = 0.0
+            for c in kids:
+                total += width[c]
+            width[v] = total
+            first, last = kids[0], kids[-1]
+            center[v] = (center[first] + total - width[last] + center[last]) / 2
+
+    # Step 4: Absolute slots, top-down from the roots placed side by side
+    left_edge = [0.0] * n
+    offset = 0.0
+    for root in roots:
+        left_edge[root] = offset
+        offset += width[root]
+    x = np.empty(n)
+    for v in order:
+        left = left_edge[v]
+        x[v] = left + center[v]
+        for c in children[v]:
+            left_edge[c] = left
+            left += width[c]
+    levels = np.asarray(depth, dtype=np.float64)
+    top = levels.max() if n else 0.0
+
+    positions = np.empty((n, 2))
+    positions[:, 0] = (x + 0.5) * node_spacing
+    positions[:, 1] = (top - levels + 1) * layer_spacing
+
+    if cache is not None:
+        cache.put(key, positions)
+    return positions
+
+
+def apply_positions(graph, positions, rows=None):
+    """
+    Writes canvas positions into graph data.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph), edited in place
+        positions (numpy.ndarray): (n, 2) positions in node order
+        rows (array_like, optional): Only write these nodes (default: all)
+    """
+    rows = range(len(positions)) if rows is None else [int(row) for row in rows]
+    table = getattr(graph, 'table', None)
+    if table is not None:
+        rows = list(rows)
+        table.set_positions(rows, positions[rows])
+        return
+    nodes = graph['nodes']
+    values = positions.tolist()
+    for row in rows:
+        x, y = values[row]
+        nodes[row]['position'] = {'x': x, 'y': y}
+
+
+def fill_positions(graph, node_spacing=NODE_SPACING, layer_spacing=LAYER_SPACING,
+                   cache=None):
+    """
+    Gives every node without a stored position one, keeping all stored positions.
+
+    If no node has a position, the whole layered layout is used. Otherwise only the
+    missing nodes are placed, around the nodes they are connected to (see
+    _place_near_neighbours); groups of missing nodes without any placed neighbour
+    are laid out on their own to the right of the drawing.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph), edited in place
+        node_spacing (float): Horizontal slot distance
+        layer_spacing (float): Vertical layer distance
+        cache (LayoutCache, optional): Cache of layouts
+
+    Returns:
+        int: Number of nodes that were placed
+    """
+    stored = node_positions(graph)
+    missing = np.isnan(stored).any(axis=1)
+    if not missing.any():
+        return 0
+    rows = np.flatnonzero(missing)
+    if missing.all():
+        apply_positions(graph, layered_layout(graph, node_spacing, layer_spacing, cache), rows)
+        return len(rows)
+
+    positions = stored.copy()
+    unplaced = _place_near_neighbours(graph, positions, missing, node_spacing, layer_spacing)
+    if unplaced:
+        # Step 4: Unconnected groups side by side with the drawing, on its bottom layer
+        node_ids = _node_ids(graph)
+        ids = {node_ids[row] for row in unplaced}
+        subgraph = {
+            'nodes': [{'data': {'id': node_ids[row]}} for row in unplaced],
+            'edges': [edge for edge in graph['edges']
+                      if edge['data']['source'] in ids and edge['data']['target'] in ids]
+        }
+        layout = layered_layout(subgraph, node_spacing, layer_spacing, cache)
+        placed = stored[~missing]
+        layout[:, 0] += placed[:, 0].max() + node_spacing - layout[:, 0].min()
+        layout[:, 1] += placed[:, 1].max() - layout[:, 1].max()
+        positions[unplaced] = layout
+    apply_positions(graph, positions, rows)
+    return len(rows)
+
+
+def _place_near_neighbours(graph, positions, missing, node_spacing, layer_spacing):
+    """
+    Places missing nodes next to their placed neighbours, following the load flow.
+
+    Missing nodes are visited breadth-first from the placed nodes. Each one goes one
+    layer above the placed nodes it transfers load into (or one layer below the
+    placed nodes that load it), centred over them, in the nearest free slot of
+    that layer. Nodes placed this way count as placed for their neighbours.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        positions (numpy.ndarray): (n, 2) stored positions, NaN rows are filled in
+        missing (numpy.ndarray): (n,) mask of the nodes without a position
+        node_spacing (float): Horizontal slot distance
+        layer_spacing (float): Vertical layer distance
+
+    Returns:
+        list: Rows of the missing nodes without any placed neighbour, in node order
+    """
+    node_ids = _node_ids(graph)
+    index = {}
+    for i, node_id in enumerate(node_ids):
+        index.setdefault(node_id, i)   # duplicated IDs: edges attach to the first
+
+    # Step 1: Connections of the missing nodes only
+    targets = {}
+    sources = {}
+    for edge in graph['edges']:
+        data = edge['data']
+        source = index.get(data['source'])
+        target = index.get(data['target'])
+        if source is None or target is None or source == target:
+            continue
+        if missing[source]:
+            targets.setdefault(source, []).append(target)
+        if missing[target]:
+            sources.setdefault(target, []).append(source)
+
+    # Step 2: Occupied slots (positions rounded to the slot grid)
+    def slot(x, y):
+        return round(x / node_spacing), round(y / layer_spacing)
+
+    occupied = {slot(x, y) for x, y in positions[~missing].tolist()}
+
+    # Step 3: Breadth-first from the placed nodes
+    placed = ~missing
+    queue = deque(row for row in np.flatnonzero(missing).tolist()
+                  if any(placed[other] for other in targets.get(row, ()))
+                  or any(placed[other] for other in sources.get(row, ())))
+    queued = set(queue)
+    while queue:
+        row = queue.popleft()
+        below = [other for other in targets.get(row, ()) if placed[other]]
+        above = [other for other in sources.get(row, ()) if placed[other]]
+        if below:
+            x = positions[below, 0].mean()
+            y = positions[below, 1].min() - layer_spacing
+        else:
+            x = positions[above, 0].mean()
+            y = positions[above, 1].max() + layer_spacing
+        column, layer = slot(x, y)
+        step = 0
+        while (column + step, layer) in occupied:
+            # Nearest free slot: right, left, two to the right, ...
+            step = -step if step > 0 else 1 - step
+        occupied.add((column + step, layer))
+        positions[row] = (x + step * node_spacing, y)
+        placed[row] = True
+        for other in targets.get(row, []) + sources.get(row, []):
+            if not placed[other] and other not in queued:
+                queued.add(other)
+                queue.append(other)
+    return np.flatnonzero(~placed).tolist()
+
+
+def free_position(graph, node_spacing=NODE_SPACING, layer_spacing=LAYER_SPACING):
+    """
+    Returns a position for a new, unconnected node: next to the rightmost node of
+    the bottom (grounded) layer, or the first slot of an empty canvas.
+
+    Returns:
+        dict: {'x': ..., 'y': ...}
+    """
+    stored = node_positions(graph)
+    stored = stored[~np.isnan(stored).any(axis=1)]
+    if len(stored) == 0:
+        return {'x': float(node_spacing), 'y': float(layer_spacing)}
+    return {'x': float(stored[:, 0].max() + node_spacing), 'y': float(stored[:, 1].max())}
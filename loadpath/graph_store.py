@@ -0,0 +1,350 @@
+"""
+Server-Side Graph Store
+
+This module keeps load path graphs on the server, keyed by a session ID, so that the
+browser only has to hold a small handle ({"session": ..., "version": ...}) instead of
+the whole model.
+
+Graphs live in a process-local LRU cache. When a path is configured, graphs evicted
+from the cache are written to a SQLite database and transparently loaded back on
+the next access (optionally every change is written through immediately, e.g. when
+several server processes share one database). Without a database an evicted graph
+is gone, so only graphs that were never edited and graphs that have not been used
+for ``idle_timeout`` seconds are evicted; when none of them can make room, new
+sessions are refused with StoreFullError.
+
+A graph is never replaced by an empty one: sessions that are not cached and not
+found in the database (e.g. unknown IDs) raise SessionNotFoundError.
+
+Graphs are edited in place, so every read-edit-put sequence must run inside
+session(), which serializes the requests of one session and rejects edits that
+were made on an outdated version of the graph (VersionConflictError).
+
+A graph factory can convert the stored graphs to another in-memory representation
+(e.g. graph_columns.ColumnarGraph.from_json); such graphs are saved through their
+to_json() method.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+
+from .graph_index import GraphIndex
+
+
+class SessionNotFoundError(KeyError):
+    """
+    Raised for sessions that are neither cached nor stored in the database.
+
+    Attributes:
+        session_id (str): Session identifier
+    """
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        super().__init__(f"Graph session {session_id} not found")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class VersionConflictError(ValueError):
+    """
+    Raised when an edit is based on an outdated version of a session's graph.
+
+    Attributes:
+        session_id (str): Session identifier
+        version (int): Version the edit was based on
+        current (int): Current version of the graph
+    """
+
+    def __init__(self, session_id, version, current):
+        self.session_id = session_id
+        self.version = version
+        self.current = current
+        super().__init__(f"Graph session {session_id} is at version {current}, "
+                         f"the edit was made on version {version}")
+
+
+class StoreFullError(RuntimeError):
+    """
+    Raised when a new session does not fit into a store without a database.
+
+    Attributes:
+        capacity (int): Maximum number of graphs kept in memory
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        super().__init__(f"The graph store already holds {capacity} sessions in use")
+
+
+class GraphStore:
+    """
+    Session-keyed graph storage with an in-memory LRU and an optional SQLite tier.
+
+    Graphs returned by get() are the live cached objects: callers edit them in place
+    inside session() and then call put() to bump the version (and persist them if
+    write-through is on).
+
+    Example:
+        >>> store = GraphStore(capacity=8, path='graphs.sqlite')
+        >>> handle = store.create({'nodes': [], 'edges': []})
+        >>> with store.session(handle['session'], handle['version']) as graph:
+        ...     graph['nodes'].append(node)
+        ...     store.put(handle['session'], graph)
+        {'session': '3f2a...', 'version': 1}
+    """
+
+    def __init__(self, capacity=32, path=None, write_through=False, graph_factory=None,
+                 idle_timeout=3600):
+        """
+        Creates the store.
+
+        Args:
+            capacity (int): Maximum number of graphs kept in memory
+            path (str, optional): SQLite database file used as fallback storage
+            write_through (bool): Write every put() to SQLite immediately instead of
+                only on eviction (requires ``path``)
+            graph_factory (callable, optional): Converts graph data (dict) into the
+                in-memory representation of stored graphs
+            idle_timeout (float): Without a database, seconds after which an edited
+                graph that is not used any more may be evicted to make room
+        """
+        self.capacity = capacity
+        self.path = path
+        self.write_through = write_through and path is not None
+        self.graph_factory = graph_factory
+        self.idle_timeout = idle_timeout
+        # session ID -> [graph, version, dirty, index, last use (time.monotonic)]
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._session_locks = weakref.WeakValueDictionary()  # session ID -> RLock in use
+        if path is not None:
+            with closing(sqlite3.connect(path)) as db, db:
+                db.execute("CREATE TABLE IF NOT EXISTS graphs ("
+                           "session TEXT PRIMARY KEY, version INTEGER, data TEXT)")
+
+    def create(self, graph=None):
+        """
+        Starts a new session holding ``graph`` (default: an empty graph).
+
+        Args:
+            graph (dict, optional): Initial graph data
+
+        Returns:
+            dict: Handle of the new session
+
+        Raises:
+            StoreFullError: If the store has no database and no graph can be evicted
+        """
+        session_id = uuid.uuid4().hex
+        return self.put(session_id, graph if graph is not None else self._empty(), version=0)
+
+    @contextmanager
+    def session(self, session_id, version=None):
+        """
+        Locks a session for a read-edit-put sequence.
+
+        Requests of the same session run one after the other; other sessions are
+        not blocked. The lock is reentrant, so nested calls of one request are fine.
+
+        Args:
+            session_id (str): Session identifier
+            version (int, optional): Version the caller's view of the graph is based
+                on; the edit is rejected if the graph has changed since
+
+        Yields:
+            dict: Live graph data of the session
+
+        Raises:
+            SessionNotFoundError: If the session is unknown
+            VersionConflictError: If ``version`` is not the current version
+        """
+        with self._lock:
+            lock = self._session_locks.get(session_id)
+            if lock is None:
+                lock = self._session_locks[session_id] = threading.RLock()
+        with lock:
+            graph, current = self._entry(session_id)[:2]
+            if version is not None and version != current:
+                raise VersionConflictError(session_id, version, current)
+            yield graph
+
+    def get(self, session_id):
+        """
+        Returns the graph of a session, loading it from SQLite if needed.
+
+        Args:
+            session_id (str): Session identifier
+
+        Returns:
+            dict: Live graph data of the session
+
+        Raises:
+            SessionNotFoundError: If the session is unknown
+        """
+        return self._entry(session_id)[0]
+
+    def index(self, session_id):
+        """
+        Returns the lookup index of a session's graph, building it on first use.
+
+        The index is kept as long as the session's graph object is not replaced, so
+        edits made through it stay indexed across callbacks.
+
+        Args:
+            session_id (str): Session identifier
+
+        Returns:
+            GraphIndex: Index over the live graph data of the session
+        """
+        with self._lock:
+            entry = self._entry(session_id)
+            if entry[3] is None:
+                entry[3] = GraphIndex(entry[0])
+            return entry[3]
+
+    def version(self, session_id):
+        """
+        Returns the current version number of a session's graph.
+        """
+        return self._entry(session_id)[1]
+
+    def put(self, session_id, graph, version=None):
+        """
+        Stores a session's graph and bumps its version.
+
+        Args:
+            session_id (str): Session identifier
+            graph (dict): Graph data (typically the object returned by get()); plain
+                dicts are converted by the graph factory
+            version (int, optional): Explicit version (default: current version + 1)
+
+        Returns:
+            dict: Handle with the session ID and the new version
+
+        Raises:
+            SessionNotFoundError: If no version is given and the session is unknown
+            StoreFullError: If the session is new, the store has no database and no
+                graph can be evicted
+        """
+        with self._lock:
+            if version is None:
+                version = self._entry(session_id)[1] + 1
+            entry = self._cache.get(session_id)
+            if entry is None:
+                self._evict(reserve=1)
+            if self.graph_factory is not None and isinstance(graph, dict):
+                graph = self.graph_factory(graph)
+            index = entry[3] if entry is not None and entry[0] is graph else None
+            self._cache[session_id] = [graph, version, True, index, time.monotonic()]
+            self._cache.move_to_end(session_id)
+            if self.write_through:
+                self._write(session_id)
+            return self.handle(session_id)
+
+    def handle(self, session_id):
+        """
+        Returns the small handle that is kept in the browser for a session.
+        """
+        return {'session': session_id, 'version': self.version(session_id)}
+
+    def flush(self):
+        """
+        Writes every modified cached graph to SQLite.
+        """
+        with self._lock:
+            for session_id in self._cache:
+                self._write(session_id)
+
+    def _entry(self, session_id):
+        """
+        Returns the cache entry of a session, loading it from SQLite on a miss.
+        """
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                self._cache.move_to_end(session_id)
+                entry[4] = time.monotonic()
+                return entry
+            entry = self._read(session_id)
+            if entry is None:
+                raise SessionNotFoundError(session_id)
+            self._evict(reserve=1)
+            self._cache[session_id] = entry
+            return entry
+
+    def _empty(self):
+        """
+        Returns a new empty graph.
+        """
+        graph = {'nodes': [], 'edges': []}
+        return graph if self.graph_factory is None else self.graph_factory(graph)
+
+    def _evict(self, reserve=0):
+        """
+        Drops least recently used graphs until ``reserve`` more fit into the capacity.
+
+        With a database, graphs are saved to SQLite first. Without one, graphs that
+        were never edited (version 0) go first, then graphs that have not been used
+        for ``idle_timeout`` seconds. Sessions with a request in progress are kept.
+
+        Raises:
+            StoreFullError: If room for a new graph is needed but cannot be made
+        """
+        excess = len(self._cache) + reserve - self.capacity
+        if excess <= 0:
+            return
+        idle = [session_id for session_id in self._cache
+                if session_id not in self._session_locks]
+        if self.path is None:
+            now = time.monotonic()
+            idle = ([session_id for session_id in idle if self._cache[session_id][1] == 0]
+                    + [session_id for session_id in idle if self._cache[session_id][1] != 0
+                       and now - self._cache[session_id][4] >= self.idle_timeout])
+        for session_id in idle[:excess]:
+            self._write(session_id)
+            del self._cache[session_id]
+        if reserve and len(idle) < excess and self.path is None:
+            raise StoreFullError(self.capacity)
+
+    def _read(self, session_id):
+        """
+        Loads a session's graph from SQLite.
+        """
+        if self.path is None:
+            return None
+        with closing(sqlite3.connect(self.path)) as db:
+            row = db.execute("SELECT version, data FROM graphs WHERE session = ?",
+                             (session_id,)).fetchone()
+        if row is None:
+            return None
+        graph = json.loads(row[1])
+        if self.graph_factory is not None:
+            graph = self.graph_factory(graph)
+        return [graph, row[0], False, None, time.monotonic()]
+
+    def _write(self, session_id):
+        """
+        Saves a modified cached graph to SQLite.
+        """
+        entry = self._cache[session_id]
+        if self.path is None or not entry[2]:
+            return
+        graph = entry[0]
+        if hasattr(graph, 'to_json'):
+            graph = graph.to_json()
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute("INSERT OR REPLACE INTO graphs (session, version, data) VALUES (?, ?, ?)",
+                       (session_id, entry[1], json.dumps(graph)))
+        entry[2] = False
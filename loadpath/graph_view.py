@@ -0,0 +1,159 @@
+"""
+Large Graph Views
+
+Level-of-detail Cytoscape elements for graphs that are too large to draw in full.
+Only the part of the graph inside the viewport is returned:
+
+- Detail level: if few nodes are visible, they are returned unchanged with the
+  edges between them (class 'lod'; labels are hidden by the renderer when they
+  become too small to read)
+- Overview level: otherwise the visible nodes are clustered on a grid. Every cell
+  with more than one node becomes a single cluster node (class 'cluster') at the
+  centroid of its members, labelled with their count, and edges are merged per
+  pair of cells (class 'overview', drawn as haystack edges without labels)
+
+Nodes outside the viewport (plus a margin) and edges to them are left out. The
+same algorithm runs in the browser for graph data kept there
+(levelOfDetail in assets/clientside.js).
+
+Example:
+    >>> if is_large_graph(graph, threshold=3000):
+    ...     elements = level_of_detail(graph, extent={'x1': 0, 'y1': 0, 'x2': 800, 'y2': 600})
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+# Prefix of the IDs of cluster nodes and merged edges (never a node or edge ID)
+CLUSTER_PREFIX = 'cluster:'
+
+
+def is_large_graph(graph, threshold):
+    """
+    Returns whether a graph has more elements (nodes + edges) than ``threshold``.
+    """
+    return len(graph['nodes']) + len(graph['edges']) > threshold
+
+
+def node_positions(graph):
+    """
+    Returns the canvas positions of all nodes as an (n, 2) array (NaN if missing).
+
+    Columnar graphs (see graph_columns) return a view of their position column.
+    """
+    table = getattr(graph, 'table', None)
+    if table is not None:
+        return table.position[:table.size]
+    positions = np.full((len(graph['nodes']), 2), np.nan)
+    for row, node in enumerate(graph['nodes']):
+        position = node.get('position')
+        if position:
+            try:
+                positions[row] = (float(position['x']), float(position['y']))
+            except (KeyError, TypeError, ValueError):
+                pass
+    return positions
+
+
+def level_of_detail(graph, extent=None, detail_nodes=1500, grid=48, margin=0.25):
+    """
+    Returns the Cytoscape elements of the part of a graph inside the viewport.
+
+    Args:
+        graph (dict): Graph data (or a ColumnarGraph)
+        extent (dict, optional): Viewport in model coordinates ({x1, y1, x2, y2}),
+            as reported by the Cytoscape ``extent`` property (default: all nodes)
+        detail_nodes (int): Maximum number of visible nodes drawn individually
+        grid (int): Number of cluster cells along the longer viewport side
+        margin (float): Fraction of the viewport size added on every side, so
+            that short pans do not show empty borders
+
+    Returns:
+        list: Nodes followed by edges, as Cytoscape elements
+    """
+    nodes = graph['nodes']
+    positions = node_positions(graph)
+    placed = ~np.isnan(positions).any(axis=1)
+    if extent is None:
+        if not placed.any():
+            return []
+        x1, y1 = positions[placed].min(axis=0)
+        x2, y2 = positions[placed].max(axis=0)
+    else:
+        x1, y1, x2, y2 = (float(extent[key]) for key in ('x1', 'y1', 'x2', 'y2'))
+    pad_x = (x2 - x1) * margin
+    pad_y = (y2 - y1) * margin
+    x1, x2, y1, y2 = x1 - pad_x, x2 + pad_x, y1 - pad_y, y2 + pad_y
+
+    with np.errstate(invalid='ignore'):
+        inside = (placed & (positions[:, 0] >= x1) & (positions[:, 0] <= x2)
+                  & (positions[:, 1] >= y1) & (positions[:, 1] <= y2))
+    rows = np.flatnonzero(inside)
+
+    if len(rows) <= detail_nodes:
+        # Step 1a: Detail level - the visible nodes themselves
+        elements = []
+        visible = set()
+        for row in rows.tolist():
+            element = nodes[row].copy()
+            element['classes'] = 'lod'
+            visible.add(element['data']['id'])
+            elements.append(element)
+        for edge in graph['edges']:
+            data = edge['data']
+            if data['source'] in visible and data['target'] in visible:
+                elements.append({'data': data, 'classes': 'lod'})
+        return elements
+
+    # Step 1b: Overview level - one cluster per occupied grid cell
+    cell = max(x2 - x1, y2 - y1) / grid or 1.0
+    cells = np.floor((positions[rows] - (x1, y1)) / cell).astype(np.int64)
+    keys, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    centers = np.column_stack([np.bincount(inverse, positions[rows, axis]) / counts
+                               for axis in (0, 1)])
+
+    elements = []
+    representative = {}   # node ID -> ID of the element drawn for it
+    cluster_ids = [f'{CLUSTER_PREFIX}{kx}:{ky}' for kx, ky in keys.tolist()]
+    for index, count in enumerate(counts.tolist()):
+        if count > 1:
+            x, y = centers[index].tolist()
+            elements.append({
+                'data': {'id': cluster_ids[index], 'name': str(count), 'count': count},
+                'position': {'x': x, 'y': y},
+                'classes': 'lod overview cluster',
+                'grabbable': False
+            })
+    for row, index in zip(rows.tolist(), inverse.tolist()):
+        node_id = nodes[row]['data']['id']
+        if counts[index] > 1:
+            representative[node_id] = cluster_ids[index]
+        else:
+            element = nodes[row].copy()
+            element['classes'] = 'lod overview'
+            representative[node_id] = node_id
+            elements.append(element)
+
+    # Step 2: Merge the edges between the same pair of drawn elements
+    first_edges = {}   # (source, target) -> data of the first edge
+    edge_counts = {}
+    for edge in graph['edges']:
+        data = edge['data']
+        source = representative.get(data['source'])
+        target = representative.get(data['target'])
+        if source is None or target is None or source == target:
+            continue
+        pair = (source, target)
+        first_edges.setdefault(pair, data)
+        edge_counts[pair] = edge_counts.get(pair, 0) + 1
+    for (source, target), data in first_edges.items():
+        count = edge_counts[(source, target)]
+        if count > 1 or source.startswith(CLUSTER_PREFIX) or target.startswith(CLUSTER_PREFIX):
+            data = {'id': f'{CLUSTER_PREFIX}{source}|{target}', 'source': source,
+                    'target': target, 'count': count}
+        elements.append({'data': data, 'classes': 'lod overview'})
+    return elements
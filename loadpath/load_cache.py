@@ -0,0 +1,306 @@
+"""
+Analysis Result Cache
+
+Memoizes contributor and load analyses by the content of the model instead of by
+the object or file it came from, so a model that is reopened, re-imported or
+analysed again by someone else is not recomputed.
+
+Results are keyed by content hashes:
+- topology_key: the declared node IDs and the connections (ID, source, target).
+  Contributor results only depend on these
+- properties_key: the load properties of the declared nodes (mass, CoG, force,
+  moment, Euler angles, rotation order, translation). Load results depend on both
+  keys and on gravity
+
+Canvas positions, colors and other display data are part of neither key, so moving
+nodes never invalidates a result, and editing a property only invalidates load
+results (contributor sets stay cached).
+
+Results live in a process-local LRU cache. When a path is configured, results
+that can be stored as JSON are also written to a SQLite database and found there
+by later processes (e.g. repeated batch reports over the same models).
+
+Hashing a model is linear in its size. The keys of a LoadPathGraph are computed
+once per graph object (graphs are not edited after they are built), so repeated
+queries on the same LoadPathGraph are dictionary lookups. Graph data and columnar
+graphs are edited in place, so their keys are remembered under a version given by
+the caller instead (e.g. the session ID and version of a graph_store session).
+
+Example:
+    >>> cache = AnalysisCache(capacity=256, path='results.sqlite')
+    >>> graph = LoadPathGraph(json_data)
+    >>> find_all_load_contributors(graph, cache=cache)   # computed
+    >>> find_all_load_contributors(graph, cache=cache)   # cached
+    >>> compute_edge_loads(graph, cache=cache)
+    >>> cache.loads_key(stored_graph, GRAVITY, version=(session_id, 3))   # hashed once
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import closing
+
+from .load_graph import LoadPathGraph
+
+# Format of the results stored in SQLite; results stored in another format are ignored
+FORMAT_VERSION = 2
+
+# Node data keys that influence loads, in the layout of LoadPathGraph.properties
+_PROPERTY_ARRAYS = (('mass', 'float64'), ('cog', 'float64'), ('external_force', 'float64'),
+                    ('moment', 'float64'), ('euler_angles', 'float64'),
+                    ('translation', 'float64'), ('rotation_order', 'int8'))
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def _declared_data(graph):
+    """
+    Returns the declared nodes of graph data by node ID: their data, or their row
+    for columnar graphs. Like LoadPathGraph, the last declaration of an ID wins.
+    """
+    table = getattr(graph, 'table', None)
+    if table is not None:
+        return {node_id: row for row, node_id in enumerate(table.ids[:table.size])}
+    return {node['data']['id']: node['data'] for node in graph['nodes']}
+
+
+def topology_key(graph):
+    """
+    Returns the content hash of everything contributor results depend on.
+
+    Args:
+        graph (dict or LoadPathGraph): Graph data (or a ColumnarGraph or an opened
+            binary model)
+
+    Returns:
+        str: Hex digest
+    """
+    if isinstance(graph, LoadPathGraph):
+        edges = [[edge_id, data['source'], data['target']]
+                 for edge_id, data in graph.edges.items()]
+        content = [list(graph.nodes), edges]
+        if sum(map(len, graph.out_edges.values())) != len(edges):
+            # Duplicated edge IDs: the first edge is kept, but every edge carries load
+            content.append([graph.predecessors[node_id] for node_id in graph.node_ids])
+    elif hasattr(graph, 'to_graph') and not hasattr(graph, 'table'):
+        return topology_key(LoadPathGraph.from_json(graph))   # e.g. graph_binary.BinaryModel
+    else:
+        edges = []
+        for i, edge in enumerate(graph['edges']):
+            data = edge['data']
+            edges.append([data.get('id', f'e{i}'), data['source'], data['target']])
+        content = [list(_declared_data(graph)), edges]
+    return _digest(json.dumps(content))
+
+
+def properties_key(graph):
+    """
+    Returns the content hash of the load properties of the declared nodes.
+
+    Properties are hashed as the arrays the load engine uses, so the same model
+    gives the same key as JSON data, as a ColumnarGraph and as a LoadPathGraph.
+
+    Args:
+        graph (dict or LoadPathGraph): Graph data (or a ColumnarGraph or an opened
+            binary model)
+
+    Returns:
+        str: Hex digest
+    """
+    import numpy as np
+    from .load_transfer import node_properties
+
+    if isinstance(graph, LoadPathGraph):
+        if graph.properties is None:
+            properties = node_properties(list(graph.nodes.values()))
+        else:
+            # Declared nodes come first in node_ids
+            properties = {name: values[:len(graph.nodes)]
+                          for name, values in graph.properties.items()}
+    elif hasattr(graph, 'table'):
+        properties = graph.table.properties()
+        rows = list(_declared_data(graph).values())
+        if len(rows) != graph.table.size:
+            properties = {name: values[rows] for name, values in properties.items()}
+    elif hasattr(graph, 'to_graph'):
+        return properties_key(LoadPathGraph.from_json(graph))
+    else:
+        properties = node_properties(list(_declared_data(graph).values()))
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name, dtype in _PROPERTY_ARRAYS:
+        digest.update(np.ascontiguousarray(properties[name], dtype=dtype).tobytes())
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Thread-safe LRU cache of analysis results with an optional SQLite tier.
+
+    Cached results are shared between callers and must not be modified.
+
+    Example:
+        >>> cache = AnalysisCache(capacity=256)
+        >>> key = cache.topology_key(graph)
+        >>> cache.memoize('all_contributors', key, lambda: analyse(graph))
+    """
+
+    def __init__(self, capacity=256, path=None):
+        """
+        Creates the cache.
+
+        Args:
+            capacity (int): Maximum number of results kept in memory
+            path (str, optional): SQLite database file for results stored as JSON
+        """
+        self.capacity = capacity
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()   # (kind, key) -> result
+        self._keys = weakref.WeakKeyDictionary()   # LoadPathGraph -> {key name: key}
+        self._versions = OrderedDict()   # graph version -> {key name: key}
+        self._lock = threading.RLock()
+        if path is not None:
+            with closing(sqlite3.connect(path)) as db, db:
+                db.execute("CREATE TABLE IF NOT EXISTS results ("
+                           "kind TEXT, key TEXT, data TEXT, PRIMARY KEY (kind, key))")
+
+    def topology_key(self, graph, version=None):
+        """
+        Returns topology_key(graph), computed once per LoadPathGraph or graph version.
+
+        Args:
+            graph (dict or LoadPathGraph): Graph data (or a ColumnarGraph)
+            version (hashable, optional): Identifies the content of a graph that is
+                edited in place, e.g. (session ID, version); must change with every edit
+        """
+        return self._graph_key(graph, 'topology', topology_key, version)
+
+    def properties_key(self, graph, version=None):
+        """
+        Returns properties_key(graph), computed once per LoadPathGraph or graph version.
+        """
+        return self._graph_key(graph, 'properties', properties_key, version)
+
+    def loads_key(self, graph, gravity, version=None):
+        """
+        Returns the key of load results: topology, properties and gravity.
+        """
+        gravity = ','.join(repr(float(value)) for value in gravity)
+        return (f'{self.topology_key(graph, version)}:{self.properties_key(graph, version)}'
+                f':{gravity}')
+
+    def get(self, kind, key):
+        """
+        Returns a cached result (None if unknown), looking in SQLite after memory.
+
+        Args:
+            kind (str): Kind of result, e.g. 'all_contributors'
+            key (str): Content key of the result
+
+        Returns:
+            object or None: Cached result
+        """
+        with self._lock:
+            result = self._results.get((kind, key))
+            if result is None and self.path is not None:
+                result = self._read(kind, key)
+                if result is not None:
+                    self._remember(kind, key, result)
+            if result is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end((kind, key))
+            self.hits += 1
+            return result
+
+    def put(self, kind, key, result, persist=True):
+        """
+        Stores a result.
+
+        Args:
+            kind (str): Kind of result
+            key (str): Content key of the result
+            result (object): Result (must not be None)
+            persist (bool): Also write it to SQLite (the result must be JSON data)
+        """
+        with self._lock:
+            self._remember(kind, key, result)
+            if persist and self.path is not None:
+                with closing(sqlite3.connect(self.path)) as db, db:
+                    db.execute("INSERT OR REPLACE INTO results (kind, key, data) VALUES (?, ?, ?)",
+                               (kind, f'{FORMAT_VERSION}:{key}', json.dumps(result)))
+
+    def memoize(self, kind, key, compute, persist=True):
+        """
+        Returns a cached result, computing and storing it on a miss.
+
+        Args:
+            kind (str): Kind of result
+            key (str): Content key of the result
+            compute (callable): Computes the result
+            persist (bool): Write new results to SQLite (they must be JSON data)
+
+        Returns:
+            object: Cached or computed result
+        """
+        result = self.get(kind, key)
+        if result is None:
+            result = compute()
+            if result is not None:
+                self.put(kind, key, result, persist)
+        return result
+
+    def clear(self):
+        """
+        Drops every result kept in memory (the SQLite tier is kept).
+        """
+        with self._lock:
+            self._results.clear()
+
+    def _graph_key(self, graph, name, compute, version=None):
+        """
+        Returns a content key of a graph, remembered on LoadPathGraph objects and
+        under graph versions.
+        """
+        if not isinstance(graph, LoadPathGraph) and version is None:
+            return compute(graph)
+        with self._lock:
+            if isinstance(graph, LoadPathGraph):
+                keys = self._keys.setdefault(graph, {})
+            else:
+                keys = self._versions.setdefault(version, {})
+                self._versions.move_to_end(version)
+                while len(self._versions) > self.capacity:
+                    self._versions.popitem(last=False)
+            if name not in keys:
+                keys[name] = compute(graph)
+            return keys[name]
+
+    def _remember(self, kind, key, result):
+        """
+        Adds a result to the LRU, dropping the least recently used beyond capacity.
+        """
+        self._results[(kind, key)] = result
+        self._results.move_to_end((kind, key))
+        while len(self._results) > self.capacity:
+            self._results.popitem(last=False)
+
+    def _read(self, kind, key):
+        """
+        Loads a result from SQLite.
+        """
+        with closing(sqlite3.connect(self.path)) as db:
+            row = db.execute("SELECT data FROM results WHERE kind = ? AND key = ?",
+                             (kind, f'{FORMAT_VERSION}:{key}')).fetchone()
+        return None if row is None else json.loads(row[0])
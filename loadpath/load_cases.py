@@ -0,0 +1,167 @@
+"""
+Load Case Sweep Module
+
+This module evaluates one load path topology under many load cases (wind directions,
+gust factors, mass variants with or without ice, ...) in a single batched call.
+
+The topology dependent work (graph indexing, rotation matrices, global CoG positions
+and the upstream reduction) is done once by load_transfer.LoadTransferModel. Every
+additional load case then only costs the batched force/moment transform and the
+linear upstream sum, without any re-traversal of the graph.
+
+Results are returned as one (n_cases, n_edges, 6) array with the columns
+Fx, Fy, Fz, Mx, My, Mz, and can be written to a compact columnar ``.npz`` file.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+from .load_transfer import LoadTransferModel
+
+# Column order of the last axis of the load case result array
+LOAD_COLUMNS = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+
+# Upper bound on the number of float64 values held in one intermediate case chunk
+CHUNK_ELEMENTS = 8_000_000
+
+
+def _case_count(external_force, moment, mass):
+    """
+    Returns the number of load cases implied by the given case arrays.
+    """
+    counts = {np.shape(a)[0] for a in (external_force, moment, mass) if a is not None}
+    if not counts:
+        raise ValueError("At least one of external_force, moment or mass must be given")
+    if len(counts) > 1:
+        raise ValueError(f"Inconsistent number of load cases: {sorted(counts)}")
+    return counts.pop()
+
+
+def _check_shape(name, array, expected):
+    """
+    Converts a case array to float64 and validates its shape.
+    """
+    if array is None:
+        return None
+    array = np.asarray(array, dtype=np.float64)
+    if array.shape != expected:
+        raise ValueError(f"{name} must have shape {expected}, got {array.shape}")
+    return array
+
+
+def prepare_load_cases(model, external_force=None, moment=None, mass=None):
+    """
+    Validates load case arrays against a model and converts them to float64.
+
+    Args:
+        model (LoadTransferModel): Prepared model
+        external_force (array_like, optional): (n_cases, n_nodes, 3) local forces
+        moment (array_like, optional): (n_cases, n_nodes, 3) local moments
+        mass (array_like, optional): (n_cases, n_nodes) node masses
+
+    Returns:
+        tuple: (n_cases, external_force, moment, mass) with None kept for missing arrays
+
+    Raises:
+        ValueError: If no case arrays are given or their shapes do not match the model
+    """
+    n_cases = _case_count(external_force, moment, mass)
+    n_nodes = len(model.node_ids)
+    return (n_cases,
+            _check_shape('external_force', external_force, (n_cases, n_nodes, 3)),
+            _check_shape('moment', moment, (n_cases, n_nodes, 3)),
+            _check_shape('mass', mass, (n_cases, n_nodes)))
+
+
+def run_load_cases(model, external_force=None, moment=None, mass=None, chunk_size=None):
+    """
+    Computes the per-edge resultant loads of a topology for many load cases.
+
+    Node arrays follow ``model.node_ids`` order. Any property that is not given is
+    taken from the model (i.e. from the graph data) for every case.
+
+    Args:
+        model (LoadTransferModel or dict or LoadPathGraph): Prepared model, or graph
+            data to build one from
+        external_force (array_like, optional): (n_cases, n_nodes, 3) local forces
+        moment (array_like, optional): (n_cases, n_nodes, 3) local moments
+        mass (array_like, optional): (n_cases, n_nodes) node masses
+        chunk_size (int, optional): Number of cases evaluated per batch. By default
+            it is chosen so that intermediate arrays stay below CHUNK_ELEMENTS values.
+
+    Returns:
+        numpy.ndarray: (n_cases, n_edges, 6) loads with columns LOAD_COLUMNS, edges
+            in ``model.edge_ids`` order
+
+    Raises:
+        ValueError: If no case arrays are given or their shapes do not match the model
+
+    Example:
+        >>> model = LoadTransferModel(json_data)
+        >>> forces = np.repeat(model.external_force[None], 100, axis=0)
+        >>> forces[:, 0, 0] *= np.linspace(0.5, 1.5, 100)   # gust factors on node 0
+        >>> loads = run_load_cases(model, external_force=forces)
+        >>> loads.shape
+        (100, 6, 6)
+    """
+    if not isinstance(model, LoadTransferModel):
+        model = LoadTransferModel(model)
+
+    n_cases, external_force, moment, mass = prepare_load_cases(
+        model, external_force, moment, mass)
+
+    if chunk_size is None:
+        per_case = 6 * max(model.reducer.work_size, len(model.node_ids), 1)
+        chunk_size = max(1, CHUNK_ELEMENTS // per_case)
+
+    loads = np.empty((n_cases, len(model.edge_ids), 6))
+    for start in range(0, n_cases, chunk_size):
+        cases = slice(start, start + chunk_size)
+        forces, moments = model.edge_loads(
+            None if external_force is None else external_force[cases],
+            None if moment is None else moment[cases],
+            None if mass is None else mass[cases])
+        loads[cases, :, :3] = forces
+        loads[cases, :, 3:] = moments
+    return loads
+
+
+def save_load_cases(path, loads, edge_ids, case_names=None, dtype=np.float64):
+    """
+    Writes load case results to a compressed columnar ``.npz`` file.
+
+    Each load component is stored as its own (n_cases, n_edges) column array, next
+    to the edge IDs and case names.
+
+    Args:
+        path (str): Output file path
+        loads (numpy.ndarray): (n_cases, n_edges, 6) array from run_load_cases
+        edge_ids (list): Edge IDs matching the second axis of ``loads``
+        case_names (list, optional): Names of the load cases (default: "case<i>")
+        dtype (numpy.dtype): Storage precision of the load columns
+    """
+    loads = np.asarray(loads)
+    if case_names is None:
+        case_names = [f'case{i}' for i in range(loads.shape[0])]
+    columns = {name: loads[..., i].astype(dtype) for i, name in enumerate(LOAD_COLUMNS)}
+    np.savez_compressed(path, edge_ids=np.asarray(edge_ids, dtype=str),
+                        case_names=np.asarray(case_names, dtype=str), **columns)
+
+
+def read_load_cases(path):
+    """
+    Reads load case results written by save_load_cases.
+
+    Args:
+        path (str): Input file path
+
+    Returns:
+        tuple: (loads, edge_ids, case_names) where ``loads`` is the
+            (n_cases, n_edges, 6) array and the ID lists are plain Python lists
+    """
+    with np.load(path) as columns:
+        loads = np.stack([columns[name] for name in LOAD_COLUMNS], axis=-1)
+        return loads, columns['edge_ids'].tolist(), columns['case_names'].tolist()
@@ -0,0 +1,224 @@
+"""
+Load Path Contributor Analysis Module
+
+This module analyzes load paths in mechanical systems by tracing the flow of forces
+through connected components. It identifies which components contribute to the load
+at a specific connection (edge) by traversing the graph structure upstream from the
+selected edge.
+
+The analysis helps in understanding:
+- How loads are transmitted through the structure
+- Which components influence a specific connection
+- The path from load application points to the ground
+
+Loops in the load path are merged into one sub-assembly: every member of a loop
+contributes to the connections inside and downstream of it (see load_validation
+to find and reject loops).
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: March, 2025
+"""
+
+from .load_graph import LoadPathGraph, mask_to_indices
+
+def find_load_contributors(json_data, selected_edge_id, cache=None):
+    """
+    Identifies components that contribute to the load in a selected connection.
+
+    This function analyzes a mechanical system's graph structure to find all nodes
+    that can transmit forces to a specific connection (edge). It works by:
+    1. Building (or reusing) an indexed directed graph of the system
+    2. Identifying the grounded (fixed) node the selected connection's load reaches
+    3. Tracing the load path upstream from the selected connection
+    4. Collecting all nodes that can contribute forces
+
+    The upstream trace is iterative with a visited set, so each call is linear in
+    the size of the graph. Pass a prebuilt LoadPathGraph when analyzing several
+    edges of the same model to avoid rebuilding the indexes, and an AnalysisCache
+    (see load_cache) to reuse results of models with the same topology.
+
+    Args:
+        json_data (dict or LoadPathGraph or BinaryModel): JSON data containing the
+            graph structure (or a LoadPathGraph or opened binary model) with format:
+            {
+                "nodes": [
+                    {
+                        "data": {
+                            "id": str,      # Unique node identifier
+                            "name": str,    # Node name
+                            ...            # Other node properties
+                        }
+                    },
+                    ...
+                ],
+                "edges": [
+                    {
+                        "data": {
+                            "id": str,      # Unique edge identifier
+                            "source": str,  # Source node ID
+                            "target": str   # Target node ID
+                        }
+                    },
+                    ...
+                ]
+            }
+        selected_edge_id (str): ID of the edge to analyze (e.g., "e0", "e1", etc.)
+        cache (AnalysisCache, optional): Cache of analysis results, keyed by the
+            graph topology
+
+    Returns:
+        dict or None: Dictionary containing analysis results with format:
+            {
+                "selected_edge": str,     # ID of analyzed edge
+                "grounded_node": str,     # ID of the first ground node downstream
+                                          # of the edge (None if its load reaches none)
+                "grounded_nodes": list,   # IDs of all ground nodes, in file order
+                "contributors": list      # List of node IDs that contribute load
+            }
+            Returns None if the specified edge is not found.
+
+    Example:
+        >>> with open("load_path_data.json") as f:
+        ...     json_data = json.load(f)
+        >>> result = find_load_contributors(json_data, "e0")
+        >>> print(result)
+        {
+            'selected_edge': 'e0',
+            'grounded_node': 'Node3',
+            'grounded_nodes': ['Node3'],
+            'contributors': ['Node0', 'Node1', 'Node2']
+        }
+    """
+    if cache is not None:
+        key = f'{cache.topology_key(json_data)}:{selected_edge_id}'
+        return cache.memoize('contributors', key,
+                             lambda: find_load_contributors(json_data, selected_edge_id))
+    
+    # Step 1: Build (or reuse) the indexed graph
+    graph = LoadPathGraph.from_json(json_data)
+    
+    # Step 2: Check if the selected edge ID exists
+    selected_edge = graph.edge(selected_edge_id)
+    if selected_edge is None:
+        return None
+    
+    # Step 3: Identify the grounded node (no outgoing edges) the edge's load reaches
+    grounded = graph.grounded_nodes()
+    grounded_set = set(grounded)
+    grounded_node = next((node_id for node_id in graph.downstream(selected_edge["target"])
+                          if node_id in grounded_set), None)
+    
+    # Step 4: Trace upstream nodes to find load contributors
+    contributors = graph.upstream(selected_edge["source"])
+    
+    # Step 5: Return the result
+    return {
+        "selected_edge": selected_edge_id,
+        "grounded_node": grounded_node,
+        "grounded_nodes": grounded,
+        "contributors": contributors
+    }
+
+
+def find_all_load_contributors(json_data, cache=None):
+    """
+    Identifies the load contributors of every connection in a single sweep.
+
+    Calling find_load_contributors once per edge repeats the upstream trace for
+    every edge. This function instead:
+    1. Collapses strongly connected components (load path cycles) into single nodes
+    2. Walks the condensed graph once in topological order
+    3. Builds each component's upstream set as an integer bitset, shared by all of
+       its downstream components through a bitwise OR
+    4. Decodes the bitset once per distinct source node
+
+    The total work is linear in the size of the graph plus the size of the output.
+
+    Args:
+        json_data (dict or LoadPathGraph or BinaryModel): JSON data containing the
+            graph structure (same format as for find_load_contributors), a
+            LoadPathGraph or an opened binary model
+        cache (AnalysisCache, optional): Cache of analysis results, keyed by the
+            graph topology
+
+    Returns:
+        dict: Dictionary containing analysis results with format:
+            {
+                "grounded_node": str,     # ID of the first ground node in file order
+                "grounded_nodes": list,   # IDs of all ground nodes, in file order
+                "contributors": dict      # Edge ID -> list of contributing node IDs
+            }
+
+    Example:
+        >>> result = find_all_load_contributors(json_data)
+        >>> result["contributors"]["e0"]
+        ['Node0', 'Node1', 'Node2']
+    """
+    if cache is not None:
+        return cache.memoize('all_contributors', cache.topology_key(json_data),
+                             lambda: find_all_load_contributors(json_data))
+    
+    graph = LoadPathGraph.from_json(json_data)
+    
+    grounded = graph.grounded_nodes()
+    grounded_node = grounded[0] if grounded else None
+    
+    # Step 1: Condense cycles and accumulate upstream bitsets in topological order
+    components, component_of, upstream_masks = graph.upstream_bitsets()
+    
+    # Step 2: Decode each source node's bitset once and share it between edges
+    node_ids = graph.node_ids
+    decoded = {}
+    contributors = {}
+    for edge_id, edge in graph.edges.items():
+        c = component_of[edge["source"]]
+        if c not in decoded:
+            decoded[c] = [node_ids[i] for i in mask_to_indices(upstream_masks[c])]
+        contributors[edge_id] = decoded[c]
+    
+    return {
+        "grounded_node": grounded_node,
+        "grounded_nodes": grounded,
+        "contributors": contributors
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+    
+    from .graph_binary import is_binary, read_binary
+    
+    parser = argparse.ArgumentParser(description="Load path contributor analysis")
+    parser.add_argument("file", nargs="?", default="load_path_data_20250321_000033.json",
+                        help="Graph JSON file exported by the Load Path Visual Tool, "
+                             "or a binary model file (see graph_binary)")
+    parser.add_argument("--edge", default="e20", help="Edge ID to analyze")
+    parser.add_argument("--all", action="store_true",
+                        help="Analyze every edge in one pass and print one JSON line per edge")
+    args = parser.parse_args()
+    
+    if is_binary(args.file):
+        json_data = read_binary(args.file)
+    else:
+        with open(args.file) as f:
+            json_data = json.load(f)
+    
+    if args.all:
+        result = find_all_load_contributors(json_data)
+        for edge_id, edge_contributors in result["contributors"].items():
+            print(json.dumps({
+                "selected_edge": edge_id,
+                "grounded_node": result["grounded_node"],
+                "contributors": edge_contributors
+            }))
+    else:
+        result = find_load_contributors(json_data, args.edge)
+        if result is None:
+            print(f"Error: Edge with ID '{args.edge}' not found in the JSON data.")
+            sys.exit(1)
+        print(f"Grounded node: {result['grounded_node']}")
+        print(result)
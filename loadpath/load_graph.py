@@ -0,0 +1,406 @@
+"""
+Load Path Graph Model
+
+This module provides an indexed, reusable representation of a load path graph built
+from the Cytoscape-style JSON used by the Load Path Visual Tool. The graph is built
+once and then shared by the analysis functions, so that individual queries no longer
+have to rescan the full edge list.
+
+The model holds:
+- An id -> node data index (in file order)
+- An id -> edge data index (in file order)
+- Forward (successor) and reverse (predecessor) adjacency indexes
+- Integer indexes for every node id, used by the vectorized analyses
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+
+class LoadPathGraph:
+    """
+    Indexed directed graph of components (nodes) and connections (edges).
+
+    Edges point in the direction of load flow, i.e. from the component that applies
+    the load towards the grounded (fixed) component.
+
+    Attributes:
+        nodes (dict): Node ID -> node ``data`` dict, in file order
+        edges (dict): Edge ID -> edge ``data`` dict, in file order
+        node_ids (list): All node IDs known to the graph. Declared nodes come first
+            in file order, followed by any IDs that only appear as edge endpoints.
+        node_index (dict): Node ID -> position in ``node_ids``
+        successors (dict): Node ID -> list of downstream node IDs
+        predecessors (dict): Node ID -> list of upstream node IDs
+        out_edges (dict): Node ID -> list of outgoing edge IDs
+        in_edges (dict): Node ID -> list of incoming edge IDs
+        properties (dict or None): Node property columns aligned with ``node_ids``
+            (property name -> array), when the graph was built from columnar data
+    """
+
+    def __init__(self, json_data):
+        """
+        Builds all indexes from Cytoscape-style graph data in a single pass.
+
+        Args:
+            json_data (dict): Graph data with ``nodes`` and ``edges`` lists as
+                produced by the Load Path Visual Tool export.
+        """
+        self.nodes = {}
+        self.edges = {}
+        self.node_ids = []
+        self.node_index = {}
+        self.successors = {}
+        self.predecessors = {}
+        self.out_edges = {}
+        self.in_edges = {}
+        self.properties = None
+
+        for node in json_data.get("nodes", []):
+            node_data = node["data"]
+            self.nodes[node_data["id"]] = node_data
+            self._register_node(node_data["id"])
+
+        for i, edge in enumerate(json_data.get("edges", [])):
+            edge_data = edge["data"]
+            edge_id = edge_data.get("id", f"e{i}")
+            source = edge_data["source"]
+            target = edge_data["target"]
+            self._register_node(source)
+            self._register_node(target)
+
+            # Keep the first edge when IDs are duplicated
+            self.edges.setdefault(edge_id, edge_data)
+            self.successors[source].append(target)
+            self.predecessors[target].append(source)
+            self.out_edges[source].append(edge_id)
+            self.in_edges[target].append(edge_id)
+
+    @classmethod
+    def from_json(cls, json_data):
+        """
+        Returns ``json_data`` unchanged if it already is a LoadPathGraph, otherwise
+        builds a new graph from it.
+
+        Args:
+            json_data (dict or LoadPathGraph): Graph data or an existing graph
+
+        Returns:
+            LoadPathGraph: Indexed graph
+        """
+        if isinstance(json_data, cls):
+            return json_data
+        if hasattr(json_data, "to_graph"):  # e.g. graph_binary.BinaryModel
+            return json_data.to_graph()
+        return cls(json_data)
+
+    @classmethod
+    def from_arrays(cls, node_ids, n_declared, edge_ids, edge_source, edge_target,
+                    properties=None):
+        """
+        Builds a graph from columnar node and edge tables.
+
+        Gives the same graph as the equivalent JSON data: rows ``0..n_declared-1``
+        are declared nodes in file order, later rows are endpoint-only nodes, and
+        edges refer to node rows.
+
+        Args:
+            node_ids (list): Node ID of every row
+            n_declared (int): Number of declared node rows
+            edge_ids (list): Edge IDs in file order
+            edge_source (array_like): Source row of every edge
+            edge_target (array_like): Target row of every edge
+            properties (dict, optional): Property name -> array with one entry per
+                row, stored as ``properties`` (aligned with ``node_ids``)
+
+        Returns:
+            LoadPathGraph: Indexed graph
+        """
+        graph = cls({})
+        rows = []
+        for row, node_id in enumerate(node_ids):
+            if row < n_declared:
+                graph.nodes[node_id] = {"id": node_id}
+            if node_id not in graph.node_index:
+                rows.append(row)
+                graph._register_node(node_id)
+            elif row < n_declared:
+                # Like a JSON import, the last declaration of a duplicated ID wins
+                rows[graph.node_index[node_id]] = row
+
+        for edge_id, source, target in zip(edge_ids, _as_list(edge_source),
+                                           _as_list(edge_target)):
+            source = node_ids[source]
+            target = node_ids[target]
+            graph.edges.setdefault(edge_id, {"id": edge_id, "source": source, "target": target})
+            graph.successors[source].append(target)
+            graph.predecessors[target].append(source)
+            graph.out_edges[source].append(edge_id)
+            graph.in_edges[target].append(edge_id)
+
+        if properties is not None:
+            if len(rows) != len(node_ids):
+                properties = {name: values[rows] for name, values in properties.items()}
+            graph.properties = properties
+        return graph
+
+    def _register_node(self, node_id):
+        """
+        Adds an empty adjacency entry and an integer index for a new node ID.
+
+        Args:
+            node_id (str): Node identifier
+        """
+        if node_id in self.node_index:
+            return
+        self.node_index[node_id] = len(self.node_ids)
+        self.node_ids.append(node_id)
+        self.successors[node_id] = []
+        self.predecessors[node_id] = []
+        self.out_edges[node_id] = []
+        self.in_edges[node_id] = []
+
+    def grounded_nodes(self):
+        """
+        Returns the declared nodes that have no outgoing edges.
+
+        Returns:
+            list: Grounded node IDs in file order
+        """
+        return [node_id for node_id in self.nodes if not self.successors[node_id]]
+
+    def nearest_grounded_nodes(self):
+        """
+        Finds, for every node, the first grounded node its load reaches.
+
+        This is the first grounded node of downstream(node_id) for all nodes at once:
+        the grounded nodes are walked upstream breadth-first to get each node's
+        distance to the ground, then each node takes the result of its first
+        successor that is one step closer.
+
+        Returns:
+            dict: Node ID -> grounded node ID, for the nodes that reach one
+        """
+        distance = {node_id: 0 for node_id in self.grounded_nodes()}
+        order = list(distance)
+        i = 0
+        while i < len(order):
+            node_id = order[i]
+            for source in self.predecessors[node_id]:
+                if source not in distance:
+                    distance[source] = distance[node_id] + 1
+                    order.append(source)
+            i += 1
+
+        # Breadth-first order has every node after the successor it takes the result from
+        nearest = {}
+        for node_id in order:
+            step = distance[node_id] - 1
+            if step < 0:
+                nearest[node_id] = node_id
+            else:
+                nearest[node_id] = next(nearest[target] for target in self.successors[node_id]
+                                        if distance.get(target) == step)
+        return nearest
+
+    def edge(self, edge_id):
+        """
+        Looks up an edge by ID.
+
+        Args:
+            edge_id (str): Edge identifier
+
+        Returns:
+            dict or None: Edge ``data`` dict, or None if the edge does not exist
+        """
+        return self.edges.get(edge_id)
+
+    def upstream(self, node_id):
+        """
+        Collects a node and every node that can transmit load to it.
+
+        The traversal is iterative and visits every node and edge at most once, so
+        shared upstream sub-paths, very deep chains and loops are all handled in
+        time linear in the size of the graph.
+
+        Args:
+            node_id (str): Node ID to trace upstream from
+
+        Returns:
+            list: Node IDs in breadth-first order, starting with ``node_id``
+        """
+        visited = {node_id}
+        order = [node_id]
+        i = 0
+        while i < len(order):
+            for source in self.predecessors.get(order[i], ()):
+                if source not in visited:
+                    visited.add(source)
+                    order.append(source)
+            i += 1
+        return order
+
+    def downstream(self, node_id):
+        """
+        Collects a node and every node its load is transmitted to.
+
+        Args:
+            node_id (str): Node ID to trace downstream from
+
+        Returns:
+            list: Node IDs in breadth-first order, starting with ``node_id``
+        """
+        visited = {node_id}
+        order = [node_id]
+        i = 0
+        while i < len(order):
+            for target in self.successors.get(order[i], ()):
+                if target not in visited:
+                    visited.add(target)
+                    order.append(target)
+            i += 1
+        return order
+
+    def strongly_connected_components(self):
+        """
+        Splits the graph into strongly connected components (Tarjan's algorithm).
+
+        Each component that contains more than one node (or a self-loop) is a cycle
+        in the load path.
+
+        Returns:
+            list: Components as lists of node IDs, in topological order of the
+                condensed graph (upstream components before downstream ones).
+        """
+        return strongly_connected_components(self.node_ids, self.successors)
+
+    def upstream_bitsets(self):
+        """
+        Computes the upstream node set of every strongly connected component.
+
+        The condensed graph is walked once in topological order and each upstream
+        set is stored as an integer bitset over ``node_index``, built by OR-ing the
+        bitsets of the upstream components. Every member of a component shares the
+        same upstream set.
+
+        Returns:
+            tuple: (components, component_of, masks) where ``components`` is the
+                list returned by strongly_connected_components, ``component_of``
+                maps node ID -> component position and ``masks[c]`` is the upstream
+                bitset of component ``c`` (including its own members).
+        """
+        components = self.strongly_connected_components()
+        component_of = {}
+        for c, members in enumerate(components):
+            for node_id in members:
+                component_of[node_id] = c
+
+        node_index = self.node_index
+        masks = []
+        for c, members in enumerate(components):
+            mask = 0
+            for node_id in members:
+                mask |= 1 << node_index[node_id]
+            for node_id in members:
+                for source in self.predecessors[node_id]:
+                    source_component = component_of[source]
+                    if source_component != c:
+                        mask |= masks[source_component]
+            masks.append(mask)
+        return components, component_of, masks
+
+
+def strongly_connected_components(node_ids, successors):
+    """
+    Splits the graph into strongly connected components (Tarjan's algorithm).
+
+    The implementation is iterative, so arbitrarily deep load paths do not hit
+    Python's recursion limit. Each component that contains more than one node
+    (or a self-loop) is a cycle in the load path.
+
+    Args:
+        node_ids (iterable): Node IDs to split
+        successors (dict): Node ID -> iterable of downstream node IDs. Successors
+            that are not in ``node_ids`` are ignored.
+
+    Returns:
+        list: Components as lists of node IDs, in topological order of the
+            condensed graph (upstream components before downstream ones).
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    node_ids = list(node_ids)
+    members = set(node_ids)
+    for root in node_ids:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in members:
+                    continue
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    advanced = True
+                    break
+                if child in on_stack and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    # Tarjan emits downstream components first
+    components.reverse()
+    return components
+
+
+def _as_list(values):
+    """
+    Converts an array or any iterable to a list of Python values.
+    """
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def mask_to_indices(mask):
+    """
+    Converts an integer bitset into the sorted list of its set bit positions.
+
+    Args:
+        mask (int): Bitset where bit i marks node index i
+
+    Returns:
+        list: Indices of the set bits in ascending order
+    """
+    bits = bin(mask)[:1:-1]
+    return [i for i, bit in enumerate(bits) if bit == "1"]
@@ -0,0 +1,205 @@
+"""
+Parallel Load Case Executor
+
+This module spreads large load case sweeps (see load_cases.run_load_cases) over a
+pool of worker processes.
+
+- The immutable model arrays (rotations, global CoG positions, reference points and
+  the upstream reduction indexes), the load case inputs and the result array are
+  all placed in one shared memory block, so nothing large is pickled per task
+- Each worker attaches to the block once and rebuilds an evaluation-only
+  LoadTransferModel on zero-copy views
+- Load cases are split into contiguous shards; every shard writes straight into its
+  own slice of the shared result array, so the gathered result is always in case
+  order regardless of which worker finishes first
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .load_cases import prepare_load_cases, run_load_cases
+from .load_transfer import LoadTransferModel
+
+# Shards per worker, to even out load between workers
+SHARDS_PER_WORKER = 4
+
+# Byte alignment of arrays inside the shared memory block
+_ALIGNMENT = 64
+
+# Shared arrays attached in a worker process: (SharedMemory, {name: ndarray})
+_worker_state = None
+
+
+class SharedArrays:
+    """
+    Packs a set of NumPy arrays into one shared memory block.
+
+    The ``descriptor`` (block name plus dtype, shape and offset of each array) is all
+    that needs to be sent to another process to attach to the arrays.
+    """
+
+    def __init__(self, arrays):
+        """
+        Allocates the block and copies the arrays into it.
+
+        Args:
+            arrays (dict): Array name -> numpy.ndarray (None values are skipped)
+        """
+        layout = []
+        size = 0
+        for name, array in arrays.items():
+            if array is None:
+                continue
+            array = np.ascontiguousarray(array)
+            layout.append((name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.descriptor = (self.shm.name, layout)
+        self.arrays = _views(self.shm, layout)
+        for name, array in self.arrays.items():
+            array[...] = arrays[name]
+
+    def close(self):
+        """
+        Releases the views and frees the shared memory block.
+        """
+        self.arrays = {}
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _views(shm, layout):
+    """
+    Creates NumPy views on a shared memory block for the given layout.
+    """
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, dtype, shape, offset in layout
+    }
+
+
+def _attach(descriptor):
+    """
+    Pool initializer: attaches the worker process to the shared memory block.
+    """
+    global _worker_state
+    name, layout = descriptor
+    # Workers only attach; the parent owns the block and alone unlinks it. Workers
+    # share the parent's resource tracker, which unlinks the block if the parent dies
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_state = (shm, _views(shm, layout))
+
+
+def _run_shard(start, stop, chunk_size):
+    """
+    Evaluates load cases ``start:stop`` and writes them into the shared result array.
+    """
+    _, arrays = _worker_state
+    model = LoadTransferModel.from_arrays(
+        {name[len('model_'):]: value for name, value in arrays.items()
+         if name.startswith('model_')})
+    cases = slice(start, stop)
+    inputs = {name: arrays[name][cases] if name in arrays else None
+              for name in ('external_force', 'moment', 'mass')}
+    arrays['loads'][cases] = run_load_cases(model, chunk_size=chunk_size, **inputs)
+    return start, stop
+
+
+def run_load_cases_parallel(model, external_force=None, moment=None, mass=None,
+                            workers=None, chunk_size=None):
+    """
+    Computes the per-edge resultant loads of many load cases on a process pool.
+
+    Takes the same inputs and returns the same (n_cases, n_edges, 6) array as
+    load_cases.run_load_cases. With ``workers=1`` (or a single load case) the sweep
+    runs in the calling process.
+
+    Args:
+        model (LoadTransferModel or dict or LoadPathGraph): Prepared model, or graph
+            data to build one from
+        external_force (array_like, optional): (n_cases, n_nodes, 3) local forces
+        moment (array_like, optional): (n_cases, n_nodes, 3) local moments
+        mass (array_like, optional): (n_cases, n_nodes) node masses
+        workers (int, optional): Number of worker processes (default: CPU count)
+        chunk_size (int, optional): Cases per batch inside each worker
+
+    Returns:
+        numpy.ndarray: (n_cases, n_edges, 6) loads, in case order
+
+    Example:
+        >>> loads = run_load_cases_parallel(model, external_force=forces, workers=32)
+    """
+    if not isinstance(model, LoadTransferModel):
+        model = LoadTransferModel(model)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    n_cases, external_force, moment, mass = prepare_load_cases(
+        model, external_force, moment, mass)
+    if workers <= 1 or n_cases <= 1:
+        return run_load_cases(model, external_force, moment, mass, chunk_size=chunk_size)
+
+    arrays = {'model_' + name: value for name, value in model.arrays().items()}
+    arrays.update({
+        'external_force': external_force,
+        'moment': moment,
+        'mass': mass,
+        'loads': np.empty((n_cases, len(model.edge_ids), 6)),
+    })
+    shared = SharedArrays(arrays)
+    try:
+        n_shards = min(n_cases, workers * SHARDS_PER_WORKER)
+        bounds = np.linspace(0, n_cases, n_shards + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shared.descriptor,)) as pool:
+            futures = [pool.submit(_run_shard, int(start), int(stop), chunk_size)
+                       for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            for future in futures:
+                future.result()
+        return shared.arrays['loads'].copy()
+    finally:
+        shared.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+    import time
+
+    from .graph_binary import is_binary, read_binary
+
+    parser = argparse.ArgumentParser(
+        description="Check a parallel load case sweep against the serial one")
+    parser.add_argument("file", help="Graph JSON or binary model file")
+    parser.add_argument("--cases", type=int, default=256, help="Number of random load cases")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    if is_binary(args.file):
+        json_data = read_binary(args.file)
+    else:
+        with open(args.file) as f:
+            json_data = json.load(f)
+    model = LoadTransferModel(json_data)
+    forces = np.random.default_rng(0).normal(size=(args.cases, len(model.node_ids), 3))
+
+    start = time.perf_counter()
+    expected = run_load_cases(model, external_force=forces)
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    loads = run_load_cases_parallel(model, external_force=forces, workers=args.workers)
+    parallel = time.perf_counter() - start
+
+    difference = float(np.abs(loads - expected).max()) if loads.size else 0.0
+    print(f"{args.cases} cases: serial {serial:.3f} s, parallel {parallel:.3f} s, "
+          f"max difference {difference:g}")
+    sys.exit(0 if np.allclose(loads, expected) else 1)
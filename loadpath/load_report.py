@@ -0,0 +1,349 @@
+"""
+Load Path Batch Reports
+
+Command-line tool that computes load contributor and connection load reports for
+any number of model files, without the Dash application. Every model is loaded,
+analyzed and written out on its own, so memory use does not grow with the number
+of models and results are streamed as soon as a model is done.
+
+Inputs may be files, directories (all ``.json`` and ``.lpg`` files in them) or glob
+patterns (``**`` matches subdirectories). Output formats:
+
+- ``jsonl``: one JSON object per connection (default)
+- ``csv``: one row per connection; contributors are separated by ``;``
+- ``binary``: a NumPy ``.npz`` archive with one group of arrays per model
+  (``<i>/model``, ``<i>/edge_ids``, ``<i>/node_ids``, ``<i>/contributors``
+  (node indexes) with ``<i>/contributors_indptr``, ``<i>/loads`` (E, 6) with the
+  columns Fx, Fy, Fz, Mx, My, Mz). Read it with ``numpy.load``.
+
+Usage:
+    python -m loadpath.load_report models/*.json           # contributors of every edge
+    python -m loadpath.load_report "variants/**/*.lpg" --edge e3 --edge e7 --report all
+    python -m loadpath.load_report models/ --report loads --format csv -o loads.csv
+    python -m loadpath.load_report models/ --format binary -o report.npz
+    python -m loadpath.load_report models/ --report all --cache results.sqlite
+
+Loops in a load path are merged into one sub-assembly by the analyses (see
+load_validation); with ``--strict``, models with loops are reported with the IDs of
+the connections in each loop and skipped instead.
+
+With ``--cache``, contributor and load results are kept in a SQLite file keyed by
+the content of each model (see load_cache), so models that did not change since an
+earlier run (or that are copies of each other) are not analyzed again.
+
+NumPy is only imported for load reports, binary models and binary output.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import zipfile
+
+from .graph_json import read_raw_graph
+from .load_contrib import find_all_load_contributors
+from .load_graph import LoadPathGraph
+from .load_validation import check_load_path
+
+# Model file extensions picked up from input directories
+MODEL_EXTENSIONS = ('.json', '.lpg')
+
+REPORTS = ('contributors', 'loads', 'all')
+FORMATS = ('jsonl', 'csv', 'binary')
+
+# Column order of the connection loads (same as load_cases.LOAD_COLUMNS)
+LOAD_COLUMNS = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+
+
+def expand_inputs(patterns):
+    """
+    Expands files, directories and glob patterns into model file paths.
+
+    Args:
+        patterns (list): Input arguments
+
+    Returns:
+        tuple: (paths, unmatched) - model files in argument order without
+            duplicates, and the arguments that did not match any file
+    """
+    paths = {}
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(path for path in glob.glob(os.path.join(pattern, '*'))
+                             if path.endswith(MODEL_EXTENSIONS) and os.path.isfile(path))
+        elif glob.has_magic(pattern):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True)
+                             if os.path.isfile(path))
+        else:
+            matches = [pattern] if os.path.isfile(pattern) else []
+        if not matches:
+            unmatched.append(pattern)
+        paths.update(dict.fromkeys(matches))
+    return list(paths), unmatched
+
+
+def open_model(path):
+    """
+    Loads a JSON or binary model file as a LoadPathGraph.
+
+    JSON files are parsed element by element (graph_json.read_raw_graph), so the
+    document text is never held in full; nodes and edges are kept as in the file.
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(8)
+    if magic == b'LPGRAPH\0':
+        from .graph_binary import read_binary
+        return read_binary(path).to_graph()
+    return LoadPathGraph(read_raw_graph(path))
+
+
+def model_report(path, edge_ids=None, report='contributors', cache=None, strict=False):
+    """
+    Analyzes one model file.
+
+    Args:
+        path (str): Model file (.json or .lpg)
+        edge_ids (list, optional): Edges to report (default: every edge)
+        report (str): 'contributors', 'loads' or 'all'
+        cache (AnalysisCache, optional): Cache of contributor (every edge) and load
+            results
+        strict (bool): Reject models whose load path contains loops
+
+    Returns:
+        tuple: (graph, records, missing) - the LoadPathGraph, one record dict per
+            reported edge (in file order unless ``edge_ids`` is given) and the
+            requested edge IDs that are not in the model. Contributors are always
+            listed in node order (graph.node_index), however they were found
+
+    Raises:
+        LoadPathLoopError: If ``strict`` is set and the model contains loops
+    """
+    graph = open_model(path)
+    if strict:
+        check_load_path(graph)
+    if edge_ids is None:
+        selected = list(graph.edges)
+        missing = []
+    else:
+        selected = [edge_id for edge_id in edge_ids if edge_id in graph.edges]
+        missing = [edge_id for edge_id in edge_ids if edge_id not in graph.edges]
+
+    records = []
+    for edge_id in selected:
+        edge = graph.edges[edge_id]
+        records.append({'model': path, 'edge': edge_id,
+                        'source': edge['source'], 'target': edge['target']})
+
+    # Step 1: Contributors (one sweep for all edges, single traces for a few)
+    if report in ('contributors', 'all'):
+        # The ground each edge's load reaches, as find_load_contributors reports it
+        nearest = graph.nearest_grounded_nodes()
+        if edge_ids is None:
+            contributors = find_all_load_contributors(graph, cache=cache)['contributors']
+        else:
+            # Same order as the sweep, so reports do not depend on the edge selection
+            node_index = graph.node_index.__getitem__
+            contributors = {edge_id: sorted(graph.upstream(graph.edges[edge_id]['source']),
+                                            key=node_index)
+                            for edge_id in selected}
+        for record in records:
+            record['grounded_node'] = nearest.get(record['target'])
+            record['contributors'] = contributors[record['edge']]
+
+    # Step 2: Connection loads
+    if report in ('loads', 'all'):
+        from .load_transfer import compute_edge_loads
+        loads = compute_edge_loads(graph, cache=cache)
+        for record in records:
+            load = loads[record['edge']]
+            record['force'] = load['force']
+            record['moment'] = load['moment']
+
+    return graph, records, missing
+
+
+class JsonLinesWriter:
+    """
+    Writes one JSON object per line.
+    """
+
+    def __init__(self, stream, report):
+        self.stream = stream
+
+    def write(self, graph, records):
+        self.stream.writelines(json.dumps(record) + '\n' for record in records)
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class CsvWriter:
+    """
+    Writes one CSV row per connection.
+    """
+
+    def __init__(self, stream, report):
+        self.stream = stream
+        columns = ['model', 'edge', 'source', 'target']
+        if report in ('contributors', 'all'):
+            columns += ['grounded_node', 'contributors']
+        if report in ('loads', 'all'):
+            columns += LOAD_COLUMNS
+        self.writer = csv.writer(stream)
+        self.writer.writerow(columns)
+        self.report = report
+
+    def write(self, graph, records):
+        for record in records:
+            row = [record['model'], record['edge'], record['source'], record['target']]
+            if self.report in ('contributors', 'all'):
+                row += [record['grounded_node'], ';'.join(record['contributors'])]
+            if self.report in ('loads', 'all'):
+                row += record['force'] + record['moment']
+            self.writer.writerow(row)
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class BinaryWriter:
+    """
+    Writes one group of ``.npy`` arrays per model into an ``.npz`` (zip) archive.
+    """
+
+    def __init__(self, stream, report):
+        import numpy as np
+        self.np = np
+        self.archive = zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED)
+        self.report = report
+        self.count = 0
+
+    def write(self, graph, records):
+        np = self.np
+        arrays = {
+            'model': np.array([records[0]['model']] if records else [], dtype=str),
+            'edge_ids': np.array([record['edge'] for record in records], dtype=str),
+        }
+        if self.report in ('contributors', 'all'):
+            node_index = graph.node_index
+            lengths = [len(record['contributors']) for record in records]
+            indptr = np.zeros(len(records) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            arrays['node_ids'] = np.array(graph.node_ids, dtype=str)
+            arrays['contributors'] = np.fromiter(
+                (node_index[node_id] for record in records for node_id in record['contributors']),
+                dtype=np.int32, count=int(indptr[-1]))
+            arrays['contributors_indptr'] = indptr
+        if self.report in ('loads', 'all'):
+            arrays['loads'] = np.array([record['force'] + record['moment'] for record in records],
+                                       dtype=np.float64).reshape(len(records), 6)
+        for name, array in arrays.items():
+            with self.archive.open(f'{self.count}/{name}.npy', 'w', force_zip64=True) as f:
+                np.lib.format.write_array(f, array, allow_pickle=False)
+        self.count += 1
+
+    def close(self):
+        self.archive.close()
+
+
+WRITERS = {'jsonl': JsonLinesWriter, 'csv': CsvWriter, 'binary': BinaryWriter}
+
+
+def run_reports(paths, stream, edge_ids=None, report='contributors', output_format='jsonl',
+                errors=sys.stderr, cache=None, strict=False):
+    """
+    Analyzes model files one after another and streams the results to ``stream``.
+
+    Models that cannot be read or analyzed are reported on ``errors`` and skipped.
+
+    Args:
+        paths (list): Model files
+        stream (file): Text stream (jsonl, csv) or binary stream (binary)
+        edge_ids (list, optional): Edges to report (default: every edge)
+        report (str): 'contributors', 'loads' or 'all'
+        output_format (str): 'jsonl', 'csv' or 'binary'
+        errors (file): Stream for error messages
+        cache (AnalysisCache, optional): Cache of analysis results
+        strict (bool): Skip (and count) models whose load path contains loops
+
+    Returns:
+        int: Number of problems (failed models and missing edges)
+    """
+    writer = WRITERS[output_format](stream, report)
+    problems = 0
+    try:
+        for path in paths:
+            try:
+                graph, records, missing = model_report(path, edge_ids, report, cache, strict)
+            except Exception as e:
+                print(f"{path}: {e}", file=errors)
+                problems += 1
+                continue
+            for edge_id in missing:
+                print(f"{path}: edge '{edge_id}' not found", file=errors)
+            problems += len(missing)
+            writer.write(graph, records)
+    finally:
+        writer.close()
+    return problems
+
+
+def main(argv=None):
+    """
+    Command-line entry point; returns the exit status.
+    """
+    parser = argparse.ArgumentParser(description="Load path contributor and load reports for many models")
+    parser.add_argument('inputs', nargs='+',
+                        help="Model files (.json or .lpg), directories or glob patterns")
+    parser.add_argument('--edge', action='append', dest='edges', metavar='EDGE_ID',
+                        help="Edge to report (repeatable, default: every edge)")
+    parser.add_argument('--report', choices=REPORTS, default='contributors',
+                        help="Load contributors, connection loads or both")
+    parser.add_argument('--format', choices=FORMATS, default='jsonl', dest='output_format',
+                        help="Output format")
+    parser.add_argument('-o', '--output', help="Output file (default: standard output)")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="SQLite file caching results by model content between runs")
+    parser.add_argument('--strict', action='store_true',
+                        help="Skip models whose load path contains loops")
+    args = parser.parse_args(argv)
+
+    paths, unmatched = expand_inputs(args.inputs)
+    for pattern in unmatched:
+        print(f"{pattern}: no model files found", file=sys.stderr)
+
+    binary = args.output_format == 'binary'
+    if args.output:
+        stream = open(args.output, 'wb' if binary else 'w', newline=None if binary else '')
+    else:
+        stream = sys.stdout.buffer if binary else sys.stdout
+    try:
+        cache = None
+        if args.cache:
+            from .load_cache import AnalysisCache
+            cache = AnalysisCache(path=args.cache)
+        problems = run_reports(paths, stream, args.edges, args.report, args.output_format,
+                               cache=cache, strict=args.strict)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped to head): stop quietly, and send what is
+        # still buffered to devnull so the interpreter does not fail flushing it
+        if not args.output:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if args.output:
+            stream.close()
+    return 1 if problems or unmatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
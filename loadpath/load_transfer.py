@@ -0,0 +1,536 @@
+"""
+Load Transfer Engine
+
+This module turns the node properties stored in the Load Path Visual Tool graph
+(mass, centre of gravity, external force, moment, Euler angles, rotation order and
+translation) into the resultant force and moment carried by every connection.
+
+All node quantities are processed as batched NumPy arrays:
+1. Rotation matrices for every node are built at once from the Euler angles, for
+   every supported rotation order
+2. CoG, external forces and moments are transformed into the global frame
+3. Gravity, external forces and moment-arm terms are summed down the load path to
+   each connection
+
+Conventions:
+- Node properties (CoG, force, moment) are given in the node's local frame, which is
+  rotated by the Euler angles (degrees) and then translated by ``translation``
+- A rotation order such as "xyz" means extrinsic rotations about the fixed global
+  axes, applied x first, then y, then z (R = Rz @ Ry @ Rx)
+- Each connection carries the full load of all of its contributors (the same set as
+  load_contrib.find_load_contributors), with the moment taken about the origin of
+  the connection's target node
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+from .load_graph import LoadPathGraph
+
+# Supported rotation orders (same list as the rotation order dropdown in the UI)
+ROTATION_ORDERS = ['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx']
+
+# Gravitational acceleration in the global frame (m/s^2)
+GRAVITY = (0.0, 0.0, -9.81)
+
+_AXIS = {'x': 0, 'y': 1, 'z': 2}
+
+
+def rotation_order_codes(rotation_orders):
+    """
+    Converts rotation order strings into integer codes (positions in ROTATION_ORDERS).
+
+    Args:
+        rotation_orders (list): Rotation order strings, e.g. ['xyz', 'zyx']
+
+    Returns:
+        numpy.ndarray: int8 array of rotation order codes
+
+    Raises:
+        ValueError: If a rotation order is not supported
+    """
+    lookup = {order: code for code, order in enumerate(ROTATION_ORDERS)}
+    try:
+        return np.array([lookup[order] for order in rotation_orders], dtype=np.int8)
+    except KeyError as e:
+        raise ValueError(f"Unsupported rotation order: {e.args[0]!r}") from None
+
+
+def rotation_matrices(euler_angles, order_codes):
+    """
+    Builds the rotation matrix of every node in one batch.
+
+    Args:
+        euler_angles (array_like): (N, 3) rotation angles in degrees about x, y, z
+        order_codes (array_like): (N,) rotation order codes (see rotation_order_codes)
+
+    Returns:
+        numpy.ndarray: (N, 3, 3) rotation matrices mapping local to global coordinates
+    """
+    angles = np.radians(np.asarray(euler_angles, dtype=np.float64))
+    order_codes = np.asarray(order_codes)
+    n = angles.shape[0]
+    c = np.cos(angles)
+    s = np.sin(angles)
+
+    # Elementary rotations about each axis, shape (3, N, 3, 3)
+    elementary = np.zeros((3, n, 3, 3))
+    elementary[0, :, 0, 0] = 1.0
+    elementary[0, :, 1, 1] = c[:, 0]
+    elementary[0, :, 1, 2] = -s[:, 0]
+    elementary[0, :, 2, 1] = s[:, 0]
+    elementary[0, :, 2, 2] = c[:, 0]
+
+    elementary[1, :, 1, 1] = 1.0
+    elementary[1, :, 0, 0] = c[:, 1]
+    elementary[1, :, 0, 2] = s[:, 1]
+    elementary[1, :, 2, 0] = -s[:, 1]
+    elementary[1, :, 2, 2] = c[:, 1]
+
+    elementary[2, :, 2, 2] = 1.0
+    elementary[2, :, 0, 0] = c[:, 2]
+    elementary[2, :, 0, 1] = -s[:, 2]
+    elementary[2, :, 1, 0] = s[:, 2]
+    elementary[2, :, 1, 1] = c[:, 2]
+
+    rotations = np.empty((n, 3, 3))
+    for code, order in enumerate(ROTATION_ORDERS):
+        mask = order_codes == code
+        if not mask.any():
+            continue
+        first, second, third = (elementary[_AXIS[axis], mask] for axis in order)
+        rotations[mask] = third @ second @ first
+    return rotations
+
+
+class UpstreamReducer:
+    """
+    Sums per-node quantities over the upstream (contributor) set of every edge.
+
+    The reduction is linear, so it is prepared once per topology and can then be
+    applied to any number of per-node arrays. Nodes are laid out in depth-first
+    order of a spanning forest of the load path (every component hangs below its
+    first downstream component), and all sums are read off a single cumulative sum
+    over that layout:
+    - Forest-shaped load paths (every component feeds at most one downstream
+      component): every upstream set is one contiguous range, so each edge costs
+      O(1) and the whole reduction O(N)
+    - General DAGs (shared upstream sub-paths): an upstream set is its subtree
+      range plus the ranges of the sub-paths that also reach it over other
+      connections, merged into runs of consecutive positions. Each run costs O(1),
+      so a shared sub-path is added once per edge instead of once per node
+
+    Cycles are collapsed first, so all members of a strongly connected component
+    share one upstream set.
+    """
+
+    _FOREST_ARRAYS = ('order', 'start', 'end')
+    _GENERAL_ARRAYS = ('order', 'run_start', 'run_end', 'offsets', 'edge_segments')
+
+    def __init__(self, graph, edge_sources):
+        """
+        Prepares the reduction for the given graph.
+
+        Args:
+            graph (LoadPathGraph): Indexed load path graph
+            edge_sources (list): Source node ID of each edge, in output order
+        """
+        components = graph.strongly_connected_components()
+        component_of = {}
+        for c, members in enumerate(components):
+            for node_id in members:
+                component_of[node_id] = c
+
+        # Downstream components are kept in connection order (dict keys)
+        downstream = [{} for _ in components]
+        upstream = [[] for _ in components]
+        for c, members in enumerate(components):
+            for node_id in members:
+                for target in graph.successors[node_id]:
+                    target_component = component_of[target]
+                    if target_component != c and target_component not in downstream[c]:
+                        downstream[c][target_component] = None
+                        upstream[target_component].append(c)
+
+        edge_components = np.asarray([component_of[source] for source in edge_sources],
+                                     dtype=np.int64)
+        self.is_forest = all(len(targets) <= 1 for targets in downstream)
+
+        if self.is_forest:
+            children = upstream
+        else:
+            children = [[] for _ in components]
+            for c, targets in enumerate(downstream):
+                if targets:
+                    children[next(iter(targets))].append(c)
+        start, end = self._layout(graph, components, children,
+                                  [c for c in range(len(components)) if not downstream[c]])
+
+        if self.is_forest:
+            self.start = start[edge_components]
+            self.end = end[edge_components]
+        else:
+            self._prepare_general(components, upstream, start, end, edge_components)
+
+    def _layout(self, graph, components, children, roots):
+        """
+        Lays out nodes in depth-first order of the spanning forest given by
+        ``children``, so every forest subtree is a contiguous range.
+
+        Returns:
+            tuple: (start, end) arrays with the range of each component's subtree;
+                its own members come first
+        """
+        node_index = graph.node_index
+        order = []
+        start = np.zeros(len(components), dtype=np.int64)
+        end = np.zeros(len(components), dtype=np.int64)
+        stack = [(c, False) for c in reversed(roots)]
+        while stack:
+            c, finished = stack.pop()
+            if finished:
+                end[c] = len(order)
+                continue
+            start[c] = len(order)
+            members = components[c]
+            if len(members) == 1:
+                order.append(node_index[members[0]])
+            else:
+                order.extend(node_index[node_id] for node_id in members)
+            stack.append((c, True))
+            stack.extend((u, False) for u in children[c])
+
+        self.order = np.asarray(order, dtype=np.int64)
+        return start, end
+
+    def _prepare_general(self, components, upstream, start, end, edge_components):
+        """
+        Describes the upstream set of every distinct edge source component as runs
+        of consecutive layout positions.
+
+        Components are visited in topological order; a component's runs are its
+        own members' range merged with the runs of its upstream components. Its
+        forest subtree therefore collapses into one run, and only sub-paths that
+        also reach it over other connections add runs.
+        """
+        start = start.tolist()
+        runs = []
+        for c, members in enumerate(components):
+            own = (start[c], start[c] + len(members))
+            if not upstream[c]:
+                runs.append((own,))
+                continue
+            blocks = sorted([own] + [run for u in upstream[c] for run in runs[u]])
+            merged = []
+            run_start, run_end = blocks[0]
+            for a, b in blocks[1:]:
+                if a > run_end:
+                    merged.append((run_start, run_end))
+                    run_start, run_end = a, b
+                elif b > run_end:
+                    run_end = b
+            merged.append((run_start, run_end))
+            runs.append(tuple(merged))
+
+        segment_of = {}
+        run_starts = []
+        run_ends = []
+        offsets = []
+        for c in edge_components.tolist():
+            if c not in segment_of:
+                segment_of[c] = len(offsets)
+                offsets.append(len(run_starts))
+                for a, b in runs[c]:
+                    run_starts.append(a)
+                    run_ends.append(b)
+
+        self.run_start = np.asarray(run_starts, dtype=np.int64)
+        self.run_end = np.asarray(run_ends, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.edge_segments = np.asarray([segment_of[c] for c in edge_components.tolist()],
+                                        dtype=np.int64)
+
+    def arrays(self):
+        """
+        Returns the prepared index arrays, e.g. to place them in shared memory.
+
+        Returns:
+            dict: Array name -> numpy.ndarray
+        """
+        names = self._FOREST_ARRAYS if self.is_forest else self._GENERAL_ARRAYS
+        return {name: getattr(self, name) for name in names}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Rebuilds a reducer from the arrays returned by arrays() without the graph.
+
+        Args:
+            arrays (dict): Array name -> numpy.ndarray (views are not copied)
+
+        Returns:
+            UpstreamReducer: Reducer sharing the given arrays
+        """
+        reducer = cls.__new__(cls)
+        reducer.is_forest = 'start' in arrays
+        for name, value in arrays.items():
+            setattr(reducer, name, value)
+        return reducer
+
+    @property
+    def work_size(self):
+        """
+        Number of per-node rows touched by one reduction (used to size batches).
+        """
+        return len(self.order) + 1 + (0 if self.is_forest else len(self.run_start))
+
+    def reduce(self, values):
+        """
+        Sums per-node values over each edge's upstream set.
+
+        Args:
+            values (numpy.ndarray): Array of shape (..., N, k) indexed by node index
+
+        Returns:
+            numpy.ndarray: Array of shape (..., E, k) with one sum per edge
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n_edges = len(self.start) if self.is_forest else len(self.edge_segments)
+        if n_edges == 0:
+            return np.zeros(values.shape[:-2] + (0, values.shape[-1]))
+
+        ordered = values[..., self.order, :]
+        cumulative = np.zeros(values.shape[:-2] + (ordered.shape[-2] + 1, values.shape[-1]))
+        np.cumsum(ordered, axis=-2, out=cumulative[..., 1:, :])
+        if self.is_forest:
+            return cumulative[..., self.end, :] - cumulative[..., self.start, :]
+
+        run_sums = cumulative[..., self.run_end, :] - cumulative[..., self.run_start, :]
+        sums = np.add.reduceat(run_sums, self.offsets, axis=-2)
+        return sums[..., self.edge_segments, :]
+
+
+class LoadTransferModel:
+    """
+    Vectorized load transfer model for one load path graph.
+
+    Building the model converts node properties into arrays, builds all rotation
+    matrices and prepares the upstream reduction. edge_loads() then evaluates the
+    resultant force and moment at every connection.
+
+    Attributes:
+        node_ids (list): Node IDs in array order
+        edge_ids (list): Edge IDs in array order
+        mass (numpy.ndarray): (N,) node masses in kg
+        cog (numpy.ndarray): (N, 3) local centres of gravity
+        external_force (numpy.ndarray): (N, 3) local external forces
+        moment (numpy.ndarray): (N, 3) local external moments
+        euler_angles (numpy.ndarray): (N, 3) rotation angles in degrees
+        rotation_order (numpy.ndarray): (N,) rotation order codes
+        translation (numpy.ndarray): (N, 3) node origins in the global frame
+        rotations (numpy.ndarray): (N, 3, 3) local to global rotation matrices
+        cog_global (numpy.ndarray): (N, 3) centres of gravity in the global frame
+        edge_source (numpy.ndarray): (E,) source node index of each edge
+        edge_target (numpy.ndarray): (E,) target node index of each edge
+        reference_points (numpy.ndarray): (E, 3) moment reference point of each edge
+    """
+
+    # Arrays needed to evaluate loads once the model has been built
+    _EVALUATION_ARRAYS = ('gravity', 'mass', 'external_force', 'moment', 'rotations',
+                          'cog_global', 'reference_points')
+
+    def __init__(self, json_data, gravity=GRAVITY):
+        """
+        Builds the model from graph data.
+
+        Args:
+            json_data (dict or LoadPathGraph or BinaryModel): Graph data in the Load
+                Path Visual Tool JSON format, a LoadPathGraph built from it, or an
+                opened binary model (see graph_binary)
+            gravity (tuple): Gravitational acceleration vector in the global frame
+        """
+        graph = LoadPathGraph.from_json(json_data)
+        self.graph = graph
+        self.gravity = np.asarray(gravity, dtype=np.float64)
+        self.node_ids = list(graph.node_ids)
+        self.edge_ids = list(graph.edges)
+
+        # Step 1: Collect node properties into arrays (undeclared endpoints get defaults)
+        # Columnar graphs (e.g. binary model files) already hold the arrays
+        properties = graph.properties
+        if properties is None:
+            properties = node_properties([graph.nodes.get(node_id, {})
+                                          for node_id in self.node_ids])
+        self.mass = np.asarray(properties['mass'], dtype=np.float64)
+        for name in ('cog', 'external_force', 'moment', 'euler_angles', 'translation'):
+            setattr(self, name, np.asarray(properties[name], dtype=np.float64))
+        self.rotation_order = np.asarray(properties['rotation_order'], dtype=np.int8)
+
+        # Step 2: Transform node frames into the global frame
+        self.rotations = rotation_matrices(self.euler_angles, self.rotation_order)
+        self.cog_global = np.einsum('nij,nj->ni', self.rotations, self.cog) + self.translation
+
+        # Step 3: Prepare the per-edge upstream reduction
+        edges = [graph.edges[edge_id] for edge_id in self.edge_ids]
+        node_index = graph.node_index
+        self.edge_source = np.array([node_index[e['source']] for e in edges], dtype=np.int64)
+        self.edge_target = np.array([node_index[e['target']] for e in edges], dtype=np.int64)
+        self.reference_points = self.translation[self.edge_target]
+        self.reducer = UpstreamReducer(graph, [e['source'] for e in edges])
+
+    def arrays(self):
+        """
+        Returns every array needed for load evaluation, including the reducer's.
+
+        Returns:
+            dict: Array name -> numpy.ndarray (reducer arrays are prefixed "reducer_")
+        """
+        arrays = {name: getattr(self, name) for name in self._EVALUATION_ARRAYS}
+        for name, value in self.reducer.arrays().items():
+            arrays['reducer_' + name] = value
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, node_ids=None, edge_ids=None):
+        """
+        Rebuilds an evaluation-only model from the arrays returned by arrays().
+
+        The rebuilt model has no graph; it supports node_loads() and edge_loads().
+
+        Args:
+            arrays (dict): Array name -> numpy.ndarray (views are not copied)
+            node_ids (list, optional): Node IDs (default: node positions)
+            edge_ids (list, optional): Edge IDs (default: edge positions)
+
+        Returns:
+            LoadTransferModel: Model sharing the given arrays
+        """
+        model = cls.__new__(cls)
+        model.graph = None
+        for name in cls._EVALUATION_ARRAYS:
+            setattr(model, name, arrays[name])
+        model.reducer = UpstreamReducer.from_arrays({
+            name[len('reducer_'):]: value
+            for name, value in arrays.items() if name.startswith('reducer_')
+        })
+        model.node_ids = range(len(model.mass)) if node_ids is None else node_ids
+        model.edge_ids = range(len(model.reference_points)) if edge_ids is None else edge_ids
+        return model
+
+    def node_loads(self, external_force=None, moment=None, mass=None):
+        """
+        Computes the global force of every node and its moment about the global origin.
+
+        The node properties stored in the model are used unless overrides are given.
+        Overrides may carry leading batch dimensions (e.g. one row per load case);
+        the rotations and global CoG positions are reused for every batch entry.
+
+        Args:
+            external_force (array_like, optional): (..., N, 3) local external forces
+            moment (array_like, optional): (..., N, 3) local external moments
+            mass (array_like, optional): (..., N) node masses
+
+        Returns:
+            tuple: (forces, moments) arrays of shape (..., N, 3). The moment includes
+                the moment-arm term ``cog_global x force``.
+        """
+        external_force = self.external_force if external_force is None else external_force
+        moment = self.moment if moment is None else moment
+        mass = self.mass if mass is None else np.asarray(mass, dtype=np.float64)
+
+        forces = _rotate(self.rotations, external_force) + mass[..., None] * self.gravity
+        moments = _rotate(self.rotations, moment) + np.cross(self.cog_global, forces)
+        return np.broadcast_to(forces, moments.shape), moments
+
+    def edge_loads(self, external_force=None, moment=None, mass=None):
+        """
+        Computes the resultant force and moment carried by every connection.
+
+        Args:
+            external_force (array_like, optional): (..., N, 3) local external forces
+            moment (array_like, optional): (..., N, 3) local external moments
+            mass (array_like, optional): (..., N) node masses
+
+        Returns:
+            tuple: (forces, moments) arrays of shape (..., E, 3) in the global frame,
+                in ``edge_ids`` order. Moments are taken about the origin of each
+                edge's target node.
+        """
+        forces, moments = self.node_loads(external_force, moment, mass)
+        sums = self.reducer.reduce(np.concatenate([forces, moments], axis=-1))
+        edge_forces = sums[..., :3]
+        edge_moments = sums[..., 3:] - np.cross(self.reference_points, edge_forces)
+        return edge_forces, edge_moments
+
+
+def _rotate(rotations, vectors):
+    """
+    Applies (N, 3, 3) rotations to (..., N, 3) vectors.
+    """
+    return (rotations @ np.asarray(vectors, dtype=np.float64)[..., None])[..., 0]
+
+
+def node_properties(node_data):
+    """
+    Collects the load properties of nodes into arrays (missing values -> defaults).
+
+    Args:
+        node_data (list): Node ``data`` dicts
+
+    Returns:
+        dict: Property name -> array, in the layout of LoadPathGraph.properties
+
+    Raises:
+        ValueError: If a rotation order is not supported
+    """
+    return {
+        'mass': np.array([d.get('mass') or 0 for d in node_data], dtype=np.float64),
+        'cog': _vectors(node_data, 'cog'),
+        'external_force': _vectors(node_data, 'external_force'),
+        'moment': _vectors(node_data, 'moment'),
+        'euler_angles': _vectors(node_data, 'euler_angles'),
+        'translation': _vectors(node_data, 'translation'),
+        'rotation_order': rotation_order_codes([d.get('rotation_order') or 'xyz'
+                                                for d in node_data])
+    }
+
+
+def _vectors(node_data, key):
+    """
+    Collects a 3-vector property of every node into an (N, 3) array (missing -> zeros).
+    """
+    values = [d.get(key) or (0, 0, 0) for d in node_data]
+    return np.array(values, dtype=np.float64).reshape(len(node_data), 3)
+
+
+def compute_edge_loads(json_data, gravity=GRAVITY, cache=None):
+    """
+    Computes the resultant force and moment at every connection of a graph.
+
+    Args:
+        json_data (dict or LoadPathGraph): Graph data in the Load Path Visual Tool
+            JSON format, or a LoadPathGraph built from it
+        gravity (tuple): Gravitational acceleration vector in the global frame
+        cache (AnalysisCache, optional): Cache of analysis results, keyed by the
+            graph topology and node properties (see load_cache)
+
+    Returns:
+        dict: Edge ID -> {"force": [Fx, Fy, Fz], "moment": [Mx, My, Mz]}
+
+    Example:
+        >>> loads = compute_edge_loads(json_data)
+        >>> loads["e0"]["force"]
+        [43301.27, 25000.0, -549740.0]
+    """
+    if cache is not None:
+        return cache.memoize('edge_loads', cache.loads_key(json_data, gravity),
+                             lambda: compute_edge_loads(json_data, gravity))
+    model = LoadTransferModel(json_data, gravity=gravity)
+    forces, moments = model.edge_loads()
+    return {
+        edge_id: {'force': force, 'moment': moment}
+        for edge_id, force, moment in zip(model.edge_ids, forces.tolist(), moments.tolist())
+    }
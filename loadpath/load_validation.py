@@ -0,0 +1,232 @@
+"""
+Load Path Validation
+
+Checks the structure of a load path graph, in time linear in its size:
+
+- Loops: strongly connected components (Tarjan's algorithm) with more than one
+  node, and self-loops. Load in a loop would circulate forever, so every loop is
+  reported with its nodes and the IDs of the connections inside it
+- Ground points: declared nodes without outgoing connections. A model normally
+  has one; several are reported so that a missing connection is noticed
+- Ungrounded nodes: nodes whose load reaches no ground point (e.g. nodes on or
+  upstream of a loop that has no way out)
+
+How the analyses treat loops: the members of a loop are merged into one rigid
+sub-assembly. Every member contributes to every connection inside or downstream
+of the loop, and all members share one upstream set (load_graph.upstream_bitsets,
+load_transfer.UpstreamReducer and load_incremental all condense loops this way),
+so loops never make an analysis slower than linear. Use check_load_path to reject
+models with loops instead.
+
+Usage:
+    python -m loadpath.load_validation model.json [more.json ...]
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import sys
+from collections import deque
+
+from .load_graph import LoadPathGraph
+
+
+def _listed(items, separator, limit=8):
+    """
+    Joins the first ``limit`` items, noting how many were left out.
+    """
+    text = separator.join(items[:limit])
+    return text + (f"{separator}... ({len(items)} in total)" if len(items) > limit else '')
+
+
+def _describe(loops, limit):
+    """
+    Describes the first ``limit`` loops on one line.
+    """
+    text = '; '.join(f"{_listed(loop['nodes'], ' -> ')} (edges {_listed(loop['edges'], ', ')})"
+                     for loop in loops[:limit])
+    return text + (f" and {len(loops) - limit} more" if len(loops) > limit else '')
+
+
+class LoadPathLoopError(ValueError):
+    """
+    Raised by check_load_path for models whose load path contains loops.
+
+    Attributes:
+        loops (list): Loops as returned by find_loops
+    """
+
+    def __init__(self, loops):
+        self.loops = loops
+        super().__init__(f"Load path contains {len(loops)} loop(s): {_describe(loops, 3)}")
+
+
+def find_loops(json_data):
+    """
+    Finds every loop of a load path graph.
+
+    Args:
+        json_data (dict or LoadPathGraph or BinaryModel): Graph data, a
+            LoadPathGraph or an opened binary model
+
+    Returns:
+        list: One dict per loop, upstream loops first:
+            {
+                "nodes": list,   # Member node IDs
+                "edges": list    # IDs of the connections between members
+            }
+    """
+    graph = LoadPathGraph.from_json(json_data)
+    loops = []
+    for members in graph.strongly_connected_components():
+        if len(members) == 1 and members[0] not in graph.successors[members[0]]:
+            continue
+        inside = set(members)
+        edges = {}
+        for node_id in members:
+            # Edge IDs and successors are recorded together, so they line up
+            for edge_id, target in zip(graph.out_edges[node_id], graph.successors[node_id]):
+                if target in inside:
+                    edges[edge_id] = None
+        loops.append({'nodes': members, 'edges': list(edges)})
+    return loops
+
+
+def validate_load_path(json_data):
+    """
+    Checks a load path graph for loops, ground points and ungrounded nodes.
+
+    Args:
+        json_data (dict or LoadPathGraph or BinaryModel): Graph data, a
+            LoadPathGraph or an opened binary model
+
+    Returns:
+        dict: Validation results with format:
+            {
+                "grounded_nodes": list,    # Declared nodes without outgoing edges
+                "loops": list,             # See find_loops
+                "ungrounded_nodes": list,  # Nodes whose load reaches no ground point
+                "problems": list           # One message per finding (empty if valid)
+            }
+
+    Example:
+        >>> result = validate_load_path(json_data)
+        >>> result["problems"]
+        ['1 loop(s): Nacelle -> Hub (edges e9, e2)']
+    """
+    graph = LoadPathGraph.from_json(json_data)
+    grounded = graph.grounded_nodes()
+    loops = find_loops(graph)
+
+    # Nodes that reach ground, found against the edge direction from the ground points
+    reached = set(grounded)
+    queue = deque(grounded)
+    while queue:
+        for source in graph.predecessors[queue.popleft()]:
+            if source not in reached:
+                reached.add(source)
+                queue.append(source)
+    ungrounded = [node_id for node_id in graph.node_ids if node_id not in reached]
+
+    problems = []
+    if loops:
+        problems.append(f"{len(loops)} loop(s): {_describe(loops, 5)}")
+    if graph.nodes and not grounded:
+        problems.append("No ground point: every node transfers load to another node")
+    elif len(grounded) > 1:
+        problems.append(f"{len(grounded)} ground points: {_listed(grounded, ', ')}")
+    if ungrounded and grounded:
+        problems.append(f"{len(ungrounded)} node(s) transfer load to no ground point: "
+                        f"{_listed(ungrounded, ', ')}")
+
+    return {
+        "grounded_nodes": grounded,
+        "loops": loops,
+        "ungrounded_nodes": ungrounded,
+        "problems": problems
+    }
+
+
+def check_load_path(json_data):
+    """
+    Raises LoadPathLoopError if a load path graph contains loops.
+
+    Args:
+        json_data (dict or LoadPathGraph or BinaryModel): Graph data, a
+            LoadPathGraph or an opened binary model
+
+    Raises:
+        LoadPathLoopError: With the loops and the IDs of their connections
+    """
+    loops = find_loops(json_data)
+    if loops:
+        raise LoadPathLoopError(loops)
+
+
+def closing_path(index, source_id, target_id, ignore=()):
+    """
+    Returns the connections that a new connection source_id -> target_id would
+    close into a loop, i.e. the path along which load already flows from
+    ``target_id`` to ``source_id``.
+
+    Only the part of the graph downstream of ``target_id`` is searched.
+
+    Args:
+        index (GraphIndex): Lookup index of the graph
+        source_id (str): Source node of the new connection
+        target_id (str): Target node of the new connection
+        ignore (iterable): IDs of connections to leave out (e.g. ones being replaced)
+
+    Returns:
+        list or None: Edge IDs in load flow order (empty for a self-loop), or None
+            if the new connection would not close a loop
+    """
+    if source_id == target_id:
+        return []
+    ignore = set(ignore)
+    parent = {target_id: None}   # node ID -> (edge ID, previous node ID)
+    queue = deque([target_id])
+    while queue:
+        node_id = queue.popleft()
+        for edge_id in index.edges_of(node_id):
+            if edge_id in ignore:
+                continue
+            data = index.edge(edge_id)['data']
+            target = data['target']
+            if data['source'] != node_id or target in parent:
+                continue
+            parent[target] = (edge_id, node_id)
+            if target == source_id:
+                path = []
+                while parent[target] is not None:
+                    edge_id, target = parent[target]
+                    path.append(edge_id)
+                return path[::-1]
+            queue.append(target)
+    return None
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    from .graph_binary import is_binary, read_binary
+
+    parser = argparse.ArgumentParser(description="Load path loop and ground point check")
+    parser.add_argument("files", nargs="+", help="Graph JSON or binary model files")
+    args = parser.parse_args()
+
+    status = 0
+    for path in args.files:
+        if is_binary(path):
+            json_data = read_binary(path)
+        else:
+            with open(path) as f:
+                json_data = json.load(f)
+        result = validate_load_path(json_data)
+        for problem in result["problems"]:
+            print(f"{path}: {problem}")
+        if result["loops"]:
+            status = 1
+    sys.exit(status)
@@ -0,0 +1,244 @@
+"""
+Callback Metrics
+
+This module collects timing and payload statistics of the Dash callbacks of the
+Load Path Visual Tool:
+
+- Every callback request is recorded with its duration, request and response size
+  and HTTP status in a fixed-size ring buffer (the most recent requests)
+- Per callback totals (invocations, errors, time, bytes in and out, a duration
+  histogram) are kept for the whole process lifetime
+- The totals can be rendered in the Prometheus text exposition format
+
+Requests are measured in the Flask server that runs the Dash app (see
+install_flask_hooks), so durations include decoding the request and encoding the
+response, and sizes are the actual HTTP payloads. Nothing is installed unless the
+application enables metrics, so disabled metrics cost nothing.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+
+# Upper bounds (seconds) of the callback duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path of Dash callback requests (relative to the app's URL prefix)
+CALLBACK_PATH = '_dash-update-component'
+
+
+class CallbackStats:
+    """
+    Totals of one callback.
+    """
+
+    __slots__ = ('calls', 'errors', 'seconds', 'max_seconds', 'bytes_in', 'bytes_out',
+                 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)   # last one: +Inf
+
+
+class CallbackMetrics:
+    """
+    Thread-safe collector of callback measurements.
+
+    Example:
+        >>> metrics = CallbackMetrics(capacity=500)
+        >>> metrics.record('update_cytoscape', 0.42, bytes_in=1200, bytes_out=250000)
+        >>> metrics.summary()[0]['callback']
+        'update_cytoscape'
+        >>> print(metrics.prometheus_text())
+    """
+
+    def __init__(self, capacity=1000):
+        """
+        Args:
+            capacity (int): Number of recent requests kept in the ring buffer
+        """
+        self.recent = deque(maxlen=capacity)
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, callback, seconds, bytes_in=0, bytes_out=0, status=200):
+        """
+        Records one callback request.
+
+        Args:
+            callback (str): Callback (function) name
+            seconds (float): Request duration
+            bytes_in (int): Request body size
+            bytes_out (int): Response body size
+            status (int): HTTP status code (>= 400 counts as an error)
+        """
+        with self._lock:
+            stats = self.stats.get(callback)
+            if stats is None:
+                stats = self.stats[callback] = CallbackStats()
+            stats.calls += 1
+            stats.errors += status >= 400
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.buckets[bisect.bisect_left(DURATION_BUCKETS, seconds)] += 1
+            self.recent.append((time.time(), callback, seconds, bytes_in, bytes_out, status))
+
+    def summary(self):
+        """
+        Returns the per callback totals, slowest (by total time) first.
+
+        Returns:
+            list: One dict per callback with calls, errors, total/mean/max time in
+                milliseconds and mean bytes in and out
+        """
+        with self._lock:
+            items = list(self.stats.items())
+        rows = []
+        for callback, stats in sorted(items, key=lambda item: -item[1].seconds):
+            rows.append({
+                'callback': callback,
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'total_ms': round(stats.seconds * 1000, 1),
+                'mean_ms': round(stats.seconds * 1000 / stats.calls, 1),
+                'max_ms': round(stats.max_seconds * 1000, 1),
+                'mean_bytes_in': stats.bytes_in // stats.calls,
+                'mean_bytes_out': stats.bytes_out // stats.calls,
+            })
+        return rows
+
+    def recent_requests(self, count=None):
+        """
+        Returns the most recent requests (newest last) as dicts.
+        """
+        with self._lock:
+            entries = list(self.recent)
+        if count is not None:
+            entries = entries[-count:]
+        return [{'time': t, 'callback': callback, 'ms': round(seconds * 1000, 1),
+                 'bytes_in': bytes_in, 'bytes_out': bytes_out, 'status': status}
+                for t, callback, seconds, bytes_in, bytes_out, status in entries]
+
+    def prometheus_text(self):
+        """
+        Renders the totals in the Prometheus text exposition format (version 0.0.4).
+        """
+        with self._lock:
+            items = sorted((callback, _copy(stats)) for callback, stats in self.stats.items())
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(samples)
+
+        label = lambda callback: f'callback="{_escape(callback)}"'
+        metric('loadpath_callback_calls_total', 'counter', 'Callback requests.',
+               [f'loadpath_callback_calls_total{{{label(c)}}} {s.calls}' for c, s in items])
+        metric('loadpath_callback_errors_total', 'counter', 'Callback requests that failed.',
+               [f'loadpath_callback_errors_total{{{label(c)}}} {s.errors}' for c, s in items])
+        metric('loadpath_callback_request_bytes_total', 'counter',
+               'Callback request payload bytes.',
+               [f'loadpath_callback_request_bytes_total{{{label(c)}}} {s.bytes_in}'
+                for c, s in items])
+        metric('loadpath_callback_response_bytes_total', 'counter',
+               'Callback response payload bytes.',
+               [f'loadpath_callback_response_bytes_total{{{label(c)}}} {s.bytes_out}'
+                for c, s in items])
+
+        samples = []
+        for callback, stats in items:
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS + ('+Inf',), stats.buckets):
+                cumulative += count
+                samples.append(f'loadpath_callback_duration_seconds_bucket'
+                               f'{{{label(callback)},le="{bound}"}} {cumulative}')
+            samples.append(f'loadpath_callback_duration_seconds_sum{{{label(callback)}}} '
+                           f'{stats.seconds!r}')
+            samples.append(f'loadpath_callback_duration_seconds_count{{{label(callback)}}} '
+                           f'{stats.calls}')
+        metric('loadpath_callback_duration_seconds', 'histogram',
+               'Callback request duration in seconds.', samples)
+        return '\n'.join(lines) + '\n'
+
+
+def _copy(stats):
+    """
+    Returns a snapshot of CallbackStats.
+    """
+    copy = CallbackStats()
+    for name in CallbackStats.__slots__:
+        value = getattr(stats, name)
+        setattr(copy, name, list(value) if isinstance(value, list) else value)
+    return copy
+
+
+def _escape(value):
+    """
+    Escapes a Prometheus label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def install_flask_hooks(server, metrics, callback_name, prefix='/'):
+    """
+    Measures every Dash callback request of a Flask server.
+
+    Args:
+        server (flask.Flask): Server of the Dash app
+        metrics (CallbackMetrics): Collector to record into
+        callback_name (callable): Maps the request's 'output' field to a callback
+            name; requests mapped to None are not recorded
+        prefix (str): URL prefix of the Dash app (``requests_pathname_prefix``)
+    """
+    from flask import g, request
+
+    path = prefix + CALLBACK_PATH
+
+    @server.before_request
+    def _start_timer():
+        if request.path == path:
+            g.metrics_start = time.perf_counter()
+
+    @server.after_request
+    def _record(response):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return response
+        body = request.get_json(silent=True) or {}
+        name = callback_name(body.get('output'))
+        if name is not None:
+            metrics.record(name, time.perf_counter() - start,
+                           request.content_length or 0,
+                           response.calculate_content_length() or 0,
+                           response.status_code)
+        return response
+
+
+def install_metrics_endpoints(server, metrics, route='/metrics'):
+    """
+    Serves the totals of ``metrics`` in the Prometheus text format at ``route`` and
+    the ring buffer of recent requests as JSON at ``route + '/recent'``.
+    """
+    from flask import Response, jsonify
+
+    @server.route(route)
+    def _metrics():
+        return Response(metrics.prometheus_text(),
+                        mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+    @server.route(route + '/recent')
+    def _recent_requests():
+        return jsonify(metrics.recent_requests())
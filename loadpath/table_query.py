@@ -0,0 +1,166 @@
+"""
+Table Queries
+
+Server-side filtering, sorting and paging for Dash DataTables in custom mode
+(``page_action='custom'``, ``filter_action='custom'``, ``sort_action='custom'``):
+
+- parse_filter splits a DataTable ``filter_query`` into (column, operator, value)
+  conditions
+- table_page returns only the rows of the requested page; rows are built for the
+  visible page only unless the table is filtered or sorted
+
+Example:
+    >>> rows, page_count, page = table_page(len(nodes), lambda i: node_row(nodes[i]),
+    ...                               page_current=0, page_size=50,
+    ...                               sort_by=[{'column_id': 'mass', 'direction': 'desc'}],
+    ...                               filter_query='{name} contains "Tower"')
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import operator
+import re
+
+# Relational operators of the DataTable filter syntax (symbol and word forms)
+_COMPARE = {
+    '=': operator.eq, 'eq': operator.eq,
+    '!=': operator.ne, 'ne': operator.ne,
+    '<': operator.lt, 'lt': operator.lt,
+    '<=': operator.le, 'le': operator.le,
+    '>': operator.gt, 'gt': operator.gt,
+    '>=': operator.ge, 'ge': operator.ge,
+}
+
+# {column} [i|s]operator value
+_CONDITION = re.compile(
+    r'\s*\{(?P<column>[^}]+)\}\s+'
+    r'(?P<case>[is]?)(?P<operator>>=|<=|!=|=|<|>|eq|ne|lt|le|gt|ge|contains|datestartswith)'
+    r'\s+(?P<value>.+?)\s*$'
+)
+
+
+def parse_filter(filter_query):
+    """
+    Parses a DataTable filter query.
+
+    Conditions are joined with ``&&`` (the form the DataTable filter row produces).
+    A leading ``i`` makes an operator case-insensitive, as in ``{name} icontains x``.
+
+    Args:
+        filter_query (str): DataTable ``filter_query`` (empty for no filter)
+
+    Returns:
+        list: (column ID, operator, value, case sensitive) tuples; numeric values
+            are returned as float
+
+    Raises:
+        ValueError: If a condition cannot be parsed
+    """
+    conditions = []
+    for part in (filter_query or '').split(' && '):
+        if not part.strip():
+            continue
+        match = _CONDITION.match(part)
+        if match is None:
+            raise ValueError(f"Unsupported filter condition: {part.strip()!r}")
+        value = match.group('value')
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'`':
+            value = value[1:-1].replace('\\' + value[0], value[0])
+        else:
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+        conditions.append((match.group('column'), match.group('operator'), value,
+                           match.group('case') != 'i'))
+    return conditions
+
+
+def _matches(cell, op, value, case_sensitive):
+    """
+    Evaluates one filter condition for a cell value.
+    """
+    if cell is None:
+        return False
+    if op in ('contains', 'datestartswith'):
+        cell = _number_text(cell) if isinstance(cell, float) else str(cell)
+        value = _number_text(value) if isinstance(value, float) else value
+        if not case_sensitive:
+            cell, value = cell.lower(), value.lower()
+        return value in cell if op == 'contains' else cell.startswith(value)
+    if isinstance(cell, (int, float)):
+        if not isinstance(value, float):
+            return False
+    else:
+        cell = str(cell)
+        if isinstance(value, float):
+            value = _number_text(value)   # a number typed into a text column
+        if not case_sensitive:
+            cell, value = cell.lower(), value.lower()
+    return _COMPARE[op](cell, value)
+
+
+def _number_text(value):
+    """
+    Formats a parsed number the way it was typed (5.0 -> '5').
+    """
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def _sort_key(value):
+    """
+    Sort key that orders empty cells first, then numbers, then text.
+    """
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value))
+
+
+def table_page(count, row, page_current=0, page_size=50, sort_by=None, filter_query=None):
+    """
+    Returns the rows of one page of a filtered and sorted table.
+
+    Args:
+        count (int): Number of rows in the table
+        row (callable): Builds row ``i`` (a dict of column ID -> value)
+        page_current (int): Requested page (0-based); clamped to the last page
+        page_size (int): Rows per page
+        sort_by (list, optional): DataTable ``sort_by`` ({'column_id', 'direction'})
+        filter_query (str, optional): DataTable ``filter_query``
+
+    Returns:
+        tuple: (rows of the page, number of pages, page actually returned)
+
+    Raises:
+        ValueError: If the filter query cannot be parsed
+    """
+    conditions = parse_filter(filter_query)
+    page_size = max(int(page_size or 1), 1)
+    if conditions or sort_by:
+        # Every row is needed to filter and sort; only the page is returned
+        rows = [row(i) for i in range(count)]
+        for column, op, value, case_sensitive in conditions:
+            rows = [r for r in rows if _matches(r.get(column), op, value, case_sensitive)]
+        # Sort by the last key first; stable sorts keep the earlier keys' order
+        for sort in reversed(sort_by or []):
+            column = sort['column_id']
+            rows.sort(key=lambda r: _sort_key(r.get(column)),
+                      reverse=sort.get('direction') == 'desc')
+        total = len(rows)
+    else:
+        rows = None
+        total = count
+
+    page_count = max((total + page_size - 1) // page_size, 1)
+    page_current = min(max(int(page_current or 0), 0), page_count - 1)
+    start = page_current * page_size
+    stop = min(start + page_size, total)
+    if rows is None:
+        page = [row(i) for i in range(start, stop)]
+    else:
+        page = rows[start:stop]
+    return page, page_count, page_current
@@ -0,0 +1,56 @@
+"""
+Shared fixtures of the loadpath test suite.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import os
+
+import pytest
+
+from benchmarks import generators
+from loadpath.graph_json import read_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Models shipped with the repository
+MODEL_FILES = [
+    'turbine_structure.json',
+    'load_path_data_20250316_171418.json',
+    'load_path_data_20250321_000033.json',
+]
+
+# Synthetic models of every benchmark topology
+SYNTHETIC_MODELS = {
+    'chain': lambda: generators.chain(40),
+    'tree': lambda: generators.tree(60),
+    'fan_in': lambda: generators.fan_in(40),
+    'turbine': lambda: generators.turbine(120),
+}
+
+
+def model_path(name):
+    """
+    Returns the absolute path of a model file shipped with the repository.
+    """
+    return os.path.join(ROOT, name)
+
+
+@pytest.fixture(params=MODEL_FILES)
+def model_file(request):
+    """
+    Path of each model file shipped with the repository.
+    """
+    return model_path(request.param)
+
+
+@pytest.fixture(params=MODEL_FILES + list(SYNTHETIC_MODELS))
+def graph_data(request):
+    """
+    Graph data of each shipped and synthetic model (a fresh copy per test).
+    """
+    if request.param in SYNTHETIC_MODELS:
+        return SYNTHETIC_MODELS[request.param]()
+    return read_graph(model_path(request.param))
@@ -0,0 +1,57 @@
+"""
+Tests of the binary (.lpg) model format.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+import pytest
+
+from loadpath.graph_binary import is_binary, read_binary, write_binary
+from loadpath.load_contrib import find_all_load_contributors
+from loadpath.load_transfer import compute_edge_loads
+
+
+def test_lpg_roundtrip(tmp_path, graph_data):
+    path = str(tmp_path / 'model.lpg')
+    write_binary(path, graph_data)
+    assert is_binary(path)
+    with read_binary(path) as model:
+        # Numbers are stored as float64, so values compare equal, not their types
+        assert model.to_json() == graph_data
+        assert model.node_ids == [node['data']['id'] for node in graph_data['nodes']]
+        assert model.edge_ids == [edge['data']['id'] for edge in graph_data['edges']]
+
+
+def test_lpg_analysis_matches_json(tmp_path, graph_data):
+    path = str(tmp_path / 'model.lpg')
+    write_binary(path, graph_data)
+    with read_binary(path) as model:
+        contributors = find_all_load_contributors(model)
+        loads = compute_edge_loads(model)
+    assert contributors == find_all_load_contributors(graph_data)
+    expected = compute_edge_loads(graph_data)
+    for edge_id, load in expected.items():
+        assert np.allclose(loads[edge_id]['force'], load['force'])
+        assert np.allclose(loads[edge_id]['moment'], load['moment'])
+
+
+def test_undeclared_endpoints_get_default_rows(tmp_path):
+    graph_data = {'nodes': [{'data': {'id': 'A', 'mass': 5}}],
+                  'edges': [{'data': {'id': 'e0', 'source': 'A', 'target': 'G'}}]}
+    path = str(tmp_path / 'model.lpg')
+    write_binary(path, graph_data)
+    with open(path, 'rb') as f:
+        model = read_binary(f.read())
+    assert (model.n_nodes, model.n_declared, model.n_edges) == (2, 1, 1)
+    assert model.node_ids == ['A', 'G']
+    assert model.mass.tolist() == [5.0, 0.0]
+
+
+def test_other_files_are_rejected(model_file):
+    assert not is_binary(model_file)
+    with open(model_file, 'rb') as f:
+        with pytest.raises(ValueError):
+            read_binary(f.read())
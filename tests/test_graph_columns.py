@@ -0,0 +1,69 @@
+"""
+Tests of the columnar graph model.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+from loadpath.graph_columns import ColumnarGraph
+from loadpath.graph_json import dumps_json
+from loadpath.load_transfer import compute_edge_loads
+
+
+def test_roundtrip_keeps_value_types(graph_data):
+    graph = ColumnarGraph.from_json(graph_data)
+    assert dumps_json(graph.to_json()) == dumps_json(graph_data)
+
+
+def test_integers_read_back_as_integers():
+    graph = ColumnarGraph.from_json({'nodes': [{
+        'data': {'id': 'A', 'name': 'A', 'color': '#2ECC40', 'mass': 54000,
+                 'cog': [5, 0, 0.5], 'external_force': [50000, 0, -20000],
+                 'moment': [0.0, 0, 0], 'euler_angles': [0, 0, 30],
+                 'rotation_order': 'xyz', 'translation': [8, 0, 90]},
+        'position': {'x': 600, 'y': 100.5}}], 'edges': []})
+    data = graph['nodes'][0]['data']
+    assert type(data['mass']) is int and data['mass'] == 54000
+    assert [type(x) for x in data['cog']] == [int, int, float]
+    assert [type(x) for x in data['moment']] == [float, int, int]
+    position = graph['nodes'][0]['position']
+    assert (type(position['x']), type(position['y'])) == (int, float)
+
+
+def test_edits_keep_value_types():
+    graph = ColumnarGraph()
+    graph['nodes'].append({'data': {'id': 'A', 'name': 'A', 'mass': 1.0, 'cog': [1, 2, 3]}})
+    graph['nodes'].append({'data': {'id': 'B', 'name': 'B', 'mass': 2}, 'position': {'x': 1, 'y': 2}})
+    data = graph['nodes'][0]['data']
+    data['mass'] = 7
+    data['cog'] = [1.5, 2, 3]
+    assert graph['nodes'][0]['data'].copy() == {'id': 'A', 'name': 'A', 'mass': 7, 'cog': [1.5, 2, 3]}
+    assert type(graph['nodes'][0]['data']['mass']) is int
+    assert type(graph['nodes'][0]['data']['cog'][0]) is float
+
+    # Property edits keep the position types, position edits keep the data types
+    graph['nodes'][1]['data']['mass'] = 3.5
+    assert graph['nodes'][1]['position'] == {'x': 1, 'y': 2}
+    assert type(graph['nodes'][1]['position']['x']) is int
+    graph['nodes'][1]['position'] = {'x': 1.25, 'y': 2}
+    assert graph['nodes'][1]['data']['mass'] == 3.5
+    assert type(graph['nodes'][1]['position']['y']) is int
+
+    # Deleting a row moves the flags with the values
+    del graph['nodes'][0]
+    assert graph.to_json()['nodes'] == [{'data': {'id': 'B', 'name': 'B', 'mass': 3.5},
+                                         'position': {'x': 1.25, 'y': 2}}]
+
+
+def test_large_integers_are_kept_exactly():
+    big = 2 ** 60 + 1
+    graph = ColumnarGraph.from_json({'nodes': [{'data': {'id': 'A', 'mass': big,
+                                                         'cog': [big, 0, 0]}}], 'edges': []})
+    assert graph['nodes'][0]['data']['mass'] == big
+    assert graph['nodes'][0]['data']['cog'] == [big, 0, 0]
+
+
+def test_analysis_matches_json(graph_data):
+    graph = ColumnarGraph.from_json(graph_data)
+    assert compute_edge_loads(graph) == compute_edge_loads(graph_data)
@@ -0,0 +1,97 @@
+"""
+Tests of the streaming JSON import and the single-pass exporter.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import base64
+import io
+import json
+import re
+
+from loadpath.graph_json import (dumps_json, read_graph, read_graph_base64, read_raw_graph,
+                                 write_json)
+
+
+def baseline_export(data):
+    """
+    Export text as produced by the first release of the application
+    (json.dumps followed by repeated regex compaction of arrays).
+    """
+    json_str = json.dumps(data, indent=2)
+    pattern = r'\[\s*\n\s*([^][]*?)\s*\n\s*\]'
+
+    def compact_array(match):
+        elements = re.split(r',\s*\n\s*', match.group(1))
+        return f"[{', '.join(elem.strip() for elem in elements)}]"
+
+    prev_json = ""
+    while prev_json != json_str:
+        prev_json = json_str
+        json_str = re.sub(pattern, compact_array, json_str, flags=re.DOTALL)
+    return json_str
+
+
+def test_export_is_byte_identical_to_baseline(graph_data):
+    assert dumps_json(graph_data) == baseline_export(graph_data)
+
+
+def test_export_of_nested_values_is_byte_identical():
+    data = {'a': [], 'b': {}, 'c': [[1, 2], [3, [4]]], 'd': [{'x': 1.5}, {'y': None}],
+            'e': ['q"uote', 'ü', 1e-7, 1e22, -0.0, True], 'f': [{}], 'g': [[]]}
+    assert dumps_json(data) == baseline_export(data)
+
+
+def test_write_json_streams_the_same_text(graph_data):
+    file = io.StringIO()
+    write_json(graph_data, file, chunk_size=64)
+    assert file.getvalue() == dumps_json(graph_data)
+
+
+def test_read_graph_normalizes_files(model_file):
+    with open(model_file, encoding='utf-8-sig') as f:
+        document = json.load(f)
+    graph = read_graph(model_file, chunk_size=97)
+    node_ids = {node['data']['id'] for node in graph['nodes']}
+    assert [node['data']['name'] for node in graph['nodes']] == \
+        [node['data']['name'] for node in document['nodes']]
+    assert all(edge['data']['source'] in node_ids and edge['data']['target'] in node_ids
+               for edge in graph['edges'])
+    for node, original in zip(graph['nodes'], document['nodes']):
+        for key, value in original['data'].items():
+            if key != 'id':
+                assert node['data'][key] == value
+        assert node.get('position') == original.get('position')
+
+
+def test_read_raw_graph_keeps_the_file_as_it_is(model_file):
+    with open(model_file, encoding='utf-8-sig') as f:
+        document = json.load(f)
+    graph = read_raw_graph(model_file, chunk_size=97)
+    assert graph == {'nodes': document['nodes'], 'edges': document['edges']}
+
+def test_exported_files_read_back_unchanged(tmp_path, graph_data):
+    path = tmp_path / 'model.json'
+    write_json(graph_data, str(path))
+    assert read_graph(str(path)) == graph_data
+    assert dumps_json(read_graph(str(path))) == dumps_json(graph_data)
+
+
+def test_base64_upload_matches_file(model_file):
+    with open(model_file, 'rb') as f:
+        contents = 'data:application/json;base64,' + base64.b64encode(f.read()).decode()
+    assert read_graph_base64(contents, chunk_size=101) == read_graph(model_file)
+
+
+def test_edges_to_unknown_nodes_are_dropped():
+    contents = json.dumps({
+        'nodes': [{'data': {'id': 'A', 'name': 'A'}}, {'data': {'id': 'B', 'name': 'B'}}],
+        'edges': [{'data': {'id': 'e0', 'source': 'A', 'target': 'B'}},
+                  {'data': {'id': 'e1', 'source': 'A', 'target': 'C'}}],
+    })
+    encoded = 'data:application/json;base64,' + base64.b64encode(contents.encode()).decode()
+    graph = read_graph_base64(encoded)
+    assert [edge['data']['id'] for edge in graph['edges']] == ['e0']
+    assert graph['nodes'][0]['data']['mass'] == 0
@@ -0,0 +1,75 @@
+"""
+Tests of the layered layout and of placing nodes without a position.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+
+from benchmarks import generators
+from loadpath.graph_columns import ColumnarGraph
+from loadpath.graph_layout import (LAYER_SPACING, NODE_SPACING, apply_positions,
+                                   fill_positions, layered_layout)
+from loadpath.graph_view import node_positions
+
+
+def _without_positions(graph_data):
+    for node in graph_data['nodes']:
+        node.pop('position', None)
+    return graph_data
+
+
+def _slots(positions):
+    return {(round(x / NODE_SPACING), round(y / LAYER_SPACING)) for x, y in positions.tolist()}
+
+
+def test_graph_without_positions_takes_the_layered_layout():
+    graph_data = _without_positions(generators.tree(60))
+    assert fill_positions(graph_data) == 60
+    assert np.array_equal(node_positions(graph_data), layered_layout(graph_data))
+
+
+def test_new_nodes_are_placed_next_to_their_neighbours():
+    graph_data = generators.turbine(120)
+    # Stored positions that differ from the layered layout (moved by the user)
+    apply_positions(graph_data, layered_layout(graph_data) * 1.5 + 40)
+    before = node_positions(graph_data).copy()
+    graph_data['nodes'] += [{'data': {'id': 'Top'}}, {'data': {'id': 'Below'}}]
+    node_ids = [node['data']['id'] for node in graph_data['nodes']]
+    graph_data['edges'] += [
+        {'data': {'id': 'x0', 'source': 'Top', 'target': node_ids[5]}},
+        {'data': {'id': 'x1', 'source': node_ids[70], 'target': 'Below'}},
+    ]
+    assert fill_positions(graph_data) == 2
+    positions = node_positions(graph_data)
+    assert np.array_equal(positions[:-2], before)
+    top, below = positions[-2], positions[-1]
+    assert top[1] == before[5, 1] - LAYER_SPACING
+    assert abs(top[0] - before[5, 0]) <= 2 * NODE_SPACING
+    assert below[1] == before[70, 1] + LAYER_SPACING
+    assert len(_slots(positions)) == len(positions)
+
+
+def test_unconnected_groups_go_next_to_the_drawing():
+    graph_data = generators.chain(10)
+    graph_data['nodes'] += [{'data': {'id': 'A'}}, {'data': {'id': 'B'}}]
+    graph_data['edges'].append({'data': {'id': 'x0', 'source': 'A', 'target': 'B'}})
+    fill_positions(graph_data)
+    positions = node_positions(graph_data)
+    assert positions[-2:, 0].min() > positions[:-2, 0].max()
+    assert positions[-1, 1] == positions[:-2, 1].max()
+    assert positions[-2, 1] == positions[-1, 1] - LAYER_SPACING
+
+
+def test_columnar_graphs_keep_their_positions():
+    graph_data = generators.tree(40)
+    graph = ColumnarGraph.from_json(graph_data)
+    before = node_positions(graph).copy()
+    graph['nodes'].append({'data': {'id': 'New'}})
+    graph['edges'].append({'data': {'id': 'x0', 'source': 'New', 'target': 'N3'}})
+    assert fill_positions(graph) == 1
+    positions = node_positions(graph)
+    assert np.array_equal(positions[:-1], before)
+    assert not np.isnan(positions[-1]).any()
@@ -0,0 +1,125 @@
+"""
+Tests of the server-side session store.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import pytest
+
+from loadpath.graph_columns import ColumnarGraph
+from loadpath.graph_store import (GraphStore, SessionNotFoundError, StoreFullError,
+                                  VersionConflictError)
+
+
+def _graph(name):
+    return {'nodes': [{'data': {'id': name, 'name': name, 'mass': 1}}], 'edges': []}
+
+
+def test_evicted_sessions_are_saved_and_loaded_back(tmp_path):
+    store = GraphStore(capacity=2, path=str(tmp_path / 'graphs.sqlite'))
+    handles = [store.create(_graph(f'N{i}')) for i in range(5)]
+    assert len(store._cache) == 2
+
+    for i, handle in enumerate(handles):
+        assert store.get(handle['session']) == _graph(f'N{i}')
+        assert store.version(handle['session']) == handle['version']
+        assert len(store._cache) <= 2
+
+    # A second store on the same database sees every session
+    other = GraphStore(capacity=2, path=str(tmp_path / 'graphs.sqlite'))
+    assert other.get(handles[0]['session']) == _graph('N0')
+
+
+def test_edits_bump_the_version_and_survive_eviction(tmp_path):
+    store = GraphStore(capacity=1, path=str(tmp_path / 'graphs.sqlite'),
+                       graph_factory=ColumnarGraph.from_json)
+    handle = store.create(_graph('A'))
+    with store.session(handle['session'], handle['version']) as graph:
+        graph['nodes'].append({'data': {'id': 'B', 'name': 'B', 'mass': 2}})
+        handle = store.put(handle['session'], graph)
+    assert handle['version'] == 1
+
+    store.create(_graph('C'))  # evicts the edited session
+    assert handle['session'] not in store._cache
+    graph = store.get(handle['session'])
+    assert isinstance(graph, ColumnarGraph)
+    assert [node['data']['id'] for node in graph['nodes']] == ['A', 'B']
+    assert store.version(handle['session']) == 1
+
+
+def test_outdated_versions_are_rejected():
+    store = GraphStore()
+    handle = store.create(_graph('A'))
+    with store.session(handle['session'], handle['version']) as graph:
+        store.put(handle['session'], graph)
+
+    with pytest.raises(VersionConflictError) as error:
+        with store.session(handle['session'], handle['version']):
+            pass
+    assert (error.value.version, error.value.current) == (0, 1)
+
+    # Reads without a version are not checked
+    with store.session(handle['session']) as graph:
+        assert graph == _graph('A')
+
+
+def test_unknown_sessions_are_not_replaced(tmp_path):
+    for store in (GraphStore(), GraphStore(path=str(tmp_path / 'graphs.sqlite'))):
+        with pytest.raises(SessionNotFoundError):
+            store.get('missing')
+        with pytest.raises(SessionNotFoundError):
+            with store.session('missing', 0):
+                pass
+        with pytest.raises(SessionNotFoundError):
+            store.put('missing', _graph('A'))
+
+
+def _edit(store, handle):
+    with store.session(handle['session'], handle['version']) as graph:
+        graph['nodes'].append({'data': {'id': 'X', 'name': 'X'}})
+        return store.put(handle['session'], graph)
+
+
+def test_capacity_is_enforced_without_a_database():
+    store = GraphStore(capacity=2)
+    edited = _edit(store, store.create(_graph('A')))
+    pristine = store.create(_graph('B'))
+
+    # Graphs that were never edited make room first
+    third = store.create(_graph('C'))
+    assert len(store._cache) == 2
+    with pytest.raises(SessionNotFoundError):
+        store.get(pristine['session'])
+
+    # Edited graphs in use are kept and new sessions are refused
+    _edit(store, third)
+    with pytest.raises(StoreFullError):
+        store.create(_graph('D'))
+    assert len(store._cache) == 2
+    assert len(store.get(edited['session'])['nodes']) == 2
+
+
+def test_idle_sessions_are_evicted_without_a_database():
+    store = GraphStore(capacity=2, idle_timeout=0)
+    first = _edit(store, store.create(_graph('A')))
+    second = _edit(store, store.create(_graph('B')))
+    store.get(first['session'])  # now the most recently used
+
+    store.create(_graph('C'))
+    assert len(store._cache) == 2
+    assert store.version(first['session']) == 1
+    with pytest.raises(SessionNotFoundError):
+        store.get(second['session'])
+
+
+def test_sessions_with_a_request_in_progress_are_kept():
+    store = GraphStore(capacity=1)
+    handle = store.create(_graph('A'))
+    with store.session(handle['session'], handle['version']):
+        with pytest.raises(StoreFullError):
+            store.create(_graph('B'))
+    store.create(_graph('B'))
+    with pytest.raises(SessionNotFoundError):
+        store.get(handle['session'])
@@ -0,0 +1,56 @@
+"""
+Tests of the content keys and the result cache.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+from benchmarks import generators
+from loadpath import load_cache
+from loadpath.graph_columns import ColumnarGraph
+from loadpath.load_cache import AnalysisCache
+from loadpath.load_graph import LoadPathGraph
+from loadpath.load_transfer import GRAVITY
+
+
+def test_keys_do_not_depend_on_the_representation(graph_data):
+    cache = AnalysisCache()
+    key = cache.loads_key(graph_data, GRAVITY)
+    assert cache.loads_key(ColumnarGraph.from_json(graph_data), GRAVITY) == key
+    assert cache.loads_key(LoadPathGraph.from_json(graph_data), GRAVITY) == key
+
+
+def test_positions_do_not_change_keys():
+    graph_data = generators.tree(30)
+    key = AnalysisCache().loads_key(graph_data, GRAVITY)
+    graph_data['nodes'][3]['position'] = {'x': -5, 'y': 7}
+    assert AnalysisCache().loads_key(graph_data, GRAVITY) == key
+
+
+def test_keys_are_hashed_once_per_version(monkeypatch):
+    calls = []
+    topology_key = load_cache.topology_key
+    monkeypatch.setattr(load_cache, 'topology_key',
+                        lambda graph: calls.append(1) or topology_key(graph))
+    cache = AnalysisCache(capacity=2)
+    graph = ColumnarGraph.from_json(generators.chain(20))
+    key = cache.topology_key(graph, version=('s', 1))
+    assert cache.topology_key(graph, version=('s', 1)) == key
+    assert len(calls) == 1
+
+    # An edit in place comes with a new version
+    graph['edges'].pop()
+    assert cache.topology_key(graph, version=('s', 2)) != key
+    assert len(calls) == 2
+
+    # Without a version, graph data is hashed on every call
+    cache.topology_key(graph)
+    cache.topology_key(graph)
+    assert len(calls) == 4
+
+    # Least recently used versions are forgotten beyond the capacity
+    cache.topology_key(graph, version=('t', 1))
+    cache.topology_key(graph, version=('s', 2))
+    cache.topology_key(graph, version=('s', 1))
+    assert len(calls) == 6
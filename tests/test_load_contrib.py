@@ -0,0 +1,104 @@
+"""
+Tests of the contributor analysis against the original recursive upstream trace.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import json
+import random
+
+from loadpath.load_contrib import find_all_load_contributors, find_load_contributors
+from loadpath.load_graph import LoadPathGraph
+from loadpath.load_report import model_report
+
+
+def baseline_contributors(json_data, selected_edge_id):
+    """
+    Contributors of an edge as traced by the first release of load_contrib.py
+    (scans every edge per visited node; only meant for small acyclic models).
+    """
+    selected_edge = next(e["data"] for e in json_data["edges"]
+                         if e["data"]["id"] == selected_edge_id)
+    contributors = set()
+
+    def trace_upstream(node):
+        contributors.add(node)
+        for e in json_data["edges"]:
+            if e["data"]["target"] == node:
+                trace_upstream(e["data"]["source"])
+
+    trace_upstream(selected_edge["source"])
+    return contributors
+
+
+def test_contributors_match_baseline_trace(graph_data):
+    graph = LoadPathGraph.from_json(graph_data)
+    everything = find_all_load_contributors(graph)
+    for edge in graph_data['edges']:
+        edge_id = edge['data']['id']
+        expected = baseline_contributors(graph_data, edge_id)
+        result = find_load_contributors(graph_data, edge_id)
+        assert set(result['contributors']) == expected
+        assert len(result['contributors']) == len(expected)
+        assert set(everything['contributors'][edge_id]) == expected
+
+
+def test_grounded_node_is_reached_by_the_edge():
+    graph_data = {
+        'nodes': [{'data': {'id': node_id}} for node_id in ('G1', 'G2', 'A', 'B')],
+        'edges': [{'data': {'id': 'e0', 'source': 'A', 'target': 'G1'}},
+                  {'data': {'id': 'e1', 'source': 'B', 'target': 'G2'}}],
+    }
+    assert find_load_contributors(graph_data, 'e0')['grounded_node'] == 'G1'
+    assert find_load_contributors(graph_data, 'e1')['grounded_node'] == 'G2'
+    assert find_load_contributors(graph_data, 'e0')['grounded_nodes'] == ['G1', 'G2']
+
+
+def test_nearest_grounded_nodes_match_downstream_trace():
+    # Random graphs with several grounds, shortcuts and loops
+    rng = random.Random(3)
+    for _ in range(20):
+        node_ids = [f'N{i}' for i in range(30)]
+        edges = [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(40)]
+        graph_data = {
+            'nodes': [{'data': {'id': node_id}} for node_id in node_ids],
+            'edges': [{'data': {'id': f'e{i}', 'source': source, 'target': target}}
+                      for i, (source, target) in enumerate(edges)],
+        }
+        nearest = LoadPathGraph(graph_data).nearest_grounded_nodes()
+        for i in range(len(edges)):
+            expected = find_load_contributors(graph_data, f'e{i}')['grounded_node']
+            assert nearest.get(edges[i][1]) == expected
+
+
+def test_report_gives_each_edge_its_own_ground(tmp_path):
+    path = tmp_path / 'grounds.json'
+    path.write_text(json.dumps({
+        'nodes': [{'data': {'id': node_id}} for node_id in ('G1', 'G2', 'A', 'B')],
+        'edges': [{'data': {'id': 'e0', 'source': 'A', 'target': 'G1'}},
+                  {'data': {'id': 'e1', 'source': 'B', 'target': 'G2'}}],
+    }))
+    _, records, _ = model_report(str(path), report='all')
+    assert [record['grounded_node'] for record in records] == ['G1', 'G2']
+    _, records, _ = model_report(str(path), edge_ids=['e1'])
+    assert records[0]['grounded_node'] == 'G2'
+
+
+def test_loop_members_share_contributors():
+    graph_data = {
+        'nodes': [{'data': {'id': node_id}} for node_id in ('G', 'A', 'B', 'C')],
+        'edges': [{'data': {'id': 'e0', 'source': 'A', 'target': 'B'}},
+                  {'data': {'id': 'e1', 'source': 'B', 'target': 'A'}},
+                  {'data': {'id': 'e2', 'source': 'C', 'target': 'A'}},
+                  {'data': {'id': 'e3', 'source': 'B', 'target': 'G'}}],
+    }
+    result = find_all_load_contributors(graph_data)
+    for edge_id in ('e0', 'e1', 'e3'):
+        assert set(result['contributors'][edge_id]) == {'A', 'B', 'C'}
+    assert result['contributors']['e2'] == ['C']
+
+
+def test_unknown_edge_returns_none(graph_data):
+    assert find_load_contributors(graph_data, 'no such edge') is None
@@ -0,0 +1,128 @@
+"""
+Tests of the incremental analysis against a full recompute after every edit.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import copy
+
+import numpy as np
+
+from benchmarks import generators
+from loadpath.graph_hierarchy import SubassemblyLoads
+from loadpath.load_contrib import find_all_load_contributors
+from loadpath.load_incremental import IncrementalLoadAnalysis
+from loadpath.load_transfer import compute_edge_loads
+
+
+def assert_matches_full_recompute(analysis, graph_data):
+    contributors = find_all_load_contributors(graph_data)['contributors']
+    loads = compute_edge_loads(graph_data)
+    assert set(analysis.edges) == set(contributors)
+    for edge_id, expected in contributors.items():
+        assert sorted(analysis.contributors(edge_id)) == sorted(expected)
+        load = analysis.edge_load(edge_id)
+        assert np.allclose(load['force'], loads[edge_id]['force'])
+        assert np.allclose(load['moment'], loads[edge_id]['moment'])
+
+
+def _edge(edge_id, source, target):
+    return {'data': {'id': edge_id, 'source': source, 'target': target}}
+
+
+def test_initial_state_matches(graph_data):
+    assert_matches_full_recompute(IncrementalLoadAnalysis(graph_data), graph_data)
+
+
+def test_edits_match_full_recompute():
+    graph_data = generators.turbine(150)
+    analysis = IncrementalLoadAnalysis(copy.deepcopy(graph_data))
+    nodes = {node['data']['id']: node for node in graph_data['nodes']}
+    node_ids = list(nodes)
+
+    # Shared upstream: a second path from a blade tip into the tower
+    analysis.add_edge('x0', node_ids[-1], node_ids[3])
+    graph_data['edges'].append(_edge('x0', node_ids[-1], node_ids[3]))
+    assert_matches_full_recompute(analysis, graph_data)
+
+    # Property edit of a node with a long downstream path
+    data = dict(nodes[node_ids[-2]]['data'], mass=1234.5, euler_angles=[10, 20, 30])
+    nodes[node_ids[-2]]['data'] = data
+    analysis.update_node(node_ids[-2], data)
+    assert_matches_full_recompute(analysis, graph_data)
+
+    # A loop between two tower sections
+    analysis.add_edge('x1', node_ids[1], node_ids[2])
+    graph_data['edges'].append(_edge('x1', node_ids[1], node_ids[2]))
+    assert_matches_full_recompute(analysis, graph_data)
+
+    # Removing a connection and a node with all its connections
+    removed = graph_data['edges'].pop(5)['data']['id']
+    analysis.remove_edge(removed)
+    assert_matches_full_recompute(analysis, graph_data)
+
+    victim = node_ids[10]
+    analysis.remove_node(victim)
+    graph_data['nodes'] = [node for node in graph_data['nodes'] if node['data']['id'] != victim]
+    graph_data['edges'] = [edge for edge in graph_data['edges']
+                           if victim not in (edge['data']['source'], edge['data']['target'])]
+    assert_matches_full_recompute(analysis, graph_data)
+
+    # A new node reuses the freed slot
+    analysis.add_node('New', {'mass': 7, 'translation': [1, 2, 3]})
+    analysis.add_edge('x2', 'New', node_ids[0])
+    graph_data['nodes'].append({'data': {'id': 'New', 'mass': 7, 'translation': [1, 2, 3]}})
+    graph_data['edges'].append(_edge('x2', 'New', node_ids[0]))
+    assert_matches_full_recompute(analysis, graph_data)
+
+
+def test_sync_applies_whole_graph_changes():
+    graph_data = generators.tree(80)
+    analysis = IncrementalLoadAnalysis(copy.deepcopy(graph_data))
+    edited = copy.deepcopy(graph_data)
+    edited['edges'] = edited['edges'][10:]
+    edited['nodes'][5]['data']['mass'] = 99.0
+    edited['edges'].append(_edge('y0', 'N70', 'N1'))
+    analysis.sync(edited)
+    assert_matches_full_recompute(analysis, edited)
+
+
+def test_rename_keeps_loads():
+    graph_data = generators.chain(30)
+    analysis = IncrementalLoadAnalysis(copy.deepcopy(graph_data))
+    analysis.rename_node('N12', 'Renamed')
+    for node in graph_data['nodes']:
+        if node['data']['id'] == 'N12':
+            node['data']['id'] = node['data']['name'] = 'Renamed'
+    for edge in graph_data['edges']:
+        for end in ('source', 'target'):
+            if edge['data'][end] == 'N12':
+                edge['data'][end] = 'Renamed'
+    assert_matches_full_recompute(analysis, graph_data)
+
+
+def test_back_edge_on_deep_chain():
+    graph_data = generators.chain(2000)
+    analysis = IncrementalLoadAnalysis(copy.deepcopy(graph_data))
+    # Closes a loop over 1500 nodes, then opens it again
+    analysis.add_edge('back', 'N5', 'N1500')
+    graph_data['edges'].append(_edge('back', 'N5', 'N1500'))
+    assert_matches_full_recompute(analysis, graph_data)
+    analysis.remove_edge('back')
+    graph_data['edges'].pop()
+    assert_matches_full_recompute(analysis, graph_data)
+
+
+def test_subassembly_matches_subassembly_loads(graph_data):
+    analysis = IncrementalLoadAnalysis(graph_data)
+    expected = SubassemblyLoads(graph_data)
+    for node in graph_data['nodes']:
+        node_id = node['data']['id']
+        summary, reference = analysis.subassembly(node_id), expected.summary(node_id)
+        assert summary['nodes'] == reference['nodes']
+        assert np.isclose(summary['mass'], reference['mass'])
+        assert np.allclose(summary['force'], reference['force'])
+        assert np.allclose(summary['moment'], reference['moment'])
+    assert analysis.subassembly('missing') is None
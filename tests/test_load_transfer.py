@@ -0,0 +1,136 @@
+"""
+Tests of the load transfer engine against hand calculations and a per-edge sum.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks import generators
+from loadpath.load_contrib import find_load_contributors
+from loadpath.load_transfer import LoadTransferModel, UpstreamReducer, compute_edge_loads
+
+
+def _node(node_id, **data):
+    return {'data': {'id': node_id, 'name': node_id, **data}}
+
+
+def _edge(edge_id, source, target):
+    return {'data': {'id': edge_id, 'source': source, 'target': target}}
+
+
+# B -> A -> G with
+# - A: 10 kg at (2, 0, 0) with a local moment of 50 N m about z
+# - B: massless at (0, 0, 3), rotated 90 deg about z, local force of 100 N along x
+HAND_MODEL = {
+    'nodes': [
+        _node('G'),
+        _node('A', mass=10, moment=[0, 0, 50], translation=[2, 0, 0]),
+        _node('B', external_force=[100, 0, 0], euler_angles=[0, 0, 90],
+              rotation_order='xyz', translation=[0, 0, 3]),
+    ],
+    'edges': [_edge('e0', 'A', 'G'), _edge('e1', 'B', 'A')],
+}
+
+
+def test_loads_match_hand_calculation():
+    loads = compute_edge_loads(HAND_MODEL)
+
+    # e1 carries B only: F = Rz(90) (100, 0, 0) = (0, 100, 0), applied at (0, 0, 3)
+    # M about A = (0, 0, 3) x F - (2, 0, 0) x F = (-300, 0, 0) - (0, 0, 200)
+    assert loads['e1']['force'] == pytest.approx([0, 100, 0], abs=1e-9)
+    assert loads['e1']['moment'] == pytest.approx([-300, 0, -200], abs=1e-9)
+
+    # e0 carries A and B: F = (0, 100, 0) + (0, 0, -98.1)
+    # M about G = (2, 0, 0) x (0, 0, -98.1) + (0, 0, 50) + (0, 0, 3) x (0, 100, 0)
+    assert loads['e0']['force'] == pytest.approx([0, 100, -98.1], abs=1e-9)
+    assert loads['e0']['moment'] == pytest.approx([-300, 196.2, 50], abs=1e-9)
+
+
+def brute_force_loads(graph_data):
+    """
+    Sums node loads over each edge's contributors, one edge at a time.
+    """
+    model = LoadTransferModel(graph_data)
+    forces, moments = model.node_loads()
+    row = {node_id: i for i, node_id in enumerate(model.node_ids)}
+    loads = {}
+    for edge in graph_data['edges']:
+        edge_id = edge['data']['id']
+        rows = [row[n] for n in find_load_contributors(graph_data, edge_id)['contributors']]
+        force = forces[rows].sum(axis=0)
+        reference = model.translation[row[edge['data']['target']]]
+        loads[edge_id] = (force, moments[rows].sum(axis=0) - np.cross(reference, force))
+    return loads
+
+
+def test_loads_match_per_edge_sums(graph_data):
+    loads = compute_edge_loads(graph_data)
+    for edge_id, (force, moment) in brute_force_loads(graph_data).items():
+        assert np.allclose(loads[edge_id]['force'], force)
+        assert np.allclose(loads[edge_id]['moment'], moment)
+
+
+def test_shared_upstream_loads_match_per_edge_sums(graph_data):
+    # Extra connections make load paths share upstream nodes (not a forest)
+    node_ids = [node['data']['id'] for node in graph_data['nodes']]
+    for i in range(2, len(node_ids), 7):
+        graph_data['edges'].append(_edge(f'extra{i}', node_ids[i], node_ids[i // 2]))
+    model = LoadTransferModel(graph_data)
+    forces, moments = model.edge_loads()
+    expected = brute_force_loads(graph_data)
+    for i, edge_id in enumerate(model.edge_ids):
+        assert np.allclose(forces[i], expected[edge_id][0])
+        assert np.allclose(moments[i], expected[edge_id][1])
+
+
+def _brute_force_reduce(graph_data, values):
+    """
+    Sums per-node values over each edge's contributors, one edge at a time.
+    """
+    model = LoadTransferModel(graph_data)
+    row = {node_id: i for i, node_id in enumerate(model.node_ids)}
+    return np.array([values[[row[n] for n in find_load_contributors(
+        graph_data, edge['data']['id'])['contributors']]].sum(axis=0)
+        for edge in graph_data['edges']])
+
+
+@pytest.mark.parametrize('first', [False, True])
+def test_extra_connection_on_a_forest_adds_no_quadratic_work(first):
+    # A second load path from the hub straight into the tower (review case)
+    graph_data = generators.turbine(400)
+    extra = _edge('extra', 'Hub', 'Tower Section 1')
+    if first:
+        graph_data['edges'].insert(0, extra)
+    else:
+        graph_data['edges'].append(extra)
+    model = LoadTransferModel(graph_data)
+    reducer = model.reducer
+    assert not reducer.is_forest
+    assert len(reducer.run_start) <= 2 * len(graph_data['edges'])
+
+    values = np.random.default_rng(1).normal(size=(len(model.node_ids), 4))
+    assert np.allclose(reducer.reduce(values), _brute_force_reduce(graph_data, values))
+
+
+def test_random_dag_matches_brute_force():
+    rng = np.random.default_rng(7)
+    n = 60
+    graph_data = {'nodes': [_node(f'N{i}', mass=float(i)) for i in range(n)], 'edges': []}
+    for i in range(1, n):
+        for j in rng.choice(i, size=min(i, 3), replace=False):
+            graph_data['edges'].append(_edge(f'e{len(graph_data["edges"])}', f'N{i}', f'N{j}'))
+    # And a loop
+    graph_data['edges'].append(_edge('loop', 'N3', 'N40'))
+
+    model = LoadTransferModel(graph_data)
+    values = rng.normal(size=(2, len(model.node_ids), 3))
+    expected = np.stack([_brute_force_reduce(graph_data, v) for v in values])
+    assert np.allclose(model.reducer.reduce(values), expected)
+
+    rebuilt = UpstreamReducer.from_arrays(model.reducer.arrays())
+    assert not rebuilt.is_forest
+    assert np.allclose(rebuilt.reduce(values), expected)
@@ -0,0 +1,67 @@
+"""
+Tests of server-side table paging, filtering and sorting.
+
+Author: Pramod Kumar Yadav
+Email: pkyadav01234@gmail.com
+Date: October, 2026
+"""
+
+import pytest
+
+from loadpath.table_query import parse_filter, table_page
+
+ROWS = [{'id': f'N{i}', 'name': f'Tower {i}' if i % 3 else f'Blade {i}', 'mass': float(i % 10)}
+        for i in range(120)]
+
+
+def _page(**query):
+    built = []
+
+    def row(i):
+        built.append(i)
+        return ROWS[i]
+
+    return table_page(len(ROWS), row, **query), built
+
+
+def test_unfiltered_pages_build_only_their_rows():
+    (rows, page_count, page), built = _page(page_current=1, page_size=50)
+    assert rows == ROWS[50:100]
+    assert (page_count, page) == (3, 1)
+    assert built == list(range(50, 100))
+
+    (rows, page_count, page), _ = _page(page_current=2, page_size=50)
+    assert rows == ROWS[100:]
+
+
+def test_page_is_clamped_to_the_last_page():
+    (rows, page_count, page), _ = _page(page_current=9, page_size=50)
+    assert (page_count, page) == (3, 2)
+    assert rows == ROWS[100:]
+    assert table_page(0, None, page_current=4, page_size=50) == ([], 1, 0)
+
+
+def test_filter_and_sort_are_applied_before_paging():
+    query = dict(page_current=0, page_size=5, filter_query='{name} contains "Blade" && {mass} >= 5',
+                 sort_by=[{'column_id': 'mass', 'direction': 'desc'}])
+    (rows, page_count, page), _ = _page(**query)
+    expected = sorted((r for r in ROWS if 'Blade' in r['name'] and r['mass'] >= 5),
+                      key=lambda r: r['mass'], reverse=True)
+    assert rows == expected[:5]
+    assert page_count == (len(expected) + 4) // 5
+
+
+def test_sort_by_several_columns_is_stable():
+    sort_by = [{'column_id': 'mass', 'direction': 'asc'}, {'column_id': 'id', 'direction': 'desc'}]
+    (rows, _, _), _ = _page(page_size=200, sort_by=sort_by)
+    assert [r['mass'] for r in rows] == sorted(r['mass'] for r in ROWS)
+    same_mass = [r['id'] for r in rows if r['mass'] == 0.0]
+    assert same_mass == sorted(same_mass, reverse=True)
+
+
+def test_parse_filter():
+    assert parse_filter('{mass} > 5 && {name} icontains tower') == [
+        ('mass', '>', 5.0, True), ('name', 'contains', 'tower', False)]
+    assert parse_filter('') == []
+    with pytest.raises(ValueError):
+        parse_filter('mass > 5')